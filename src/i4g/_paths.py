@@ -0,0 +1,15 @@
+"""Repository path anchors shared by CLI modules.
+
+``PROJECT_ROOT`` is derived from this module's location once at import. The import system already gives an absolute
+``__file__``, so ``os.path.abspath`` avoids the per-component ``stat``/``readlink`` calls of ``Path.resolve()``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+# src/i4g/_paths.py -> src/i4g -> src -> repo root
+PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+__all__ = ["PROJECT_ROOT"]
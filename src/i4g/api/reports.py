@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 
 from i4g.observability import Observability, get_observability
 from i4g.reports.dossier_signatures import verify_manifest_payload
 from i4g.reports.dossier_uploads import DossierUploader
 from i4g.services.factories import build_dossier_queue_store
 from i4g.settings import get_settings
+from i4g.store.dossier_queue_store import DossierQueueStore
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 ARTIFACTS_DIR = (get_settings().data_dir / "reports" / "dossiers").resolve()
@@ -40,7 +44,7 @@ def list_dossiers(
     status_filter = None if not normalized_status or normalized_status == "all" else normalized_status
     tags = {"status": status_filter or "all"}
     try:
-        store = build_dossier_queue_store()
+        store = _queue_store()
         entries = store.list_plans(status=status_filter, limit=limit)
         records: List[Dict[str, Any]] = []
         for entry in entries:
@@ -70,7 +74,7 @@ def list_dossiers(
 
 
 @router.post("/dossiers/{plan_id}/verify")
-def verify_dossier(plan_id: str) -> Dict[str, Any]:
+def verify_dossier(plan_id: str) -> ORJSONResponse:
     """Run an artifact verification pass for the provided dossier plan."""
 
     tags = {"plan_id": plan_id}
@@ -103,27 +107,18 @@ def verify_dossier(plan_id: str) -> Dict[str, Any]:
         mismatch=report.mismatch_count,
     )
 
-    return {
-        "plan_id": plan_id,
-        "algorithm": report.algorithm,
-        "warnings": list(report.warnings),
-        "missing_count": report.missing_count,
-        "mismatch_count": report.mismatch_count,
-        "all_verified": report.all_verified,
-        "artifacts": [
-            {
-                "label": artifact.label,
-                "path": str(artifact.path) if artifact.path else None,
-                "expected_hash": artifact.expected_hash,
-                "actual_hash": artifact.actual_hash,
-                "exists": artifact.exists,
-                "matches": artifact.matches,
-                "size_bytes": artifact.size_bytes,
-                "error": artifact.error,
-            }
-            for artifact in report.artifacts
-        ],
-    }
+    return _VerifyResponse(
+        {
+            "plan_id": plan_id,
+            "algorithm": report.algorithm,
+            "warnings": list(report.warnings),
+            "missing_count": report.missing_count,
+            "mismatch_count": report.mismatch_count,
+            "all_verified": report.all_verified,
+            # ArtifactVerification is a dataclass, so orjson serializes each entry natively.
+            "artifacts": list(report.artifacts),
+        }
+    )
 
 
 @router.get("/dossiers/{plan_id}/drive_acl")
@@ -179,15 +174,12 @@ def download_dossier_artifact(plan_id: str, artifact: str) -> FileResponse:
     if normalized not in _ALLOWED_ARTIFACTS:
         raise HTTPException(status_code=400, detail=f"Unsupported artifact '{artifact}'")
 
-    manifest_info = _load_manifest_details(plan_id, include_manifest=False)
-    local_downloads = manifest_info.get("downloads", {}).get("local", {})
     key = _ALLOWED_ARTIFACTS[normalized]
-    path_str = local_downloads.get(key)
-    if not path_str:
+    path = _resolve_local_artifact(plan_id, key)
+    if path is None:
         raise HTTPException(status_code=404, detail=f"Artifact '{artifact}' not available for plan {plan_id}")
 
-    path = Path(path_str)
-    if not path.exists() or not path.is_file():
+    if not path.is_file():
         raise HTTPException(status_code=404, detail=f"Artifact path missing for plan {plan_id}: {path}")
     try:
         _OBS.increment("reports.dossiers.download", tags={"artifact": key})
@@ -197,6 +189,30 @@ def download_dossier_artifact(plan_id: str, artifact: str) -> FileResponse:
     return FileResponse(path)
 
 
+@lru_cache(maxsize=1)
+def _queue_store() -> DossierQueueStore:
+    """Return the process-wide dossier queue store (connections are opened per call by the store)."""
+
+    return build_dossier_queue_store()
+
+
+class _VerifyResponse(ORJSONResponse):
+    """ORJSON response that serializes verification dataclasses and ``Path`` values."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS,
+        )
+
+
+def _orjson_default(value: Any) -> Any:
+    if isinstance(value, Path):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
 def _load_manifest_details(plan_id: str, *, include_manifest: bool) -> Dict[str, Any]:
     """Return manifest + signature metadata for ``plan_id``."""
 
@@ -240,24 +256,57 @@ def _load_manifest_details(plan_id: str, *, include_manifest: bool) -> Dict[str,
     }
 
 
-def _load_signature_manifest(
-    manifest_path: Path, manifest_preview: Dict[str, Any] | None
-) -> tuple[Dict[str, Any] | None, str | None]:
-    """Load the signature manifest referenced by ``manifest_preview`` (if any)."""
+def _resolve_local_artifact(plan_id: str, key: str) -> Path | None:
+    """Return the local path for a single dossier artifact without building the full download graph.
+
+    Follows the same rules as the ``downloads.local`` entries from :func:`_load_manifest_details`: an unreadable
+    manifest falls back to the default signature manifest sibling, and a signature manifest is only exposed when it
+    parses.
+    """
+
+    manifest_path = ARTIFACTS_DIR / f"{plan_id}.json"
+    if key == "manifest":
+        return manifest_path if manifest_path.exists() else None
+
+    manifest_preview: Dict[str, Any] | None = None
+    if manifest_path.exists():
+        try:
+            manifest_preview = json.loads(manifest_path.read_text())
+        except json.JSONDecodeError:
+            manifest_preview = None
+    if key == "signature_manifest":
+        signature_manifest, signature_path = _load_signature_manifest(manifest_path, manifest_preview)
+        return Path(signature_path) if signature_manifest is not None and signature_path else None
+
+    if manifest_preview is None:
+        return None
+    if key == "markdown":
+        raw_path = (manifest_preview.get("template_render") or {}).get("path")
+    else:
+        raw_path = (manifest_preview.get("exports") or {}).get(f"{key}_path")
+    resolved = _resolve_relative(raw_path, manifest_path.parent)
+    return Path(resolved) if resolved else None
+
+
+def _signature_manifest_path(manifest_path: Path, manifest_preview: Dict[str, Any] | None) -> Path:
+    """Return the signature manifest location referenced by ``manifest_preview`` (or the default sibling)."""
 
-    signature_path: Path | None = None
     if manifest_preview:
         signature_info = manifest_preview.get("signature_manifest") or {}
         raw_path = signature_info.get("path")
         if raw_path:
             candidate = Path(raw_path)
-            signature_path = candidate if candidate.is_absolute() else manifest_path.parent / candidate
-    if not signature_path:
-        signature_path = manifest_path.with_suffix(".signatures.json")
+            return candidate if candidate.is_absolute() else manifest_path.parent / candidate
+    return manifest_path.with_suffix(".signatures.json")
+
+
+def _load_signature_manifest(
+    manifest_path: Path, manifest_preview: Dict[str, Any] | None
+) -> tuple[Dict[str, Any] | None, str | None]:
+    """Load the signature manifest referenced by ``manifest_preview`` (if any)."""
 
-    signature_path_str = str(signature_path) if signature_path else None
-    if not signature_path:
-        return None, None
+    signature_path = _signature_manifest_path(manifest_path, manifest_preview)
+    signature_path_str = str(signature_path)
     if not signature_path.exists():
         return None, signature_path_str
     try:
@@ -319,10 +368,11 @@ def _build_downloads(
 def _resolve_relative(raw_path: object, base_dir: Path) -> str | None:
     if not raw_path:
         return None
-    candidate = Path(str(raw_path))
-    if not candidate.is_absolute():
-        candidate = (base_dir / candidate).resolve()
-    return str(candidate)
+    candidate = str(raw_path)
+    if os.path.isabs(candidate):
+        return candidate
+    # base_dir derives from the already-resolved ARTIFACTS_DIR, so a lexical join avoids a realpath walk.
+    return os.path.normpath(os.path.join(base_dir, candidate))
 
 
 __all__ = ["router"]
@@ -2,18 +2,94 @@
 
 from __future__ import annotations
 
+import importlib
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Optional
+from types import ModuleType
+from typing import Annotated, Optional
 
 import typer
 
-from i4g.cli.admin import dossiers, pilot, saved_searches
-from i4g.settings import get_settings
+from i4g.cli.options import DataStoreId, DiscoveryProject, ServingConfigId
+
+# Helper submodules pull in the review store, report builders, and pilot seeding; resolve them on first access
+# (PEP 562) so `i4g admin --help` and unrelated subcommands skip those import chains.
+_LAZY_SUBMODULES = ("dossiers", "helpers", "pilot", "saved_searches")
 
 admin_app = typer.Typer(help="Saved search and dossier administration.")
 
 
+def __getattr__(name: str) -> ModuleType:
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_SUBMODULES))
+
+
+@dataclass(frozen=True, slots=True)
+class RagQueryArgs:
+    """Inputs for ``search.logic.run_query``."""
+
+    question: str
+    backend: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class BuildDossiersArgs:
+    """Inputs for ``dossiers.build_dossiers``."""
+
+    limit: int
+    min_loss: Optional[Decimal]
+    recency_days: Optional[int]
+    max_cases: Optional[int]
+    jurisdiction_mode: str
+    cross_border_only: bool
+    dry_run: bool
+    preview: int
+
+
+@dataclass(frozen=True, slots=True)
+class ProcessDossiersArgs:
+    """Inputs for ``dossiers.process_dossiers``."""
+
+    batch_size: int
+    preview: int
+    dry_run: bool
+    task_id: Optional[str]
+    task_status_url: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class PilotDossiersArgs:
+    """Inputs for ``pilot.schedule_pilot_dossiers``."""
+
+    cases_file: Path
+    cases: Optional[list[str]]
+    case_count: Optional[int]
+    seed_only: bool
+    min_loss: Optional[Decimal]
+    recency_days: Optional[int]
+    max_cases: Optional[int]
+    jurisdiction_mode: str
+    cross_border_only: bool
+    dry_run: bool
+
+
+def _parse_decimal(value: str) -> Decimal:
+    """Parse a CLI amount straight into ``Decimal`` so it never passes through ``float``."""
+
+    try:
+        return Decimal(value)
+    except InvalidOperation as exc:
+        raise typer.BadParameter(f"{value!r} is not a valid amount.") from exc
+
+
 @admin_app.command("query", help="Run scam-detection RAG query using the configured vector backend.")
 def admin_query(
     question: str = typer.Option(..., "--question", "-q", help="Free-text question to analyze."),
@@ -27,34 +103,35 @@ def admin_query(
     """Run scam-detection query via local RAG helper."""
 
     from i4g.cli.search import logic as search_logic
+    from i4g.settings import get_settings
 
     settings = get_settings()
-    search_logic.run_query(SimpleNamespace(question=question, backend=backend or settings.vector.backend))
+    search_logic.run_query(RagQueryArgs(question=question, backend=backend or settings.vector.backend))
 
 
 @admin_app.command("vertex-search", help="Query Vertex AI Search (Discovery) data store.")
 def admin_vertex_search(
-    query: str = typer.Argument(..., help="Free-text query string to execute."),
-    project: Optional[str] = typer.Option(None, "--project", help="GCP project hosting the Discovery data store."),
-    location: Optional[str] = typer.Option(None, "--location", help="Discovery location (default: global)."),
-    data_store_id: str = typer.Option(..., "--data-store-id", help="Discovery data store identifier."),
-    serving_config_id: str = typer.Option(
-        "default_search",
-        "--serving-config-id",
-        help="Serving config identifier (default: default_search).",
-    ),
-    page_size: int = typer.Option(5, "--page-size", help="Maximum number of results to return."),
-    filter_expression: Optional[str] = typer.Option(None, "--filter", help="Discovery filter expression."),
-    boost_json: Optional[str] = typer.Option(None, "--boost-json", help="Optional BoostSpec payload as JSON."),
-    raw: bool = typer.Option(False, "--raw", help="Print raw JSON response instead of a formatted summary."),
+    query: Annotated[str, typer.Argument(help="Free-text query string to execute.")],
+    project: DiscoveryProject = None,
+    location: Annotated[Optional[str], typer.Option("--location", help="Discovery location (default: global).")] = None,
+    data_store_id: DataStoreId = ...,
+    serving_config_id: ServingConfigId = "default_search",
+    page_size: Annotated[int, typer.Option("--page-size", help="Maximum number of results to return.")] = 5,
+    filter_expression: Annotated[Optional[str], typer.Option("--filter", help="Discovery filter expression.")] = None,
+    boost_json: Annotated[
+        Optional[str], typer.Option("--boost-json", help="Optional BoostSpec payload as JSON.")
+    ] = None,
+    raw: Annotated[bool, typer.Option("--raw", help="Print raw JSON response instead of a formatted summary.")] = False,
 ) -> None:
     """Run Vertex Search helper."""
 
+    from i4g.cli.search import VertexQueryArgs
     from i4g.cli.search import logic as search_logic
+    from i4g.settings import get_settings
 
     settings = get_settings()
     search_logic.run_vertex_search(
-        SimpleNamespace(
+        VertexQueryArgs(
             query=query,
             project=project or settings.vector.vertex_ai_project,
             location=location or settings.vector.vertex_ai_location or "global",
@@ -64,6 +141,7 @@ def admin_vertex_search(
             filter_expression=filter_expression,
             boost_json=boost_json,
             raw=raw,
+            verbose=False,
         )
     )
 
@@ -85,19 +163,26 @@ def admin_export_saved_searches(
         "--schema-version",
         help="Optional schema version to inject into exported search params.",
     ),
+    export_format: str = typer.Option(
+        "json",
+        "--format",
+        help="Output format: json (default) or arrow (Feather/zstd; requires pyarrow and --output).",
+    ),
 ) -> None:
     """Proxy to saved-search export helper while keeping Typer UX."""
 
+    from i4g.cli.admin import saved_searches
+    from i4g.settings import get_settings
+
     saved_searches.export_saved_searches(
-        SimpleNamespace(
-            limit=limit,
-            all=include_all,
-            owner=owner,
-            output=str(output) if output else None,
-            split=split,
-            include_tags=include_tags,
-            schema_version=schema_version or (get_settings().search.saved_search.schema_version),
-        )
+        limit=limit,
+        include_all=include_all,
+        owner=owner,
+        output=output,
+        split=split,
+        include_tags=include_tags,
+        schema_version=schema_version or (get_settings().search.saved_search.schema_version),
+        export_format=export_format,
     )
 
 
@@ -111,16 +196,22 @@ def admin_import_saved_searches(
         "--include-tags",
         help="Only import searches with these tags.",
     ),
+    import_format: str = typer.Option(
+        "json",
+        "--format",
+        help="Input format: json (default) or arrow (requires pyarrow and --input).",
+    ),
 ) -> None:
     """Proxy to saved-search import helper."""
 
+    from i4g.cli.admin import saved_searches
+
     saved_searches.import_saved_searches(
-        SimpleNamespace(
-            input=str(input_path) if input_path else None,
-            owner=owner,
-            shared=shared,
-            include_tags=include_tags,
-        )
+        input_path=input_path,
+        owner=owner,
+        shared=shared,
+        include_tags=include_tags,
+        import_format=import_format,
     )
 
 
@@ -136,7 +227,9 @@ def admin_prune_saved_searches(
 ) -> None:
     """Proxy to saved-search prune helper."""
 
-    saved_searches.prune_saved_searches(SimpleNamespace(owner=owner, tags=tags, dry_run=dry_run))
+    from i4g.cli.admin import saved_searches
+
+    saved_searches.prune_saved_searches(owner=owner, tags=tags, dry_run=dry_run)
 
 
 @admin_app.command("bulk-update-tags", help="Add, remove, or replace saved-search tags in bulk.")
@@ -168,17 +261,17 @@ def admin_bulk_update_tags(
 ) -> None:
     """Proxy to bulk tag update helper."""
 
+    from i4g.cli.admin import saved_searches
+
     saved_searches.bulk_update_saved_search_tags(
-        SimpleNamespace(
-            owner=owner,
-            tags=tags,
-            search_id=search_id,
-            add=add,
-            remove=remove,
-            replace=replace,
-            limit=limit,
-            dry_run=dry_run,
-        )
+        owner=owner,
+        tags=tags,
+        search_ids=search_id,
+        add=add,
+        remove=remove,
+        replace=replace,
+        limit=limit,
+        dry_run=dry_run,
     )
 
 
@@ -189,7 +282,9 @@ def admin_export_tag_presets(
 ) -> None:
     """Proxy to tag preset export helper."""
 
-    saved_searches.export_tag_presets(SimpleNamespace(owner=owner, output=str(output) if output else None))
+    from i4g.cli.admin import saved_searches
+
+    saved_searches.export_tag_presets(owner=owner, output=output)
 
 
 @admin_app.command("import-tag-presets", help="Import tag presets and append as filter presets.")
@@ -198,13 +293,17 @@ def admin_import_tag_presets(
 ) -> None:
     """Proxy to tag preset import helper."""
 
-    saved_searches.import_tag_presets(SimpleNamespace(input=str(input_path) if input_path else None))
+    from i4g.cli.admin import saved_searches
+
+    saved_searches.import_tag_presets(input_path=input_path)
 
 
 @admin_app.command("build-dossiers", help="Group accepted cases into dossier queue entries.")
 def admin_build_dossiers(
     limit: int = typer.Option(200, "--limit", help="Number of accepted cases to inspect."),
-    min_loss: Optional[float] = typer.Option(None, "--min-loss", help="Minimum loss threshold in USD."),
+    min_loss: Optional[Decimal] = typer.Option(
+        None, "--min-loss", parser=_parse_decimal, metavar="AMOUNT", help="Minimum loss threshold in USD."
+    ),
     recency_days: Optional[int] = typer.Option(None, "--recency-days", help="Accepted-within window in days."),
     max_cases: Optional[int] = typer.Option(None, "--max-cases", help="Maximum number of cases per dossier."),
     jurisdiction_mode: str = typer.Option(
@@ -222,8 +321,10 @@ def admin_build_dossiers(
 ) -> None:
     """Proxy to dossier build helper."""
 
+    from i4g.cli.admin import dossiers
+
     dossiers.build_dossiers(
-        SimpleNamespace(
+        BuildDossiersArgs(
             limit=limit,
             min_loss=min_loss,
             recency_days=recency_days,
@@ -254,8 +355,10 @@ def admin_process_dossiers(
 ) -> None:
     """Proxy to dossier processing helper."""
 
+    from i4g.cli.admin import dossiers
+
     dossiers.process_dossiers(
-        SimpleNamespace(
+        ProcessDossiersArgs(
             batch_size=batch_size,
             preview=preview,
             dry_run=dry_run,
@@ -267,10 +370,10 @@ def admin_process_dossiers(
 
 @admin_app.command("pilot-dossiers", help="Seed curated pilot cases and enqueue dossier plans.")
 def admin_pilot_dossiers(
-    cases_file: Path = typer.Option(
-        pilot.DEFAULT_PILOT_CASES_PATH,
+    cases_file: Optional[Path] = typer.Option(
+        None,
         "--cases-file",
-        help="Path to JSON file containing pilot case specs.",
+        help="Path to JSON file containing pilot case specs (default: data/manual_demo/dossier_pilot_cases.json).",
     ),
     cases: Optional[list[str]] = typer.Option(
         None,
@@ -283,7 +386,9 @@ def admin_pilot_dossiers(
         help="Limit the number of pilot cases after filtering.",
     ),
     seed_only: bool = typer.Option(False, "--seed-only", help="Seed pilot data without generating dossier plans."),
-    min_loss: Optional[float] = typer.Option(None, "--min-loss", help="Minimum loss threshold in USD."),
+    min_loss: Optional[Decimal] = typer.Option(
+        None, "--min-loss", parser=_parse_decimal, metavar="AMOUNT", help="Minimum loss threshold in USD."
+    ),
     recency_days: Optional[int] = typer.Option(None, "--recency-days", help="Accepted-within window in days."),
     max_cases: Optional[int] = typer.Option(None, "--max-cases", help="Maximum number of cases per dossier."),
     jurisdiction_mode: str = typer.Option(
@@ -300,9 +405,11 @@ def admin_pilot_dossiers(
 ) -> None:
     """Proxy to pilot dossier scheduler."""
 
+    from i4g.cli.admin import pilot
+
     pilot.schedule_pilot_dossiers(
-        SimpleNamespace(
-            cases_file=cases_file,
+        PilotDossiersArgs(
+            cases_file=cases_file or pilot.DEFAULT_PILOT_CASES_PATH,
             cases=cases,
             case_count=case_count,
             seed_only=seed_only,
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 import os
 import uuid
-from decimal import Decimal
+from datetime import datetime, timezone
 from typing import Any
 
 from i4g.cli.utils import SETTINGS, console
-from i4g.reports.bundle_builder import BundleCriteria
+from i4g.reports.bundle_builder import BundleBuilder, BundleCriteria
 from i4g.reports.dossier_queue_processor import DossierQueueProcessor
 from i4g.services.factories import build_bundle_builder, build_bundle_candidate_provider
 from i4g.task_status import TaskStatusReporter
@@ -26,9 +26,7 @@ def build_dossiers(args: Any) -> None:
         )
         return
 
-    min_loss_value = (
-        Decimal(str(args.min_loss)) if args.min_loss is not None else Decimal(str(SETTINGS.report.min_loss_usd))
-    )
+    min_loss_value = args.min_loss if args.min_loss is not None else SETTINGS.report.min_loss_usd
     criteria = BundleCriteria(
         min_loss_usd=min_loss_value,
         recency_days=args.recency_days or SETTINGS.report.recency_days,
@@ -37,6 +35,16 @@ def build_dossiers(args: Any) -> None:
         require_cross_border=args.cross_border_only or SETTINGS.report.require_cross_border,
     )
 
+    # Skip building plans entirely when no candidate could survive the builder's per-candidate filter.
+    now = datetime.now(timezone.utc)
+    if not any(BundleBuilder.qualifies(candidate, criteria, now) for candidate in candidates):
+        console.print(
+            f"[yellow]None of the {len(candidates)} candidate(s) meet the bundling criteria "
+            f"(min_loss=${criteria.min_loss_usd}, recency_days={criteria.recency_days}, "
+            f"cross_border_only={criteria.require_cross_border}); no dossier plans created."
+        )
+        return
+
     builder = build_bundle_builder()
     if args.dry_run:
         plans = builder.generate_plans(candidates=candidates, criteria=criteria)
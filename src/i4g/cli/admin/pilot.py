@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import sys
-from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
@@ -61,7 +60,7 @@ def schedule_pilot_dossiers(args: Any) -> None:
         console.print("[cyan]ℹ️ Seed-only mode enabled; skipping dossier plan generation.")
         return
 
-    min_loss = Decimal(str(args.min_loss)) if args.min_loss is not None else Decimal(str(SETTINGS.report.min_loss_usd))
+    min_loss = args.min_loss if args.min_loss is not None else SETTINGS.report.min_loss_usd
     criteria = BundleCriteria(
         min_loss_usd=min_loss,
         recency_days=args.recency_days or SETTINGS.report.recency_days,
@@ -2,26 +2,63 @@
 
 from __future__ import annotations
 
-import json
+import sqlite3
 import sys
+from itertools import islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+import ijson
+import orjson
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.exc import SQLAlchemyError
 
 from i4g.api.review import SavedSearchImportRequest
-from i4g.cli.utils import SETTINGS, console
+from i4g.cli.utils import console
 from i4g.services.factories import build_review_store
-
-
-def export_saved_searches(args: Any) -> None:
-    """Dump saved searches to JSON."""
-
-    store = build_review_store()
-    owner_filter = None if args.all else (args.owner or None)
-    records = store.list_saved_searches(owner=owner_filter, limit=args.limit)
-    include_tags = {t.strip().lower() for t in (args.include_tags or []) if t.strip()}
-    if include_tags:
-        records = [r for r in records if include_tags.intersection({t.lower() for t in (r.get("tags") or [])})]
-    schema_version = args.schema_version.strip() if getattr(args, "schema_version", None) else ""
+from i4g.store.review_store import ReviewStore, SqlAlchemyReviewStore
+
+try:  # pragma: no cover - optional dependency wiring is environment specific
+    import pyarrow as pa
+    from pyarrow import feather
+except ImportError:  # pragma: no cover - JSON remains the default interchange format
+    pa = None  # type: ignore[assignment]
+    feather = None  # type: ignore[assignment]
+
+EXPORT_FORMATS = ("json", "arrow")
+_IMPORT_ADAPTER = TypeAdapter(list[SavedSearchImportRequest])
+_IMPORT_BATCH_SIZE = 500
+# Errors a rejected bulk write may surface; the batch is then replayed row by row to isolate the bad entries.
+_BULK_IMPORT_ERRORS = (ValueError, sqlite3.Error, SQLAlchemyError)
+_STORE: ReviewStore | SqlAlchemyReviewStore | None = None
+_ARROW_COLUMNS = ("search_id", "name", "owner", "params", "favorite", "tags")
+
+
+def export_saved_searches(
+    *,
+    limit: int = 100,
+    include_all: bool = False,
+    owner: str | None = None,
+    output: str | Path | None = None,
+    split: bool = False,
+    include_tags: list[str] | None = None,
+    schema_version: str | None = None,
+    export_format: str = "json",
+) -> None:
+    """Dump saved searches to JSON (or Arrow IPC when ``export_format == "arrow"``)."""
+
+    fmt = _resolve_format(export_format)
+    if fmt == "arrow" and not output:
+        console.print("[red]❌ --format arrow requires --output.[/red]")
+        sys.exit(1)
+    store = _get_store()
+    owner_filter = None if include_all else (owner or None)
+    tag_filter = _normalize_tags(include_tags)
+    records = store.list_saved_searches(owner=owner_filter, limit=limit, tags=sorted(tag_filter) or None)
+    schema_version = schema_version.strip() if schema_version else ""
+    group_by_owner = bool(split and output)
+    by_owner: dict[str, list[dict[str, object]]] = {}
+    # Normalize each record and bucket it by owner in the same pass.
     for record in records:
         record.pop("created_at", None)
         if record.get("tags") is None:
@@ -31,126 +68,176 @@ def export_saved_searches(args: Any) -> None:
             if isinstance(params, dict):
                 params["schema_version"] = schema_version
                 record["params"] = params
-    if args.split and args.output:
-        base = Path(args.output)
-        base.mkdir(parents=True, exist_ok=True)
-        by_owner: dict[str, list[dict[str, object]]] = {}
-        for record in records:
-            owner = record.get("owner") or "shared"
-            by_owner.setdefault(owner, []).append(record)
-        for owner, rows in by_owner.items():
-            fname = base / f"saved_searches_{owner}.json"
-            fname.write_text(json.dumps(rows, indent=2))
+        if group_by_owner:
+            by_owner.setdefault(record.get("owner") or "shared", []).append(record)
+    if group_by_owner:
+        base = Path(output)
+        if by_owner:
+            base.mkdir(parents=True, exist_ok=True)
+        for record_owner, rows in by_owner.items():
+            fname = base / f"saved_searches_{record_owner}.{fmt}"
+            if fmt == "arrow":
+                _write_arrow(fname, rows)
+            else:
+                fname.write_bytes(orjson.dumps(rows, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
             console.print(f"[green]✅ Exported {len(rows)} saved search(es) to {fname}")
+    elif fmt == "arrow":
+        _write_arrow(Path(output), records)
+        console.print(f"[green]✅ Exported {len(records)} saved search(es) to {output}")
     else:
-        data = json.dumps(records, indent=2)
-        if args.output:
-            Path(args.output).write_text(data)
-            console.print(f"[green]✅ Exported {len(records)} saved search(es) to {args.output}")
+        data = orjson.dumps(records, option=orjson.OPT_INDENT_2)
+        if output:
+            Path(output).write_bytes(data)
+            console.print(f"[green]✅ Exported {len(records)} saved search(es) to {output}")
         else:
-            console.print(data)
-
-
-def import_saved_searches(args: Any) -> None:
-    """Load saved searches from JSON file/stdin."""
-
-    store = build_review_store()
-    content = Path(args.input).read_text() if args.input else sys.stdin.read()
-    try:
-        payload = json.loads(content)
-    except json.JSONDecodeError as exc:
-        console.print(f"[red]❌ Invalid JSON:[/red] {exc}")
-        sys.exit(1)
-
-    include_tags = {t.strip().lower() for t in (args.include_tags or []) if t.strip()}
-    items = payload if isinstance(payload, list) else [payload]
+            _write_stdout(data)
+
+
+def import_saved_searches(
+    *,
+    input_path: str | Path | None = None,
+    owner: str | None = None,
+    shared: bool = False,
+    include_tags: list[str] | None = None,
+    import_format: str = "json",
+) -> None:
+    """Load saved searches from a JSON file/stdin or an Arrow IPC file."""
+
+    fmt = _resolve_format(import_format)
+    items: Iterable[Any]
+    if fmt == "arrow":
+        if not input_path:
+            console.print("[red]❌ --format arrow requires --input.[/red]")
+            sys.exit(1)
+        items = _read_arrow(Path(input_path))
+    elif input_path and _is_json_array(Path(input_path)):
+        # Stream array elements so very large dumps never sit fully in memory.
+        items = _stream_json_array(Path(input_path))
+    else:
+        content = Path(input_path).read_bytes() if input_path else sys.stdin.buffer.read()
+        try:
+            payload = orjson.loads(content)
+        except orjson.JSONDecodeError as exc:
+            console.print(f"[red]❌ Invalid JSON:[/red] {exc}")
+            sys.exit(1)
+        items = payload if isinstance(payload, list) else [payload]
+
+    store = _get_store()
+    tag_filter = _normalize_tags(include_tags)
+    target_owner = None if shared else owner
     imported = 0
     skipped = 0
-    for item in items:
-        try:
-            req = SavedSearchImportRequest(**item)
-            if include_tags and not include_tags.intersection({t.lower() for t in (req.tags or [])}):
-                skipped += 1
-                continue
-            store.import_saved_search(req.model_dump(), owner=None if args.shared else args.owner)
-            imported += 1
-        except Exception as exc:  # pragma: no cover - defensive logging
-            skipped += 1
-            console.print(f"[yellow]Skipped #{imported + skipped}: {exc}[/yellow]")
+    position = 0
+    try:
+        for batch in _batched(items, _IMPORT_BATCH_SIZE):
+            try:
+                requests = _IMPORT_ADAPTER.validate_python(batch)
+            except ValidationError:
+                # Re-validate row by row only when the batch fails so invalid entries are reported and skipped.
+                requests = []
+                for index, item in enumerate(batch, start=position + 1):
+                    try:
+                        requests.append(SavedSearchImportRequest.model_validate(item))
+                    except ValidationError as exc:
+                        skipped += 1
+                        console.print(f"[yellow]Skipped #{index}: {exc}[/yellow]")
+            position += len(batch)
+
+            if tag_filter:
+                kept = [req for req in requests if any(t.lower() in tag_filter for t in (req.tags or []))]
+                skipped += len(requests) - len(kept)
+                requests = kept
+            # Dump the surviving models in one pydantic-core pass; the store defaults any unset fields itself.
+            payloads = _IMPORT_ADAPTER.dump_python(requests, exclude_unset=True)
+            stored, failed = _store_imported(store, payloads, owner=target_owner)
+            imported += stored
+            skipped += failed
+    except ijson.JSONError as exc:
+        # Earlier batches are already committed, so say exactly how much of the file landed before failing.
+        console.print(f"[red]❌ Invalid JSON after item #{position}:[/red] {exc}")
+        console.print(
+            f"[yellow]⚠️ Partial import: {imported} saved search(es) were committed before the error; "
+            f"{skipped} skipped.[/yellow]"
+        )
+        sys.exit(1)
     console.print(f"[green]✅ Imported {imported} saved search(es); {skipped} skipped.")
 
 
-def prune_saved_searches(args: Any) -> None:
+def prune_saved_searches(*, owner: str | None = None, tags: list[str] | None = None, dry_run: bool = False) -> None:
     """Delete saved searches by owner/tag filters."""
 
-    store = build_review_store()
-    records = store.list_saved_searches(owner=args.owner, limit=1000)
-    tags_filter = {t.strip().lower() for t in (args.tags or []) if t.strip()}
-    to_delete = []
-    for record in records:
-        tags = {t.lower() for t in (record.get("tags") or [])}
-        if tags_filter and not tags_filter.intersection(tags):
-            continue
-        to_delete.append(record)
+    store = _get_store()
+    tags_filter = _normalize_tags(tags)
+    to_delete = store.list_saved_searches(owner=owner, limit=1000, tags=sorted(tags_filter) or None)
 
     if not to_delete:
         console.print("[yellow]No saved searches matched the criteria.")
         return
 
     for record in to_delete:
-        owner = record.get("owner") or "shared"
-        console.print(f"[cyan]- {record.get('name')} (owner={owner}, tags={record.get('tags')})")
+        record_owner = record.get("owner") or "shared"
+        console.print(f"[cyan]- {record.get('name')} (owner={record_owner}, tags={record.get('tags')})")
 
-    if args.dry_run:
+    if dry_run:
         console.print(f"[green]Dry run: {len(to_delete)} saved search(es) would be deleted.")
         return
 
-    deleted = 0
-    for record in to_delete:
-        if store.delete_saved_search(record["search_id"]):
-            deleted += 1
+    search_ids = [record["search_id"] for record in to_delete]
+    bulk_delete = getattr(store, "bulk_delete_saved_searches", None)
+    if bulk_delete is not None:
+        deleted = bulk_delete(search_ids)
+    else:
+        deleted = sum(1 for search_id in search_ids if store.delete_saved_search(search_id))
     console.print(f"[green]✅ Deleted {deleted} saved search(es).")
 
 
-def bulk_update_saved_search_tags(args: Any) -> None:
+def bulk_update_saved_search_tags(
+    *,
+    owner: str | None = None,
+    tags: list[str] | None = None,
+    search_ids: list[str] | None = None,
+    add: list[str] | None = None,
+    remove: list[str] | None = None,
+    replace: list[str] | None = None,
+    limit: int = 200,
+    dry_run: bool = False,
+) -> None:
     """Add, remove, or replace saved-search tags in bulk."""
 
-    if not any([args.add, args.remove, args.replace is not None]):
+    if not any([add, remove, replace is not None]):
         console.print("[red]Provide --add, --remove, or --replace to adjust tags.[/red]")
         sys.exit(1)
 
-    if args.replace is not None and (args.add or args.remove):
+    if replace is not None and (add or remove):
         console.print("[yellow]⚠️ --replace overrides --add/--remove; add/remove values will be ignored.[/yellow]")
 
-    store = build_review_store()
-    normalized_add = [t.strip() for t in (args.add or []) if t.strip()]
-    normalized_remove = [t.strip() for t in (args.remove or []) if t.strip()]
-    normalized_replace = [t.strip() for t in (args.replace or []) if t.strip()] if args.replace is not None else None
+    store = _get_store()
+    normalized_add = [t.strip() for t in (add or []) if t.strip()]
+    normalized_remove = [t.strip() for t in (remove or []) if t.strip()]
+    normalized_replace = [t.strip() for t in (replace or []) if t.strip()] if replace is not None else None
 
-    summary_records = []
-    target_ids = []
+    summary_records: list[dict[str, Any]] = []
+    target_ids: list[str] = []
 
-    if args.search_id:
-        target_ids = [sid for sid in args.search_id if sid.strip()]
-        for sid in target_ids:
-            record = store.get_saved_search(sid)
-            if record:
-                summary_records.append(record)
+    if search_ids:
+        # dict preserves insertion order, so this dedupes explicit IDs without reordering them.
+        target_ids = list(dict.fromkeys(sid for sid in search_ids if sid.strip()))
+        fetch_many = getattr(store, "get_saved_searches_by_ids", None)
+        if fetch_many is not None:
+            summary_records = fetch_many(target_ids)
+        else:
+            summary_records = [record for record in map(store.get_saved_search, target_ids) if record]
     else:
-        records = store.list_saved_searches(owner=args.owner, limit=args.limit)
-        tags_filter = {t.strip().lower() for t in (args.tags or []) if t.strip()}
-        if tags_filter:
-            records = [r for r in records if tags_filter.intersection({t.lower() for t in (r.get("tags") or [])})]
+        tags_filter = _normalize_tags(tags)
+        records = store.list_saved_searches(owner=owner, limit=limit, tags=sorted(tags_filter) or None)
         summary_records = records
         target_ids = [r["search_id"] for r in records]
 
-    target_ids = list(dict.fromkeys(target_ids))
-
     if not target_ids:
         console.print("[yellow]No saved searches matched the criteria.")
         return
 
-    if args.search_id:
+    if search_ids:
         found_ids = {record["search_id"] for record in summary_records}
         missing_ids = [sid for sid in target_ids if sid not in found_ids]
         if missing_ids:
@@ -159,11 +246,11 @@ def bulk_update_saved_search_tags(args: Any) -> None:
                 + ", ".join(missing_ids)
             )
 
-    if args.dry_run:
+    if dry_run:
         console.print(f"[green]Dry run:[/green] would update {len(target_ids)} saved search(es).")
         for record in summary_records[:10]:
-            owner = record.get("owner") or "shared"
-            console.print(f"  - {record.get('name')} (owner={owner}, tags={record.get('tags') or []})")
+            record_owner = record.get("owner") or "shared"
+            console.print(f"  - {record.get('name')} (owner={record_owner}, tags={record.get('tags') or []})")
         if len(summary_records) > 10:
             console.print(f"  ...and {len(summary_records) - 10} more.")
         return
@@ -177,46 +264,181 @@ def bulk_update_saved_search_tags(args: Any) -> None:
     console.print(f"[green]✅ Updated tags for {updated} saved search(es).")
 
 
-def export_tag_presets(args: Any) -> None:
+def export_tag_presets(*, owner: str | None = None, output: str | Path | None = None) -> None:
     """Export tag presets derived from saved searches."""
 
-    store = build_review_store()
-    presets = store.list_tag_presets(owner=args.owner, limit=1000)
-    data = json.dumps(presets, indent=2)
-    if args.output:
-        Path(args.output).write_text(data)
-        console.print(f"[green]✅ Exported {len(presets)} tag preset(s) to {args.output}")
+    store = _get_store()
+    presets = store.list_tag_presets(owner=owner, limit=1000)
+    data = orjson.dumps(presets, option=orjson.OPT_INDENT_2)
+    if output:
+        Path(output).write_bytes(data)
+        console.print(f"[green]✅ Exported {len(presets)} tag preset(s) to {output}")
     else:
-        console.print(data)
+        _write_stdout(data)
 
 
-def import_tag_presets(args: Any) -> None:
+def import_tag_presets(*, input_path: str | Path | None = None) -> None:
     """Import tag presets and append as filter presets."""
 
-    content = Path(args.input).read_text() if args.input else sys.stdin.read()
+    content = Path(input_path).read_bytes() if input_path else sys.stdin.buffer.read()
     try:
-        payload = json.loads(content)
-    except json.JSONDecodeError as exc:
+        payload = orjson.loads(content)
+    except orjson.JSONDecodeError as exc:
         console.print(f"[red]❌ Invalid JSON:[/red] {exc}")
         sys.exit(1)
     items = payload if isinstance(payload, list) else [payload]
     presets = []
+    seen: set[tuple[str, ...]] = set()
     for item in items:
         tags = item.get("tags") or []
-        if tags and tags not in presets:
+        key = tuple(tags)
+        if tags and key not in seen:
+            seen.add(key)
             presets.append(tags)
     if not presets:
         console.print("[yellow]No tag presets found in input.")
         return
-    output = json.dumps(presets, indent=2)
-    if args.input:
-        Path(args.input).write_text(output)
+    output = orjson.dumps(presets, option=orjson.OPT_INDENT_2)
+    if input_path:
+        Path(input_path).write_bytes(output)
         console.print(f"[green]✅ Normalized {len(presets)} tag preset(s).")
     else:
-        console.print(output)
+        _write_stdout(output)
+
+
+def clear_store_cache() -> None:
+    """Drop the cached review store (used in tests or after settings reloads)."""
+
+    global _STORE
+    _STORE = None
+
+
+def _get_store() -> ReviewStore | SqlAlchemyReviewStore:
+    """Return the process-wide review store, building it on first use."""
+
+    global _STORE
+    if _STORE is None:
+        _STORE = build_review_store()
+    return _STORE
+
+
+def _store_imported(
+    store: ReviewStore | SqlAlchemyReviewStore, payloads: list[dict[str, Any]], *, owner: str | None
+) -> tuple[int, int]:
+    """Persist validated payloads in one bulk write, replaying row by row if the batch is rejected."""
+
+    bulk_import = getattr(store, "bulk_import_saved_searches", None)
+    if bulk_import is not None and payloads:
+        try:
+            return bulk_import(payloads, owner=owner), 0
+        except _BULK_IMPORT_ERRORS:
+            pass  # Replay the batch row by row so the offending entries are reported.
+    stored = 0
+    failed = 0
+    for payload in payloads:
+        try:
+            store.import_saved_search(payload, owner=owner)
+            stored += 1
+        except Exception as exc:  # pragma: no cover - defensive logging
+            failed += 1
+            console.print(f"[yellow]Skipped {payload.get('name')!r}: {exc}[/yellow]")
+    return stored, failed
+
+
+def _batched(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield lists of up to ``size`` items without materializing ``items``."""
+
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _is_json_array(path: Path) -> bool:
+    """Return True when the first non-whitespace byte of ``path`` opens a JSON array."""
+
+    with path.open("rb") as fh:
+        while chunk := fh.read(64):
+            stripped = chunk.lstrip()
+            if stripped:
+                return stripped[:1] == b"["
+    return False
+
+
+def _stream_json_array(path: Path) -> Iterator[Any]:
+    """Yield elements of the top-level JSON array in ``path`` incrementally via ijson.
+
+    Parse errors propagate to the caller, which may already have committed earlier batches.
+    """
+
+    with path.open("rb") as fh:
+        yield from ijson.items(fh, "item", use_float=True)
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write an encoded JSON payload to stdout in one buffered write, bypassing Rich markup parsing."""
+
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.flush()
+
+
+def _resolve_format(value: str | None) -> str:
+    """Return the validated interchange format, exiting when ``arrow`` is requested without pyarrow."""
+
+    fmt = (value or "json").strip().lower()
+    if fmt not in EXPORT_FORMATS:
+        console.print(f"[red]❌ Unsupported format '{value}'. Choose from: {', '.join(EXPORT_FORMATS)}.[/red]")
+        sys.exit(1)
+    if fmt == "arrow" and pa is None:
+        console.print("[red]❌ pyarrow is required for --format arrow.[/red]")
+        sys.exit(1)
+    return fmt
+
+
+def _write_arrow(path: Path, records: list[dict[str, Any]]) -> None:
+    """Write saved-search records as a zstd-compressed Arrow IPC (Feather v2) file."""
+
+    schema = pa.schema(
+        [
+            ("search_id", pa.string()),
+            ("name", pa.string()),
+            ("owner", pa.string()),
+            ("params", pa.binary()),
+            ("favorite", pa.bool_()),
+            ("tags", pa.list_(pa.string())),
+        ]
+    )
+    rows = [
+        {
+            "search_id": record.get("search_id"),
+            "name": record.get("name"),
+            "owner": record.get("owner"),
+            "params": orjson.dumps(record.get("params") or {}),
+            "favorite": bool(record.get("favorite")),
+            "tags": list(record.get("tags") or []),
+        }
+        for record in records
+    ]
+    feather.write_feather(pa.Table.from_pylist(rows, schema=schema), str(path), compression="zstd")
+
+
+def _read_arrow(path: Path) -> list[dict[str, Any]]:
+    """Load saved-search records written by :func:`_write_arrow`."""
+
+    table = feather.read_table(str(path), columns=list(_ARROW_COLUMNS))
+    items = table.to_pylist()
+    for item in items:
+        item["params"] = orjson.loads(item["params"]) if item.get("params") else {}
+    return items
+
+
+def _normalize_tags(values: list[str] | None) -> set[str]:
+    """Return the stripped, lowercased tag filter built from CLI values."""
+
+    return {t.strip().lower() for t in (values or []) if t.strip()}
 
 
 __all__ = [
+    "clear_store_cache",
     "export_saved_searches",
     "import_saved_searches",
     "prune_saved_searches",
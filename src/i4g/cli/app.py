@@ -6,29 +6,13 @@ Use ``--install-completion`` to enable shell tab completion (bash required; zsh/
 
 from __future__ import annotations
 
-import sys
-from pathlib import Path
+import importlib
+import os
 
 import typer
 
-from i4g.cli.admin import admin_app
-from i4g.cli.azure import app as azure_app
-from i4g.cli.bootstrap import bootstrap_app
-from i4g.cli.data import data_app
-from i4g.cli.extract import extract_app
-from i4g.cli.ingest import ingest_app
-from i4g.cli.jobs import jobs_app
-from i4g.cli.reports import reports_app
-from i4g.cli.search import search_app
-from i4g.cli.settings import settings_app
-from i4g.cli.smoke import smoke_app
-
-try:
-    from importlib.metadata import version
-
-    VERSION = version("i4g")
-except Exception:
-    VERSION = "unknown"
+from i4g.cli.entry import package_version
+from i4g.cli.lazy import LazyTyperGroup
 
 APP_HELP = (
     "i4g command line for developers and operators. "
@@ -37,31 +21,70 @@ APP_HELP = (
     "Guardrails: bootstrap commands enforce I4G_ENV and require --force to target non-local/dev projects."
 )
 
-PROJECT_ROOT = Path(__file__).resolve().parents[3]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+# Subcommand name -> (module, Typer attribute, short help). Groups are imported only when dispatched, so
+# `i4g --help` and `i4g jobs ...` never pay for the review store, report builders, or GCP clients pulled in by
+# other groups. Keep the short help in sync with each sub-Typer's own ``help=``.
+_SUBCOMMANDS: dict[str, tuple[str, str, str]] = {
+    "bootstrap": (
+        "i4g.cli.bootstrap",
+        "bootstrap_app",
+        "Bootstrap or reset environments (local sandbox, dev refresh).",
+    ),
+    "settings": ("i4g.cli.settings", "settings_app", "Inspect and export configuration manifests."),
+    "smoke": ("i4g.cli.smoke", "smoke_app", "Run smoketests against local or remote services."),
+    "jobs": ("i4g.cli.jobs", "jobs_app", "Invoke background jobs (ingest, report, intake, dossier, account)."),
+    "ingest": ("i4g.cli.ingest", "ingest_app", "Ingestion utilities and helpers."),
+    "search": ("i4g.cli.search", "search_app", "Search/retrieval queries and evaluations."),
+    "reports": ("i4g.cli.reports", "reports_app", "Report/dossier verification helpers."),
+    "extract": ("i4g.cli.extract", "extract_app", "OCR and extraction pipelines."),
+    "admin": ("i4g.cli.admin", "admin_app", "Saved search and dossier administration."),
+    "azure": ("i4g.cli.azure", "app", "Legacy Azure migration and export helpers."),
+}
 
-app = typer.Typer(add_completion=True, help=APP_HELP)
 
-app.add_typer(bootstrap_app, name="bootstrap")
-app.add_typer(settings_app, name="settings")
-app.add_typer(smoke_app, name="smoke")
-app.add_typer(jobs_app, name="jobs")
-app.add_typer(ingest_app, name="ingest")
-app.add_typer(search_app, name="search")
-app.add_typer(data_app, name="data")
-app.add_typer(reports_app, name="reports")
-app.add_typer(extract_app, name="extract")
-app.add_typer(admin_app, name="admin")
-app.add_typer(azure_app, name="azure")
+def _import_subcommand(name: str) -> typer.Typer:
+    """Import and return the sub-Typer registered under ``name``."""
+
+    module_path, attribute, _ = _SUBCOMMANDS[name]
+    return getattr(importlib.import_module(module_path), attribute)
+
+
+class _RootGroup(LazyTyperGroup):
+    """Top-level ``i4g`` group backed by ``_SUBCOMMANDS``."""
+
+    subcommands = _SUBCOMMANDS
+
+    def load_subcommand(self, name: str) -> typer.Typer:
+        return _import_subcommand(name)
+
+
+def __getattr__(name: str) -> typer.Typer:
+    # Preserve `from i4g.cli.app import search_app`-style access without importing every group up front.
+    key = name.removesuffix("_app")
+    if name.endswith("_app") and key in _SUBCOMMANDS:
+        sub_app = _import_subcommand(key)
+        globals()[name] = sub_app
+        return sub_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+app = typer.Typer(add_completion=True, help=APP_HELP, cls=_RootGroup)
+
+# Dispatch already builds only the sub-Typer named in argv; I4G_CLI_EAGER=1 registers every group up front so CI
+# can surface import errors across the whole command tree in one run.
+if os.environ.get("I4G_CLI_EAGER"):
+    for _name in _SUBCOMMANDS:
+        app.add_typer(_import_subcommand(_name), name=_name)
 
 
 @app.callback(invoke_without_command=True)
-def main(ctx: typer.Context, version: bool = typer.Option(False, "--version", help="Show version and exit.")) -> None:
+def main(
+    ctx: typer.Context, version: bool = typer.Option(False, "--version", "-V", help="Show version and exit.")
+) -> None:
     """Show help when no subcommand is provided."""
 
     if version:
-        typer.echo(f"i4g {VERSION}")
+        typer.echo(f"i4g {package_version()}")
         raise typer.Exit()
     if ctx.invoked_subcommand is None:
         typer.echo(ctx.get_help())
@@ -2,55 +2,77 @@
 
 from __future__ import annotations
 
+import runpy
 import subprocess
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import Annotated, Optional
 
 import typer
 
-PROJECT_ROOT = Path(__file__).resolve().parents[4]
-if str(PROJECT_ROOT) not in sys.path:
-    sys.path.insert(0, str(PROJECT_ROOT))
+from i4g._paths import PROJECT_ROOT
 
 app = typer.Typer(add_completion=True, help="Legacy Azure migration and export helpers.")
 
 
-def _run_script(relative_path: str, args: list[str] | None = None) -> None:
-    """Execute a legacy migration script with passthrough arguments."""
+_Isolated = Annotated[
+    bool, typer.Option("--isolated", help="Run the script in a separate Python process instead of in-process.")
+]
+
+
+def _run_script(relative_path: str, args: list[str] | None = None, isolated: bool = False) -> None:
+    """Execute a legacy migration script with passthrough arguments.
+
+    Scripts run in-process as ``__main__`` by default, which skips a second interpreter start and SDK import;
+    ``isolated`` restores the subprocess path for scripts that need a clean process.
+    """
 
     script_path = PROJECT_ROOT / relative_path
-    cmd = [sys.executable, str(script_path)]
-    if args:
-        cmd.extend(args)
-    result = subprocess.run(cmd)
-    if result.returncode != 0:
-        raise typer.Exit(result.returncode)
+    argv = [str(script_path), *(args or [])]
+    if isolated:
+        result = subprocess.run([sys.executable, *argv])
+        if result.returncode != 0:
+            raise typer.Exit(result.returncode)
+        return
+
+    saved_argv = sys.argv
+    sys.argv = argv
+    try:
+        runpy.run_path(str(script_path), run_name="__main__")
+    except SystemExit as exc:
+        if isinstance(exc.code, str):
+            typer.echo(exc.code, err=True)
+            raise typer.Exit(1)
+        if exc.code:
+            raise typer.Exit(exc.code)
+    finally:
+        sys.argv = saved_argv
 
 
 @app.command("azure-sql-to-firestore", help="Copy legacy Azure SQL intake tables into Firestore staging.")
-def azure_sql_to_firestore(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
-    _run_script("scripts/migration/azure_sql_to_firestore.py", extra_args or [])
+def azure_sql_to_firestore(extra_args: Optional[list[str]] = typer.Argument(None), isolated: _Isolated = False) -> None:
+    _run_script("scripts/migration/azure_sql_to_firestore.py", extra_args or [], isolated)
 
 
 @app.command("azure-blob-to-gcs", help="Sync Azure Blob Storage containers into GCS.")
-def azure_blob_to_gcs(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
-    _run_script("scripts/migration/azure_blob_to_gcs.py", extra_args or [])
+def azure_blob_to_gcs(extra_args: Optional[list[str]] = typer.Argument(None), isolated: _Isolated = False) -> None:
+    _run_script("scripts/migration/azure_blob_to_gcs.py", extra_args or [], isolated)
 
 
 @app.command("azure-search-export", help="Export Azure Cognitive Search indexes.")
-def azure_search_export(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
-    _run_script("scripts/migration/azure_search_export.py", extra_args or [])
+def azure_search_export(extra_args: Optional[list[str]] = typer.Argument(None), isolated: _Isolated = False) -> None:
+    _run_script("scripts/migration/azure_search_export.py", extra_args or [], isolated)
 
 
 @app.command("azure-search-to-vertex", help="Transform Azure search exports into Vertex ingest payloads.")
-def azure_search_to_vertex(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
-    _run_script("scripts/migration/azure_search_to_vertex.py", extra_args or [])
+def azure_search_to_vertex(extra_args: Optional[list[str]] = typer.Argument(None), isolated: _Isolated = False) -> None:
+    _run_script("scripts/migration/azure_search_to_vertex.py", extra_args or [], isolated)
 
 
 @app.command("import-vertex-documents", help="Import transformed Vertex documents.")
-def import_vertex_documents(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
-    _run_script("scripts/migration/import_vertex_documents.py", extra_args or [])
+def import_vertex_documents(
+    extra_args: Optional[list[str]] = typer.Argument(None), isolated: _Isolated = False
+) -> None:
+    _run_script("scripts/migration/import_vertex_documents.py", extra_args or [], isolated)
 
 
 if __name__ == "__main__":
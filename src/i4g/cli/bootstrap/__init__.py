@@ -2,28 +2,49 @@
 
 from __future__ import annotations
 
+import importlib
+from typing import Any
+
 import typer
 
-from .dev import dev_app, run_dev
-from .local import local_app, run_local
+from i4g.cli.lazy import LazyTyperGroup
+
+# The dev flow pulls in google-auth and the Discovery client; resolve `local`/`dev` on first dispatch (and their
+# helpers on first attribute access, PEP 562) so `i4g bootstrap local ...` never imports the GCP stack.
+_LAZY_EXPORTS = {
+    "dev_app": "dev",
+    "run_dev": "dev",
+    "local_app": "local",
+    "run_local": "local",
+}
+
+
+class _BootstrapGroup(LazyTyperGroup):
+    subcommands = {
+        "local": ("i4g.cli.bootstrap.local", "local_app", "Bootstrap local sandbox data and verification smokes."),
+        "dev": ("i4g.cli.bootstrap.dev", "dev_app", "Bootstrap dev via Cloud Run jobs and optional smokes."),
+    }
 
-bootstrap_app = typer.Typer(help="Bootstrap or reset environments (local sandbox, dev refresh).")
-bootstrap_app.add_typer(local_app, name="local")
-bootstrap_app.add_typer(dev_app, name="dev")
 
+bootstrap_app = typer.Typer(
+    help="Bootstrap or reset environments (local sandbox, dev refresh).",
+    cls=_BootstrapGroup,
+)
 
-def _exit_from_return(code: int | None) -> None:
-    """Honor integer return codes from invoked helpers."""
 
-    if isinstance(code, int) and code != 0:
-        raise typer.Exit(code)
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(importlib.import_module(f"{__name__}.{_LAZY_EXPORTS[name]}"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @bootstrap_app.command("seed-sample", help="Enqueue the sample dossier plan into the local queue store.")
 def bootstrap_seed_sample() -> None:
     from . import seed
 
-    _exit_from_return(seed.seed_sample_dossier())
+    raise typer.Exit(seed.seed_sample_dossier())
 
 
 __all__ = [
@@ -4,8 +4,10 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 try:
+    from google.api_core.exceptions import NotFound
     from google.cloud import storage
 except ImportError as exc:  # pragma: no cover - optional dependency
+    NotFound = None
     storage = None
     _import_error = exc
 else:
@@ -45,11 +47,12 @@ def provision_bucket(
 
     _require_storage()
     client = storage.Client(project=project)
-    bucket = client.bucket(bucket_name)
 
-    if bucket.exists(client=client):
+    # Fetch directly and create on a miss; the steady-state (bucket exists) path is then a single round trip.
+    try:
         bucket = client.get_bucket(bucket_name)
-    else:
+    except NotFound:
+        bucket = client.bucket(bucket_name)
         bucket.storage_class = storage_class
         bucket.location = location
         bucket.versioning_enabled = True
@@ -85,16 +88,13 @@ def provision_bucket(
         target_role = "roles/storage.objectAdmin"
         binding = next((item for item in policy.bindings if item.get("role") == target_role), None)
         if binding is None:
-            binding = {"role": target_role, "members": []}
+            binding = {"role": target_role, "members": set()}
             policy.bindings.append(binding)
 
-        existing_members = set(binding.get("members", []))
-        for member in iam_members:
-            if member not in existing_members:
-                binding.setdefault("members", []).append(member)
-                existing_members.add(member)
-
-        bucket.set_iam_policy(policy)
+        existing_members = set(binding.get("members", ()))
+        if not existing_members.issuperset(iam_members):
+            binding["members"] = existing_members.union(iam_members)
+            bucket.set_iam_policy(policy)
 
     return ProvisionResult(
         bucket=bucket.name,
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import argparse
 import os
-import shutil
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Optional, List, Dict
+from types import MappingProxyType
+from typing import Any, Optional, List, Dict, Mapping
 
 
 @dataclass
@@ -46,15 +47,25 @@ class SearchSmokeResult:
     message: str
 
 
-def get_bundles() -> dict[str, str]:
-    run_date = os.getenv("RUN_DATE", "2025-12-17")
+BUNDLES_BUCKET_URI = "gs://i4g-dev-data-bundles"
+DEFAULT_RUN_DATE = "2025-12-17"
+# Bundle name -> object path under ``<bucket>/<RUN_DATE>/``.
+_BUNDLE_PATHS = {
+    "legacy_azure": "legacy_azure/search_exports/vertex/",
+    "public_scams": "public_scams/cases.jsonl",
+    "retrieval_poc": "retrieval_poc/cases.jsonl",
+    "synthetic_coverage": "synthetic_coverage/full/cases.jsonl",
+}
 
-    return {
-        "legacy_azure": f"gs://i4g-dev-data-bundles/{run_date}/legacy_azure/search_exports/vertex/",
-        "public_scams": f"gs://i4g-dev-data-bundles/{run_date}/public_scams/cases.jsonl",
-        "retrieval_poc": f"gs://i4g-dev-data-bundles/{run_date}/retrieval_poc/cases.jsonl",
-        "synthetic_coverage": f"gs://i4g-dev-data-bundles/{run_date}/synthetic_coverage/full/cases.jsonl",
-    }
+
+@lru_cache(maxsize=1)
+def get_bundles() -> Mapping[str, str]:
+    """Return the read-only bundle name -> GCS URI map for ``RUN_DATE``.
+
+    The map is built once per process; call ``get_bundles.cache_clear()`` after changing ``RUN_DATE``.
+    """
+    prefix = f"{BUNDLES_BUCKET_URI}/{os.getenv('RUN_DATE', DEFAULT_RUN_DATE)}/"
+    return MappingProxyType({name: prefix + path for name, path in _BUNDLE_PATHS.items()})
 
 
 def run_search_smoke(args: argparse.Namespace) -> SearchSmokeResult:
@@ -79,9 +90,10 @@ def run_search_smoke(args: argparse.Namespace) -> SearchSmokeResult:
         )
 
     try:
-        from i4g.cli import smoke
+        from i4g.cli.smoke import VertexSearchSmokeArgs
+        from i4g.cli.smoke import runner as smoke
 
-        search_args = SimpleNamespace(
+        search_args = VertexSearchSmokeArgs(
             project=project,
             location=location,
             data_store_id=data_store,
@@ -107,7 +119,7 @@ def run_dossier_smoke(args: argparse.Namespace) -> DossierSmokeResult:
     try:
         from i4g.cli.smoke import dossiers
 
-        smoke_args = SimpleNamespace(
+        smoke_args = dossiers.DossierSmokeArgs(
             api_url=getattr(args, "smoke_api_url", None),
             token=getattr(args, "smoke_token", None),
             status=getattr(args, "smoke_dossier_status", "completed"),
@@ -132,17 +144,44 @@ def run(cmd: list[str], env_overrides: dict[str, str] | None = None) -> None:
     subprocess.run(cmd, check=True, env=env_overrides)
 
 
-def download_bundles(bundles_dir: Path) -> None:
-    """Download all data bundles from GCS if missing."""
+def _has_any_entry(path: Path) -> bool:
+    """Return True when ``path`` is a directory with at least one entry, reading only the first one."""
+
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _download_bundle(name: str, uri: str, target_dir: Path) -> None:
+    """Copy one bundle from GCS into ``target_dir`` via ``gcloud storage cp``."""
+
+    print(f"⬇️  Downloading {name} from {uri}...")
+    try:
+        subprocess.run(["gcloud", "storage", "cp", "-r", uri, str(target_dir)], check=True)
+    except Exception:
+        print(f"⚠️  Failed to download {name}. Ensure you have gcloud auth and permissions.")
+
+
+def download_bundles(bundles_dir: Path, max_workers: int = 4) -> None:
+    """Download all data bundles from GCS if missing.
+
+    Missing bundles are fetched concurrently (up to ``max_workers`` transfers) so the wall time tracks the slowest
+    bundle rather than the sum of every ``gcloud`` startup and copy.
+    """
+    pending: list[tuple[str, str, Path]] = []
     for name, uri in get_bundles().items():
         target_dir = bundles_dir / name
-        if target_dir.exists() and any(target_dir.iterdir()):
+        if _has_any_entry(target_dir):
             print(f"✅ Bundle {name} already present.")
             continue
 
         target_dir.mkdir(parents=True, exist_ok=True)
-        print(f"⬇️  Downloading {name} from {uri}...")
-        try:
-            subprocess.run(["gcloud", "storage", "cp", "-r", uri, str(target_dir)], check=True)
-        except Exception:
-            print(f"⚠️  Failed to download {name}. Ensure you have gcloud auth and permissions.")
+        pending.append((name, uri, target_dir))
+
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pending)))) as executor:
+        for future in [executor.submit(_download_bundle, *bundle) for bundle in pending]:
+            future.result()
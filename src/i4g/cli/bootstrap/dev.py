@@ -3,25 +3,31 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import logging
 import os
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Iterable, List, Optional, Sequence
+from typing import IO, Annotated, Any, Iterable, List, Optional, Sequence
 
 import google.auth
 import google.auth.impersonated_credentials
 import google.auth.transport.requests
 from googleapiclient.discovery import build
+import orjson
 import typer
 
+from i4g._paths import PROJECT_ROOT
 from i4g.settings import get_settings
 
 from i4g.cli.utils import hash_file, stage_bundle
@@ -36,7 +42,7 @@ from i4g.cli.bootstrap.common import (
     VerificationReport,
 )
 
-REPO_ROOT = Path(__file__).resolve().parents[4]
+REPO_ROOT = PROJECT_ROOT
 DATA_DIR = REPO_ROOT / "data"
 BUNDLES_DIR = DATA_DIR / "bundles"
 
@@ -46,6 +52,17 @@ IAP_CLIENT_ID_FALLBACK = "544936845045-a87u04lgc7go7asc4nhed36ka50iqh0h.apps.goo
 DEFAULT_PROJECT = "i4g-dev"
 DEFAULT_REGION = "us-central1"
 DEFAULT_REPORT_DIR = REPO_ROOT / "data" / "reports" / "bootstrap_dev"
+DEFAULT_MAX_PARALLEL_JOBS = 4
+REPORT_LOG_TAIL_CHARS = 64 * 1024
+OUTPUT_TAIL_LINES = 2000
+# Marker that opens every digest cache file this module writes; files without it are never read or replaced.
+HASH_CACHE_MAGIC = "i4g-sha256-cache v1"
+# Environment-backed smoke defaults shared by the argparse and Typer entry points, resolved once at import.
+DEFAULT_SMOKE_API_URL = os.getenv("I4G_SMOKE_API_URL", "https://api.intelligenceforgood.org")
+DEFAULT_SMOKE_GATEWAY_URL = os.getenv("I4G_SMOKE_API_URL", "https://fastapi-gateway-y5jge5w2cq-uc.a.run.app")
+DEFAULT_SMOKE_TOKEN = os.getenv("I4G_SMOKE_TOKEN", "dev-analyst-token")
+DEFAULT_SMOKE_JOB = os.getenv("I4G_SMOKE_JOB", "process-intakes")
+DEFAULT_SMOKE_CONTAINER = os.getenv("I4G_SMOKE_CONTAINER", "container-0")
 DEFAULT_JOBS = {
     "firestore": "ingest-azure-snapshot",  # Main ingestion job (covers Firestore + Vector)
     "vertex": "",  # Skipped (included in ingest-azure-snapshot)
@@ -63,6 +80,11 @@ class JobSpec:
     job_name: str
     args: list[str]
     env: dict[str, str] | None = None
+    # Jobs run stage by stage; one-time jobs (stage 1) start after every ingestion job (stage 0) has finished.
+    stage: int = 0
+    # Jobs sharing a chain run in order (a bundle's Firestore ingest before its Vertex/SQL/BigQuery syncs); separate
+    # chains in the same stage may run concurrently. Defaults to the label, i.e. a chain of one.
+    chain: str | None = None
 
 
 @dataclass
@@ -135,22 +157,22 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--smoke-api-url",
-        default=os.getenv("I4G_SMOKE_API_URL", "https://api.intelligenceforgood.org"),
+        default=DEFAULT_SMOKE_API_URL,
         help="API base URL for smoke (default: dev gateway).",
     )
     parser.add_argument(
         "--smoke-token",
-        default=os.getenv("I4G_SMOKE_TOKEN", "dev-analyst-token"),
+        default=DEFAULT_SMOKE_TOKEN,
         help="API token for smoke requests.",
     )
     parser.add_argument(
         "--smoke-job",
-        default=os.getenv("I4G_SMOKE_JOB", "process-intakes"),
+        default=DEFAULT_SMOKE_JOB,
         help="Cloud Run job to execute for intake smoke.",
     )
     parser.add_argument(
         "--smoke-container",
-        default=os.getenv("I4G_SMOKE_CONTAINER", "container-0"),
+        default=DEFAULT_SMOKE_CONTAINER,
         help="Container name for the smoke job.",
     )
     parser.add_argument(
@@ -164,6 +186,18 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         default=0.0,
         help="Delay in seconds between records during ingestion (for rate limiting).",
     )
+    parser.add_argument(
+        "--no-hash-cache",
+        dest="hash_cache",
+        action="store_false",
+        help="Always rehash a local --bundle-uri instead of reusing its cached digest.",
+    )
+    parser.add_argument(
+        "--max-parallel-jobs",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL_JOBS,
+        help="Maximum Cloud Run jobs to execute concurrently within a stage.",
+    )
     parser.add_argument("--run-dossier-smoke", action="store_true", help="Run dossier verification smoke via API.")
     parser.add_argument("--run-search-smoke", action="store_true", help="Run Vertex search smoke after bootstrap.")
     parser.add_argument("--search-project", help="Vertex project for search smoke (defaults to --project).")
@@ -202,16 +236,57 @@ def guard_environment(project: str, force: bool) -> None:
     logging.info("Guardrails: project=%s region=%s I4G_ENV=%s", project, DEFAULT_REGION, settings.env)
 
 
-def _file_sha256(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+def _hash_cache_path(path: Path) -> Path:
+    """Return the hidden digest cache file kept next to ``path``.
+
+    The name is private to this module so it never collides with a ``sha256sum``-style ``<name>.sha256`` file.
+    """
+
+    return path.with_name(f".{path.name}.i4g-sha256")
 
 
-def summarize_bundle(bundle_uri: str | None) -> tuple[str | None, str | None]:
-    """Return bundle URI and sha256 if the URI points to a local file."""
+def _cached_sha256(path: Path) -> str:
+    """Return the sha256 of ``path``, reusing a cache entry recorded for the same size and mtime.
+
+    The cache file holds a single ``"<magic> <size> <mtime_ns> <digest>"`` line and is rewritten (atomically) when the
+    file has changed. A file at the cache path that lacks the magic marker was not written here, so it is neither
+    trusted nor overwritten. Failing to write the cache only costs the next run a rehash.
+    """
+
+    stat = path.stat()
+    key = f"{HASH_CACHE_MAGIC} {stat.st_size} {stat.st_mtime_ns}"
+    cache_path = _hash_cache_path(path)
+    try:
+        cached = cache_path.read_text().strip()
+    except FileNotFoundError:
+        cached = None
+    except (OSError, UnicodeDecodeError):
+        cached = ""
+    if cached:
+        prefix, _, digest = cached.rpartition(" ")
+        if prefix == key and digest:
+            return digest
+
+    digest = hash_file(path)
+    if cached is not None and not cached.startswith(HASH_CACHE_MAGIC):
+        logging.debug("Leaving %s untouched; it is not an i4g hash cache.", cache_path)
+        return digest
+    try:
+        fd, staging = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+        with os.fdopen(fd, "w") as handle:
+            handle.write(f"{key} {digest}\n")
+        os.replace(staging, cache_path)
+    except OSError as exc:
+        logging.debug("Could not write hash cache %s: %s", cache_path, exc)
+    return digest
+
+
+def summarize_bundle(bundle_uri: str | None, *, use_cache: bool = True) -> tuple[str | None, str | None]:
+    """Return bundle URI and sha256 if the URI points to a local file.
+
+    With ``use_cache`` the digest is read from (and recorded in) a hidden cache file next to the bundle, so repeated
+    runs against an unchanged file skip rehashing it.
+    """
 
     if not bundle_uri:
         return None, None
@@ -221,7 +296,7 @@ def summarize_bundle(bundle_uri: str | None) -> tuple[str | None, str | None]:
     # unless it's a local file.
     candidate = Path(bundle_uri)
     if candidate.is_file():
-        return str(candidate), hash_file(candidate)
+        return str(candidate), _cached_sha256(candidate) if use_cache else hash_file(candidate)
     return bundle_uri, None
 
 
@@ -230,39 +305,58 @@ def _file_sha256(path: Path) -> str:
     return hash_file(path)
 
 
+REDACTED_FLAGS = frozenset({"--impersonate-service-account"})
+
+
 def format_command(cmd: Sequence[str], redacted_flags: Iterable[str] | None = None) -> str:
-    redacted_flags = set(redacted_flags or [])
+    flags = redacted_flags if isinstance(redacted_flags, frozenset) else frozenset(redacted_flags or ())
     rendered: List[str] = []
-    for idx, token in enumerate(cmd):
-        if token in redacted_flags:
+    redact_next = False
+    for token in cmd:
+        is_flag = token in flags
+        if is_flag:
             rendered.append(f"{token} <redacted>")
-            continue
-        if idx > 0 and cmd[idx - 1] in redacted_flags:
+        elif redact_next:
             rendered.append("<redacted>")
-            continue
-        rendered.append(token)
+        else:
+            rendered.append(token)
+        redact_next = is_flag
     return " ".join(rendered)
 
 
-def run_command(cmd: Sequence[str], *, dry_run: bool) -> subprocess.CompletedProcess[str] | None:
-    logging.info(
-        "Executing: %s",
-        format_command(cmd, redacted_flags={"--impersonate-service-account"}),
-    )
-    if dry_run:
-        logging.info("Dry-run enabled; command not executed.")
-        return None
+def _run_streaming(cmd: Sequence[str], *, env: dict[str, str] | None = None) -> subprocess.CompletedProcess[str]:
+    """Run ``cmd``, forwarding output to the log as it arrives and keeping only the last lines of each stream.
 
-    try:
-        return subprocess.run(cmd, check=True, capture_output=True, text=True)
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - subprocess failure path
-        stdout = (exc.stdout or "").strip()
-        stderr = (exc.stderr or "").strip()
-        if stdout:
-            logging.error("Command stdout:\n%s", stdout)
-        if stderr:
-            logging.error("Command stderr:\n%s", stderr)
-        raise
+    Memory stays bounded by ``OUTPUT_TAIL_LINES`` per stream however much the command prints.
+
+    Raises:
+        subprocess.CalledProcessError: When the command exits non-zero; ``stdout``/``stderr`` carry the tails.
+    """
+
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
+    tails: tuple[deque[str], deque[str]] = (deque(maxlen=OUTPUT_TAIL_LINES), deque(maxlen=OUTPUT_TAIL_LINES))
+
+    def _pump(stream: IO[str], tail: deque[str]) -> None:
+        with stream:
+            for line in stream:
+                line = line.rstrip("\n")
+                tail.append(line)
+                logging.debug("  | %s", line)
+
+    readers = [
+        threading.Thread(target=_pump, args=(stream, tail), daemon=True)
+        for stream, tail in zip((proc.stdout, proc.stderr), tails)
+    ]
+    for reader in readers:
+        reader.start()
+    returncode = proc.wait()
+    for reader in readers:
+        reader.join()
+
+    stdout, stderr = ("\n".join(tail) for tail in tails)
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, list(cmd), output=stdout, stderr=stderr)
+    return subprocess.CompletedProcess(list(cmd), returncode, stdout, stderr)
 
 
 def build_job_specs(args: argparse.Namespace) -> list[JobSpec]:
@@ -297,16 +391,30 @@ def build_job_specs(args: argparse.Namespace) -> list[JobSpec]:
 
         if not args.skip_firestore and args.firestore_job:
             specs.append(
-                JobSpec(label=f"firestore-{bundle_name}", job_name=args.firestore_job, args=job_args, env=ingest_env)
+                JobSpec(
+                    label=f"firestore-{bundle_name}",
+                    job_name=args.firestore_job,
+                    args=job_args,
+                    env=ingest_env,
+                    chain=bundle_uri,
+                )
             )
         if not args.skip_vertex and args.vertex_job:
             specs.append(
-                JobSpec(label=f"vertex-{bundle_name}", job_name=args.vertex_job, args=job_args, env=ingest_env)
+                JobSpec(
+                    label=f"vertex-{bundle_name}",
+                    job_name=args.vertex_job,
+                    args=job_args,
+                    env=ingest_env,
+                    chain=bundle_uri,
+                )
             )
         if not args.skip_sql and args.sql_job:
-            specs.append(JobSpec(label=f"sql-{bundle_name}", job_name=args.sql_job, args=job_args))
+            specs.append(JobSpec(label=f"sql-{bundle_name}", job_name=args.sql_job, args=job_args, chain=bundle_uri))
         if not args.skip_bigquery and args.bigquery_job:
-            specs.append(JobSpec(label=f"bigquery-{bundle_name}", job_name=args.bigquery_job, args=job_args))
+            specs.append(
+                JobSpec(label=f"bigquery-{bundle_name}", job_name=args.bigquery_job, args=job_args, chain=bundle_uri)
+            )
 
     # One-time jobs (run once)
     common_args: list[str] = []
@@ -317,11 +425,11 @@ def build_job_specs(args: argparse.Namespace) -> list[JobSpec]:
     # Probably none.
 
     if not args.skip_gcs_assets and args.gcs_assets_job:
-        specs.append(JobSpec(label="gcs_assets", job_name=args.gcs_assets_job, args=common_args))
+        specs.append(JobSpec(label="gcs_assets", job_name=args.gcs_assets_job, args=common_args, stage=1))
     if not args.skip_reports and args.reports_job:
-        specs.append(JobSpec(label="reports", job_name=args.reports_job, args=common_args))
+        specs.append(JobSpec(label="reports", job_name=args.reports_job, args=common_args, stage=1))
     if not args.skip_saved_searches and args.saved_searches_job:
-        specs.append(JobSpec(label="saved_searches", job_name=args.saved_searches_job, args=common_args))
+        specs.append(JobSpec(label="saved_searches", job_name=args.saved_searches_job, args=common_args, stage=1))
 
     return specs
 
@@ -352,7 +460,7 @@ def execute_job(spec: JobSpec, args: argparse.Namespace) -> JobResult:
         env_pairs = [f"{k}={v}" for k, v in spec.env.items()]
         cmd_display.append(f"--update-env-vars={','.join(env_pairs)}")
 
-    command_str = format_command(cmd_display, redacted_flags={"--impersonate-service-account"})
+    command_str = format_command(cmd_display, redacted_flags=REDACTED_FLAGS)
     logging.info("Executing (API): %s", command_str)
 
     if args.dry_run:
@@ -454,6 +562,32 @@ def execute_job(spec: JobSpec, args: argparse.Namespace) -> JobResult:
         )
 
 
+def execute_jobs(specs: Sequence[JobSpec], args: argparse.Namespace) -> list[JobResult]:
+    """Execute ``specs`` stage by stage, running up to ``args.max_parallel_jobs`` chains of a stage concurrently.
+
+    Jobs within a chain run one after another, so a bundle's syncs never start before its ingest finishes. Results
+    keep the order of ``specs``. Dry runs execute serially so the logged commands stay in order.
+    """
+
+    workers = 1 if args.dry_run else max(1, args.max_parallel_jobs)
+    results: list[JobResult] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _, stage in groupby(specs, key=attrgetter("stage")):
+            stage_specs = list(stage)
+            chains: dict[str, list[int]] = {}
+            for index, spec in enumerate(stage_specs):
+                chains.setdefault(spec.chain or spec.label, []).append(index)
+            stage_results: list[JobResult | None] = [None] * len(stage_specs)
+
+            def _run_chain(indices: list[int]) -> None:
+                for index in indices:
+                    stage_results[index] = execute_job(stage_specs[index], args)
+
+            list(executor.map(_run_chain, chains.values()))
+            results.extend(stage_results)
+    return results
+
+
 def _get_iap_token(project: str, service_account: str | None) -> str | None:
     """Fetch an IAP-compatible ID token by looking up the backend service audience."""
     # Always use the runtime SA for IAP access as it has the correct permissions
@@ -521,11 +655,12 @@ def _get_iap_token(project: str, service_account: str | None) -> str | None:
 
 
 def run_smoke(args: argparse.Namespace) -> SmokeResult:
-    from i4g.cli import smoke
+    from i4g.cli.smoke import CloudRunSmokeArgs
+    from i4g.cli.smoke import runner as smoke
 
     iap_token = _get_iap_token(args.project, args.wif_service_account)
 
-    smoke_args = SimpleNamespace(
+    smoke_args = CloudRunSmokeArgs(
         api_url=args.smoke_api_url,
         token=args.smoke_token,
         project=args.project,
@@ -704,6 +839,14 @@ def verify_cloud_state(args: argparse.Namespace) -> VerificationReport:
     )
 
 
+def _log_tail(text: str) -> str:
+    """Keep the last ``REPORT_LOG_TAIL_CHARS`` characters of job output so one noisy job cannot bloat the report."""
+
+    if len(text) <= REPORT_LOG_TAIL_CHARS:
+        return text
+    return "…truncated…\n" + text[-REPORT_LOG_TAIL_CHARS:]
+
+
 def write_reports(
     results: list[JobResult],
     smoke_result: SmokeResult | None,
@@ -740,8 +883,8 @@ def write_reports(
                 "job_name": r.job_name,
                 "status": r.status,
                 "command": r.command,
-                "stdout": r.stdout,
-                "stderr": r.stderr,
+                "stdout": _log_tail(r.stdout),
+                "stderr": _log_tail(r.stderr),
                 "error": r.error,
             }
             for r in results
@@ -753,7 +896,7 @@ def write_reports(
     }
 
     json_path = args.report_dir / "report.json"
-    json_path.write_text(json.dumps(report, indent=2, sort_keys=True))
+    json_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
 
     lines = [
         f"# Dev bootstrap report ({timestamp})",
@@ -792,7 +935,9 @@ def write_reports(
     (args.report_dir / "report.md").write_text("\n".join(lines))
 
     # Write verify.json and verify.md using VerificationReport
-    (args.report_dir / "verify.json").write_text(json.dumps(verification_report.to_dict(), indent=2, sort_keys=True))
+    (args.report_dir / "verify.json").write_bytes(
+        orjson.dumps(verification_report.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    )
 
     verify_lines = [
         f"# Dev Bootstrap Verification ({timestamp})",
@@ -923,7 +1068,7 @@ def run_local_ingest(args: argparse.Namespace) -> list[JobResult]:
                 logging.info("[dry-run] Would run: %s", command_str)
                 results.append(JobResult("ingest", "local-ingest", command_str, "skipped", "<dry-run>", "", None))
             else:
-                proc = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+                proc = _run_streaming(cmd, env=env)
                 results.append(
                     JobResult("ingest", "local-ingest", command_str, "success", proc.stdout, proc.stderr, None)
                 )
@@ -949,7 +1094,7 @@ def run_local_ingest(args: argparse.Namespace) -> list[JobResult]:
                 logging.info("[dry-run] Would run: %s", command_str)
                 results.append(JobResult("reports", "local-reports", command_str, "skipped", "<dry-run>", "", None))
             else:
-                proc = subprocess.run(cmd, env=env, capture_output=True, text=True, check=True)
+                proc = _run_streaming(cmd, env=env)
                 results.append(
                     JobResult("reports", "local-reports", command_str, "success", proc.stdout, proc.stderr, None)
                 )
@@ -971,7 +1116,7 @@ def bootstrap_dev(args: argparse.Namespace) -> int:
     if not args.search_location:
         args.search_location = "global"
 
-    bundle_uri_display, bundle_sha = summarize_bundle(args.bundle_uri)
+    bundle_uri_display, bundle_sha = summarize_bundle(args.bundle_uri, use_cache=args.hash_cache)
     if bundle_uri_display:
         logging.info("Bundle URI: %s", bundle_uri_display)
     if bundle_sha:
@@ -1000,26 +1145,7 @@ def bootstrap_dev(args: argparse.Namespace) -> int:
 
         results = []
         if not args.verify_only:
-            for spec in specs:
-                try:
-                    results.append(execute_job(spec, args))
-                except subprocess.CalledProcessError as exc:
-                    results.append(
-                        JobResult(
-                            label=spec.label,
-                            job_name=spec.job_name,
-                            command=format_command(
-                                ["gcloud", "run", "jobs", "execute", spec.job_name],
-                                redacted_flags={"--impersonate-service-account"},
-                            ),
-                            status="failed",
-                            stdout=exc.stdout or "",
-                            stderr=exc.stderr or "",
-                            error=str(exc),
-                        )
-                    )
-                    write_reports(results, None, None, None, args)
-                    return 1
+            results = execute_jobs(specs, args)
         else:
             logging.info("verify-only set; skipping job execution.")
 
@@ -1097,6 +1223,8 @@ def run_dev(
     local_execution: bool = False,
     limit: int = 0,
     rate_limit_delay: float = 0.0,
+    max_parallel_jobs: int = DEFAULT_MAX_PARALLEL_JOBS,
+    hash_cache: bool = True,
 ) -> int:
     args = argparse.Namespace(
         project=project,
@@ -1105,6 +1233,8 @@ def run_dev(
         dataset=dataset,
         limit=limit,
         rate_limit_delay=rate_limit_delay,
+        max_parallel_jobs=max_parallel_jobs,
+        hash_cache=hash_cache,
         wif_service_account=wif_service_account,
         firestore_job=firestore_job,
         vertex_job=vertex_job,
@@ -1186,476 +1316,295 @@ def main(argv: Sequence[str] | None = None) -> int:
         local_execution=args.local_execution,
         limit=args.limit,
         rate_limit_delay=args.rate_limit_delay,
+        max_parallel_jobs=args.max_parallel_jobs,
+        hash_cache=args.hash_cache,
     )
 
 
 dev_app = typer.Typer(help="Bootstrap dev via Cloud Run jobs and optional smokes.")
 
+# Options shared by the reset/load/verify/smoke commands, declared once.
+_Project = Annotated[str, typer.Option("--project", help="Target GCP project (default: i4g-dev).")]
+_Region = Annotated[str, typer.Option("--region", help="Cloud Run region (default: us-central1).")]
+_BundleUri = Annotated[Optional[str], typer.Option("--bundle-uri", help="Bundle URI passed to jobs, if supported.")]
+_Dataset = Annotated[Optional[str], typer.Option("--dataset", help="Dataset identifier injected into job args.")]
+_Limit = Annotated[int, typer.Option("--limit", help="Limit the number of records to ingest (0 = unlimited).")]
+_WifServiceAccount = Annotated[
+    str, typer.Option("--wif-service-account", help="Service account to impersonate via WIF.")
+]
+_FirestoreJob = Annotated[str, typer.Option("--firestore-job", help="Firestore refresh job.", hidden=True)]
+_VertexJob = Annotated[str, typer.Option("--vertex-job", help="Vertex import job.", hidden=True)]
+_SqlJob = Annotated[str, typer.Option("--sql-job", help="SQL/Firestore sync job.", hidden=True)]
+_BigqueryJob = Annotated[str, typer.Option("--bigquery-job", help="BigQuery refresh job.", hidden=True)]
+_GcsAssetsJob = Annotated[str, typer.Option("--gcs-assets-job", help="GCS asset sync job.", hidden=True)]
+_ReportsJob = Annotated[str, typer.Option("--reports-job", help="Reports/dossiers job.", hidden=True)]
+_SavedSearchesJob = Annotated[
+    str, typer.Option("--saved-searches-job", help="Saved searches/tag presets job.", hidden=True)
+]
+# verify shows the job-name options in --help; reset/load keep them hidden.
+_VerifyFirestoreJob = Annotated[str, typer.Option("--firestore-job", help="Firestore refresh job.")]
+_VerifyVertexJob = Annotated[str, typer.Option("--vertex-job", help="Vertex import job.")]
+_VerifySqlJob = Annotated[str, typer.Option("--sql-job", help="SQL/Firestore sync job.")]
+_VerifyBigqueryJob = Annotated[str, typer.Option("--bigquery-job", help="BigQuery refresh job.")]
+_VerifyGcsAssetsJob = Annotated[str, typer.Option("--gcs-assets-job", help="GCS asset sync job.")]
+_VerifyReportsJob = Annotated[str, typer.Option("--reports-job", help="Reports/dossiers job.")]
+_VerifySavedSearchesJob = Annotated[str, typer.Option("--saved-searches-job", help="Saved searches/tag presets job.")]
+_SkipFirestore = Annotated[bool, typer.Option("--skip-firestore", help="Skip Firestore refresh job.")]
+_SkipVertex = Annotated[bool, typer.Option("--skip-vertex", help="Skip Vertex import job.")]
+_SkipVector = Annotated[bool, typer.Option("--skip-vector", help="Alias for --skip-vertex (for local parity).")]
+_SkipSql = Annotated[bool, typer.Option("--skip-sql", help="Skip SQL/Firestore sync job.")]
+_SkipBigquery = Annotated[bool, typer.Option("--skip-bigquery", help="Skip BigQuery refresh job.")]
+_SkipGcsAssets = Annotated[bool, typer.Option("--skip-gcs-assets", help="Skip GCS asset sync job.")]
+_SkipReports = Annotated[bool, typer.Option("--skip-reports", help="Skip reports/dossiers job.")]
+_SkipSavedSearches = Annotated[bool, typer.Option("--skip-saved-searches", help="Skip saved searches job.")]
+_DryRun = Annotated[bool, typer.Option("--dry-run", help="Print planned commands without executing.")]
+_RunSmoke = Annotated[bool, typer.Option("--run-smoke/--no-run-smoke", help="Run Cloud Run intake smoke.")]
+_RunDossierSmoke = Annotated[
+    bool, typer.Option("--run-dossier-smoke/--no-run-dossier-smoke", help="Run dossier verification smoke.")
+]
+_RunSearchSmoke = Annotated[
+    bool, typer.Option("--run-search-smoke/--no-run-search-smoke", help="Run Vertex search smoke.")
+]
+_SearchProject = Annotated[
+    Optional[str], typer.Option("--search-project", help="Vertex project for search smoke (defaults to --project).")
+]
+_SearchLocation = Annotated[
+    Optional[str],
+    typer.Option("--search-location", help="Vertex location for search smoke (default from orchestrator)."),
+]
+_SearchDataStoreId = Annotated[
+    Optional[str], typer.Option("--search-data-store-id", help="Vertex data store id for search smoke.")
+]
+_SearchServingConfigId = Annotated[
+    str, typer.Option("--search-serving-config-id", help="Vertex serving config id for search smoke.")
+]
+_SearchQuery = Annotated[str, typer.Option("--search-query", help="Search smoke query.")]
+_SearchPageSize = Annotated[int, typer.Option("--search-page-size", help="Result page size for search smoke.")]
+_ReportDir = Annotated[Path, typer.Option("--report-dir", help="Directory to write JSON/Markdown reports.")]
+_Force = Annotated[bool, typer.Option("--force", help="Allow targeting non-dev projects (never prod).")]
+_LogLevel = Annotated[str, typer.Option("--log-level", help="Logging verbosity (DEBUG/INFO/WARNING/ERROR).")]
+_SmokeApiUrl = Annotated[str, typer.Option("--smoke-api-url", help="API base URL for smoke.")]
+_SmokeToken = Annotated[str, typer.Option("--smoke-token", help="API token for smoke.")]
+_SmokeJob = Annotated[str, typer.Option("--smoke-job", help="Cloud Run job to execute for smoke.")]
+_SmokeContainer = Annotated[str, typer.Option("--smoke-container", help="Container for smoke job.")]
+_HiddenSmokeJob = Annotated[str, typer.Option("--smoke-job", help="Cloud Run job to execute for smoke.", hidden=True)]
+_HiddenSmokeContainer = Annotated[str, typer.Option("--smoke-container", help="Container for smoke job.", hidden=True)]
+_LocalExecution = Annotated[
+    bool, typer.Option("--local-execution", help="Run ingestion logic locally instead of triggering Cloud Run jobs.")
+]
+_RateLimitDelay = Annotated[
+    float,
+    typer.Option("--rate-limit-delay", help="Delay in seconds between records during ingestion (for rate limiting)."),
+]
+_HashCache = Annotated[
+    bool,
+    typer.Option(
+        "--hash-cache/--no-hash-cache",
+        help="Reuse the cached digest of a local --bundle-uri when its size and mtime are unchanged.",
+    ),
+]
+_MaxParallelJobs = Annotated[
+    int, typer.Option("--max-parallel-jobs", help="Maximum Cloud Run jobs to execute concurrently within a stage.")
+]
+
+
+# Fixed run_dev arguments for each command flavour; the command's own options are layered on top.
+_SKIP_ALL_JOBS = {
+    "skip_firestore": True,
+    "skip_vertex": True,
+    "skip_sql": True,
+    "skip_bigquery": True,
+    "skip_gcs_assets": True,
+    "skip_reports": True,
+    "skip_saved_searches": True,
+}
+_DEV_PRESETS: dict[str, dict[str, Any]] = {
+    "reset": {"verify_only": False},
+    "verify": {"verify_only": True, "dry_run": False, **dict.fromkeys(_SKIP_ALL_JOBS, False)},
+    "smoke": {
+        "verify_only": True,
+        "dry_run": False,
+        **_SKIP_ALL_JOBS,
+        "bundle_uri": None,
+        "dataset": None,
+        "wif_service_account": DEFAULT_WIF_SA,
+        **{f"{job}_job": "" for job in DEFAULT_JOBS},
+        "run_smoke": True,
+        "run_dossier_smoke": False,
+        "run_search_smoke": False,
+        "search_project": None,
+        "search_location": None,
+        "search_data_store_id": None,
+        "search_serving_config_id": None,
+        "search_query": "wallet address verification",
+        "search_page_size": 5,
+    },
+}
 
-def _exit_from_return(code: int | None) -> None:
-    """Honor integer return codes from invoked helpers."""
 
-    if isinstance(code, int) and code != 0:
-        raise typer.Exit(code)
+def _run_dev_preset(mode: str, **options: Any) -> None:
+    """Run ``run_dev`` with the ``mode`` preset plus command options, exiting with its return code.
+
+    Commands pass ``**locals()`` as their first statement, so every declared option is forwarded by name.
+    """
+
+    if options.pop("skip_vector", False):
+        options["skip_vertex"] = True
+    raise typer.Exit(run_dev(**{**_DEV_PRESETS[mode], **options}))
 
 
 @dev_app.command("reset", help="Run dev bootstrap jobs (Cloud Run) with optional smoke.")
 def bootstrap_dev_reset(
-    project: str = typer.Option(DEFAULT_PROJECT, "--project", help="Target GCP project (default: i4g-dev)."),
-    region: str = typer.Option(DEFAULT_REGION, "--region", help="Cloud Run region (default: us-central1)."),
-    bundle_uri: Optional[str] = typer.Option(None, "--bundle-uri", help="Bundle URI passed to jobs, if supported."),
-    dataset: Optional[str] = typer.Option(None, "--dataset", help="Dataset identifier injected into job args."),
-    limit: int = typer.Option(0, "--limit", help="Limit the number of records to ingest (0 = unlimited)."),
-    wif_service_account: str = typer.Option(
-        DEFAULT_WIF_SA,
-        "--wif-service-account",
-        help="Service account to impersonate via WIF.",
-    ),
-    firestore_job: str = typer.Option(
-        DEFAULT_JOBS["firestore"], "--firestore-job", help="Firestore refresh job.", hidden=True
-    ),
-    vertex_job: str = typer.Option(DEFAULT_JOBS["vertex"], "--vertex-job", help="Vertex import job.", hidden=True),
-    sql_job: str = typer.Option(DEFAULT_JOBS["sql"], "--sql-job", help="SQL/Firestore sync job.", hidden=True),
-    bigquery_job: str = typer.Option(
-        DEFAULT_JOBS["bigquery"], "--bigquery-job", help="BigQuery refresh job.", hidden=True
-    ),
-    gcs_assets_job: str = typer.Option(
-        DEFAULT_JOBS["gcs_assets"], "--gcs-assets-job", help="GCS asset sync job.", hidden=True
-    ),
-    reports_job: str = typer.Option(
-        DEFAULT_JOBS["reports"], "--reports-job", help="Reports/dossiers job.", hidden=True
-    ),
-    saved_searches_job: str = typer.Option(
-        DEFAULT_JOBS["saved_searches"], "--saved-searches-job", help="Saved searches/tag presets job.", hidden=True
-    ),
-    skip_firestore: bool = typer.Option(False, "--skip-firestore", help="Skip Firestore refresh job."),
-    skip_vertex: bool = typer.Option(False, "--skip-vertex", help="Skip Vertex import job."),
-    skip_vector: bool = typer.Option(False, "--skip-vector", help="Alias for --skip-vertex (for local parity)."),
-    skip_sql: bool = typer.Option(False, "--skip-sql", help="Skip SQL/Firestore sync job."),
-    skip_bigquery: bool = typer.Option(False, "--skip-bigquery", help="Skip BigQuery refresh job."),
-    skip_gcs_assets: bool = typer.Option(False, "--skip-gcs-assets", help="Skip GCS asset sync job."),
-    skip_reports: bool = typer.Option(False, "--skip-reports", help="Skip reports/dossiers job."),
-    skip_saved_searches: bool = typer.Option(False, "--skip-saved-searches", help="Skip saved searches job."),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Print planned commands without executing."),
-    run_smoke: bool = typer.Option(False, "--run-smoke/--no-run-smoke", help="Run Cloud Run intake smoke."),
-    run_dossier_smoke: bool = typer.Option(
-        False, "--run-dossier-smoke/--no-run-dossier-smoke", help="Run dossier verification smoke."
-    ),
-    run_search_smoke: bool = typer.Option(
-        False, "--run-search-smoke/--no-run-search-smoke", help="Run Vertex search smoke."
-    ),
-    search_project: Optional[str] = typer.Option(
-        None, "--search-project", help="Vertex project for search smoke (defaults to --project)."
-    ),
-    search_location: Optional[str] = typer.Option(
-        None, "--search-location", help="Vertex location for search smoke (default from orchestrator)."
-    ),
-    search_data_store_id: Optional[str] = typer.Option(
-        None, "--search-data-store-id", help="Vertex data store id for search smoke."
-    ),
-    search_serving_config_id: str = typer.Option(
-        "default_search", "--search-serving-config-id", help="Vertex serving config id for search smoke."
-    ),
-    search_query: str = typer.Option("wallet address verification", "--search-query", help="Search smoke query."),
-    search_page_size: int = typer.Option(5, "--search-page-size", help="Result page size for search smoke."),
-    report_dir: Path = typer.Option(
-        DEFAULT_REPORT_DIR, "--report-dir", help="Directory to write JSON/Markdown reports."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow targeting non-dev projects (never prod)."),
-    log_level: str = typer.Option("INFO", "--log-level", help="Logging verbosity (DEBUG/INFO/WARNING/ERROR)."),
-    smoke_api_url: str = typer.Option(
-        os.getenv("I4G_SMOKE_API_URL", "https://api.intelligenceforgood.org"),
-        "--smoke-api-url",
-        help="API base URL for smoke.",
-    ),
-    smoke_token: str = typer.Option(
-        os.getenv("I4G_SMOKE_TOKEN", "dev-analyst-token"), "--smoke-token", help="API token for smoke."
-    ),
-    smoke_job: str = typer.Option(
-        os.getenv("I4G_SMOKE_JOB", "process-intakes"),
-        "--smoke-job",
-        help="Cloud Run job to execute for smoke.",
-        hidden=True,
-    ),
-    smoke_container: str = typer.Option(
-        os.getenv("I4G_SMOKE_CONTAINER", "container-0"),
-        "--smoke-container",
-        help="Container for smoke job.",
-        hidden=True,
-    ),
-    local_execution: bool = typer.Option(
-        False, "--local-execution", help="Run ingestion logic locally instead of triggering Cloud Run jobs."
-    ),
-    rate_limit_delay: float = typer.Option(
-        0.0, "--rate-limit-delay", help="Delay in seconds between records during ingestion (for rate limiting)."
-    ),
+    project: _Project = DEFAULT_PROJECT,
+    region: _Region = DEFAULT_REGION,
+    bundle_uri: _BundleUri = None,
+    dataset: _Dataset = None,
+    limit: _Limit = 0,
+    wif_service_account: _WifServiceAccount = DEFAULT_WIF_SA,
+    firestore_job: _FirestoreJob = DEFAULT_JOBS["firestore"],
+    vertex_job: _VertexJob = DEFAULT_JOBS["vertex"],
+    sql_job: _SqlJob = DEFAULT_JOBS["sql"],
+    bigquery_job: _BigqueryJob = DEFAULT_JOBS["bigquery"],
+    gcs_assets_job: _GcsAssetsJob = DEFAULT_JOBS["gcs_assets"],
+    reports_job: _ReportsJob = DEFAULT_JOBS["reports"],
+    saved_searches_job: _SavedSearchesJob = DEFAULT_JOBS["saved_searches"],
+    skip_firestore: _SkipFirestore = False,
+    skip_vertex: _SkipVertex = False,
+    skip_vector: _SkipVector = False,
+    skip_sql: _SkipSql = False,
+    skip_bigquery: _SkipBigquery = False,
+    skip_gcs_assets: _SkipGcsAssets = False,
+    skip_reports: _SkipReports = False,
+    skip_saved_searches: _SkipSavedSearches = False,
+    dry_run: _DryRun = False,
+    run_smoke: _RunSmoke = False,
+    run_dossier_smoke: _RunDossierSmoke = False,
+    run_search_smoke: _RunSearchSmoke = False,
+    search_project: _SearchProject = None,
+    search_location: _SearchLocation = None,
+    search_data_store_id: _SearchDataStoreId = None,
+    search_serving_config_id: _SearchServingConfigId = "default_search",
+    search_query: _SearchQuery = "wallet address verification",
+    search_page_size: _SearchPageSize = 5,
+    report_dir: _ReportDir = DEFAULT_REPORT_DIR,
+    force: _Force = False,
+    log_level: _LogLevel = "INFO",
+    smoke_api_url: _SmokeApiUrl = DEFAULT_SMOKE_API_URL,
+    smoke_token: _SmokeToken = DEFAULT_SMOKE_TOKEN,
+    smoke_job: _HiddenSmokeJob = DEFAULT_SMOKE_JOB,
+    smoke_container: _HiddenSmokeContainer = DEFAULT_SMOKE_CONTAINER,
+    local_execution: _LocalExecution = False,
+    rate_limit_delay: _RateLimitDelay = 0.0,
+    max_parallel_jobs: _MaxParallelJobs = DEFAULT_MAX_PARALLEL_JOBS,
+    hash_cache: _HashCache = True,
 ) -> None:
     """Execute dev Cloud Run bootstrap jobs; optional smoke after run."""
 
-    if skip_vector:
-        skip_vertex = True
-
-    _exit_from_return(
-        run_dev(
-            project=project,
-            region=region,
-            bundle_uri=bundle_uri,
-            dataset=dataset,
-            wif_service_account=wif_service_account,
-            firestore_job=firestore_job,
-            vertex_job=vertex_job,
-            sql_job=sql_job,
-            bigquery_job=bigquery_job,
-            gcs_assets_job=gcs_assets_job,
-            reports_job=reports_job,
-            saved_searches_job=saved_searches_job,
-            skip_firestore=skip_firestore,
-            skip_vertex=skip_vertex,
-            skip_sql=skip_sql,
-            skip_bigquery=skip_bigquery,
-            skip_gcs_assets=skip_gcs_assets,
-            skip_reports=skip_reports,
-            skip_saved_searches=skip_saved_searches,
-            dry_run=dry_run,
-            verify_only=False,
-            run_smoke=run_smoke,
-            run_dossier_smoke=run_dossier_smoke,
-            run_search_smoke=run_search_smoke,
-            search_project=search_project,
-            search_location=search_location,
-            search_data_store_id=search_data_store_id,
-            search_serving_config_id=search_serving_config_id,
-            search_query=search_query,
-            search_page_size=search_page_size,
-            report_dir=report_dir,
-            force=force,
-            log_level=log_level,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_job=smoke_job,
-            smoke_container=smoke_container,
-            local_execution=local_execution,
-            limit=limit,
-            rate_limit_delay=rate_limit_delay,
-        )
-    )
+    _run_dev_preset("reset", **locals())
 
 
 @dev_app.command("load", help="Alias of reset for dev bootstrap jobs.")
 def bootstrap_dev_load(
-    project: str = typer.Option(DEFAULT_PROJECT, "--project", help="Target GCP project (default: i4g-dev)."),
-    region: str = typer.Option(DEFAULT_REGION, "--region", help="Cloud Run region (default: us-central1)."),
-    bundle_uri: Optional[str] = typer.Option(None, "--bundle-uri", help="Bundle URI passed to jobs, if supported."),
-    dataset: Optional[str] = typer.Option(None, "--dataset", help="Dataset identifier injected into job args."),
-    wif_service_account: str = typer.Option(
-        DEFAULT_WIF_SA,
-        "--wif-service-account",
-        help="Service account to impersonate via WIF.",
-    ),
-    firestore_job: str = typer.Option(
-        DEFAULT_JOBS["firestore"], "--firestore-job", help="Firestore refresh job.", hidden=True
-    ),
-    vertex_job: str = typer.Option(DEFAULT_JOBS["vertex"], "--vertex-job", help="Vertex import job.", hidden=True),
-    sql_job: str = typer.Option(DEFAULT_JOBS["sql"], "--sql-job", help="SQL/Firestore sync job.", hidden=True),
-    bigquery_job: str = typer.Option(
-        DEFAULT_JOBS["bigquery"], "--bigquery-job", help="BigQuery refresh job.", hidden=True
-    ),
-    gcs_assets_job: str = typer.Option(
-        DEFAULT_JOBS["gcs_assets"], "--gcs-assets-job", help="GCS asset sync job.", hidden=True
-    ),
-    reports_job: str = typer.Option(
-        DEFAULT_JOBS["reports"], "--reports-job", help="Reports/dossiers job.", hidden=True
-    ),
-    saved_searches_job: str = typer.Option(
-        DEFAULT_JOBS["saved_searches"], "--saved-searches-job", help="Saved searches/tag presets job.", hidden=True
-    ),
-    skip_firestore: bool = typer.Option(False, "--skip-firestore", help="Skip Firestore refresh job."),
-    skip_vertex: bool = typer.Option(False, "--skip-vertex", help="Skip Vertex import job."),
-    skip_vector: bool = typer.Option(False, "--skip-vector", help="Alias for --skip-vertex (for local parity)."),
-    skip_sql: bool = typer.Option(False, "--skip-sql", help="Skip SQL/Firestore sync job."),
-    skip_bigquery: bool = typer.Option(False, "--skip-bigquery", help="Skip BigQuery refresh job."),
-    skip_gcs_assets: bool = typer.Option(False, "--skip-gcs-assets", help="Skip GCS asset sync job."),
-    skip_reports: bool = typer.Option(False, "--skip-reports", help="Skip reports/dossiers job."),
-    skip_saved_searches: bool = typer.Option(False, "--skip-saved-searches", help="Skip saved searches job."),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Print planned commands without executing."),
-    run_smoke: bool = typer.Option(False, "--run-smoke/--no-run-smoke", help="Run Cloud Run intake smoke."),
-    run_dossier_smoke: bool = typer.Option(
-        False, "--run-dossier-smoke/--no-run-dossier-smoke", help="Run dossier verification smoke."
-    ),
-    run_search_smoke: bool = typer.Option(
-        False, "--run-search-smoke/--no-run-search-smoke", help="Run Vertex search smoke."
-    ),
-    search_project: Optional[str] = typer.Option(
-        None, "--search-project", help="Vertex project for search smoke (defaults to --project)."
-    ),
-    search_location: Optional[str] = typer.Option(
-        None, "--search-location", help="Vertex location for search smoke (default from orchestrator)."
-    ),
-    search_data_store_id: Optional[str] = typer.Option(
-        None, "--search-data-store-id", help="Vertex data store id for search smoke."
-    ),
-    search_serving_config_id: str = typer.Option(
-        "default_search", "--search-serving-config-id", help="Vertex serving config id for search smoke."
-    ),
-    search_query: str = typer.Option("wallet address verification", "--search-query", help="Search smoke query."),
-    search_page_size: int = typer.Option(5, "--search-page-size", help="Result page size for search smoke."),
-    report_dir: Path = typer.Option(
-        DEFAULT_REPORT_DIR, "--report-dir", help="Directory to write JSON/Markdown reports."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow targeting non-dev projects (never prod)."),
-    log_level: str = typer.Option("INFO", "--log-level", help="Logging verbosity (DEBUG/INFO/WARNING/ERROR)."),
-    smoke_api_url: str = typer.Option(
-        os.getenv("I4G_SMOKE_API_URL", "https://api.intelligenceforgood.org"),
-        "--smoke-api-url",
-        help="API base URL for smoke.",
-    ),
-    smoke_token: str = typer.Option(
-        os.getenv("I4G_SMOKE_TOKEN", "dev-analyst-token"), "--smoke-token", help="API token for smoke."
-    ),
-    smoke_job: str = typer.Option(
-        os.getenv("I4G_SMOKE_JOB", "process-intakes"),
-        "--smoke-job",
-        help="Cloud Run job to execute for smoke.",
-        hidden=True,
-    ),
-    smoke_container: str = typer.Option(
-        os.getenv("I4G_SMOKE_CONTAINER", "container-0"),
-        "--smoke-container",
-        help="Container for smoke job.",
-        hidden=True,
-    ),
-    local_execution: bool = typer.Option(
-        False, "--local-execution", help="Run ingestion logic locally instead of triggering Cloud Run jobs."
-    ),
-    limit: int = typer.Option(0, "--limit", help="Limit the number of records to ingest (0 = unlimited)."),
-    rate_limit_delay: float = typer.Option(
-        0.0, "--rate-limit-delay", help="Delay in seconds between records during ingestion (for rate limiting)."
-    ),
+    project: _Project = DEFAULT_PROJECT,
+    region: _Region = DEFAULT_REGION,
+    bundle_uri: _BundleUri = None,
+    dataset: _Dataset = None,
+    wif_service_account: _WifServiceAccount = DEFAULT_WIF_SA,
+    firestore_job: _FirestoreJob = DEFAULT_JOBS["firestore"],
+    vertex_job: _VertexJob = DEFAULT_JOBS["vertex"],
+    sql_job: _SqlJob = DEFAULT_JOBS["sql"],
+    bigquery_job: _BigqueryJob = DEFAULT_JOBS["bigquery"],
+    gcs_assets_job: _GcsAssetsJob = DEFAULT_JOBS["gcs_assets"],
+    reports_job: _ReportsJob = DEFAULT_JOBS["reports"],
+    saved_searches_job: _SavedSearchesJob = DEFAULT_JOBS["saved_searches"],
+    skip_firestore: _SkipFirestore = False,
+    skip_vertex: _SkipVertex = False,
+    skip_vector: _SkipVector = False,
+    skip_sql: _SkipSql = False,
+    skip_bigquery: _SkipBigquery = False,
+    skip_gcs_assets: _SkipGcsAssets = False,
+    skip_reports: _SkipReports = False,
+    skip_saved_searches: _SkipSavedSearches = False,
+    dry_run: _DryRun = False,
+    run_smoke: _RunSmoke = False,
+    run_dossier_smoke: _RunDossierSmoke = False,
+    run_search_smoke: _RunSearchSmoke = False,
+    search_project: _SearchProject = None,
+    search_location: _SearchLocation = None,
+    search_data_store_id: _SearchDataStoreId = None,
+    search_serving_config_id: _SearchServingConfigId = "default_search",
+    search_query: _SearchQuery = "wallet address verification",
+    search_page_size: _SearchPageSize = 5,
+    report_dir: _ReportDir = DEFAULT_REPORT_DIR,
+    force: _Force = False,
+    log_level: _LogLevel = "INFO",
+    smoke_api_url: _SmokeApiUrl = DEFAULT_SMOKE_API_URL,
+    smoke_token: _SmokeToken = DEFAULT_SMOKE_TOKEN,
+    smoke_job: _HiddenSmokeJob = DEFAULT_SMOKE_JOB,
+    smoke_container: _HiddenSmokeContainer = DEFAULT_SMOKE_CONTAINER,
+    local_execution: _LocalExecution = False,
+    limit: _Limit = 0,
+    rate_limit_delay: _RateLimitDelay = 0.0,
+    max_parallel_jobs: _MaxParallelJobs = DEFAULT_MAX_PARALLEL_JOBS,
+    hash_cache: _HashCache = True,
 ) -> None:
     """Alias of reset for dev bootstrap jobs (kept for symmetry)."""
 
-    if skip_vector:
-        skip_vertex = True
-
-    _exit_from_return(
-        run_dev(
-            project=project,
-            region=region,
-            bundle_uri=bundle_uri,
-            dataset=dataset,
-            wif_service_account=wif_service_account,
-            firestore_job=firestore_job,
-            vertex_job=vertex_job,
-            sql_job=sql_job,
-            bigquery_job=bigquery_job,
-            gcs_assets_job=gcs_assets_job,
-            reports_job=reports_job,
-            saved_searches_job=saved_searches_job,
-            skip_firestore=skip_firestore,
-            skip_vertex=skip_vertex,
-            skip_sql=skip_sql,
-            skip_bigquery=skip_bigquery,
-            skip_gcs_assets=skip_gcs_assets,
-            skip_reports=skip_reports,
-            skip_saved_searches=skip_saved_searches,
-            dry_run=dry_run,
-            verify_only=False,
-            run_smoke=run_smoke,
-            run_dossier_smoke=run_dossier_smoke,
-            run_search_smoke=run_search_smoke,
-            search_project=search_project,
-            search_location=search_location,
-            search_data_store_id=search_data_store_id,
-            search_serving_config_id=search_serving_config_id,
-            search_query=search_query,
-            search_page_size=search_page_size,
-            report_dir=report_dir,
-            force=force,
-            log_level=log_level,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_job=smoke_job,
-            smoke_container=smoke_container,
-            local_execution=local_execution,
-            limit=limit,
-            rate_limit_delay=rate_limit_delay,
-        )
-    )
+    _run_dev_preset("reset", **locals())
 
 
 @dev_app.command("verify", help="Run verification-only flow for dev (smoke optional).")
 def bootstrap_dev_verify(
-    project: str = typer.Option(DEFAULT_PROJECT, "--project", help="Target GCP project (default: i4g-dev)."),
-    region: str = typer.Option(DEFAULT_REGION, "--region", help="Cloud Run region (default: us-central1)."),
-    bundle_uri: Optional[str] = typer.Option(None, "--bundle-uri", help="Bundle URI passed to jobs, if supported."),
-    dataset: Optional[str] = typer.Option(None, "--dataset", help="Dataset identifier injected into job args."),
-    wif_service_account: str = typer.Option(
-        DEFAULT_WIF_SA,
-        "--wif-service-account",
-        help="Service account to impersonate via WIF.",
-    ),
-    firestore_job: str = typer.Option(DEFAULT_JOBS["firestore"], "--firestore-job", help="Firestore refresh job."),
-    vertex_job: str = typer.Option(DEFAULT_JOBS["vertex"], "--vertex-job", help="Vertex import job."),
-    sql_job: str = typer.Option(DEFAULT_JOBS["sql"], "--sql-job", help="SQL/Firestore sync job."),
-    bigquery_job: str = typer.Option(DEFAULT_JOBS["bigquery"], "--bigquery-job", help="BigQuery refresh job."),
-    gcs_assets_job: str = typer.Option(DEFAULT_JOBS["gcs_assets"], "--gcs-assets-job", help="GCS asset sync job."),
-    reports_job: str = typer.Option(DEFAULT_JOBS["reports"], "--reports-job", help="Reports/dossiers job."),
-    saved_searches_job: str = typer.Option(
-        DEFAULT_JOBS["saved_searches"], "--saved-searches-job", help="Saved searches/tag presets job."
-    ),
-    run_smoke: bool = typer.Option(True, "--run-smoke/--no-run-smoke", help="Run Cloud Run intake smoke."),
-    run_dossier_smoke: bool = typer.Option(
-        True, "--run-dossier-smoke/--no-run-dossier-smoke", help="Run dossier verification smoke."
-    ),
-    run_search_smoke: bool = typer.Option(
-        True, "--run-search-smoke/--no-run-search-smoke", help="Run Vertex search smoke."
-    ),
-    search_project: Optional[str] = typer.Option(
-        None, "--search-project", help="Vertex project for search smoke (defaults to --project)."
-    ),
-    search_location: Optional[str] = typer.Option(
-        None, "--search-location", help="Vertex location for search smoke (default from orchestrator)."
-    ),
-    search_data_store_id: Optional[str] = typer.Option(
-        None, "--search-data-store-id", help="Vertex data store id for search smoke."
-    ),
-    search_serving_config_id: str = typer.Option(
-        "default_search", "--search-serving-config-id", help="Vertex serving config id for search smoke."
-    ),
-    search_query: str = typer.Option("wallet address verification", "--search-query", help="Search smoke query."),
-    search_page_size: int = typer.Option(5, "--search-page-size", help="Result page size for search smoke."),
-    report_dir: Path = typer.Option(
-        DEFAULT_REPORT_DIR, "--report-dir", help="Directory to write JSON/Markdown reports."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow targeting non-dev projects (never prod)."),
-    log_level: str = typer.Option("INFO", "--log-level", help="Logging verbosity (DEBUG/INFO/WARNING/ERROR)."),
-    smoke_api_url: str = typer.Option(
-        os.getenv("I4G_SMOKE_API_URL", "https://api.intelligenceforgood.org"),
-        "--smoke-api-url",
-        help="API base URL for smoke.",
-    ),
-    smoke_token: str = typer.Option(
-        os.getenv("I4G_SMOKE_TOKEN", "dev-analyst-token"), "--smoke-token", help="API token for smoke."
-    ),
-    smoke_job: str = typer.Option(
-        os.getenv("I4G_SMOKE_JOB", "process-intakes"), "--smoke-job", help="Cloud Run job to execute for smoke."
-    ),
-    smoke_container: str = typer.Option(
-        os.getenv("I4G_SMOKE_CONTAINER", "container-0"), "--smoke-container", help="Container for smoke job."
-    ),
+    project: _Project = DEFAULT_PROJECT,
+    region: _Region = DEFAULT_REGION,
+    bundle_uri: _BundleUri = None,
+    dataset: _Dataset = None,
+    wif_service_account: _WifServiceAccount = DEFAULT_WIF_SA,
+    firestore_job: _VerifyFirestoreJob = DEFAULT_JOBS["firestore"],
+    vertex_job: _VerifyVertexJob = DEFAULT_JOBS["vertex"],
+    sql_job: _VerifySqlJob = DEFAULT_JOBS["sql"],
+    bigquery_job: _VerifyBigqueryJob = DEFAULT_JOBS["bigquery"],
+    gcs_assets_job: _VerifyGcsAssetsJob = DEFAULT_JOBS["gcs_assets"],
+    reports_job: _VerifyReportsJob = DEFAULT_JOBS["reports"],
+    saved_searches_job: _VerifySavedSearchesJob = DEFAULT_JOBS["saved_searches"],
+    run_smoke: _RunSmoke = True,
+    run_dossier_smoke: _RunDossierSmoke = True,
+    run_search_smoke: _RunSearchSmoke = True,
+    search_project: _SearchProject = None,
+    search_location: _SearchLocation = None,
+    search_data_store_id: _SearchDataStoreId = None,
+    search_serving_config_id: _SearchServingConfigId = "default_search",
+    search_query: _SearchQuery = "wallet address verification",
+    search_page_size: _SearchPageSize = 5,
+    report_dir: _ReportDir = DEFAULT_REPORT_DIR,
+    force: _Force = False,
+    log_level: _LogLevel = "INFO",
+    smoke_api_url: _SmokeApiUrl = DEFAULT_SMOKE_API_URL,
+    smoke_token: _SmokeToken = DEFAULT_SMOKE_TOKEN,
+    smoke_job: _SmokeJob = DEFAULT_SMOKE_JOB,
+    smoke_container: _SmokeContainer = DEFAULT_SMOKE_CONTAINER,
+    hash_cache: _HashCache = True,
 ) -> None:
     """Skip job execution and only run verification/smoke for dev."""
 
-    _exit_from_return(
-        run_dev(
-            project=project,
-            region=region,
-            bundle_uri=bundle_uri,
-            dataset=dataset,
-            wif_service_account=wif_service_account,
-            firestore_job=firestore_job,
-            vertex_job=vertex_job,
-            sql_job=sql_job,
-            bigquery_job=bigquery_job,
-            gcs_assets_job=gcs_assets_job,
-            reports_job=reports_job,
-            saved_searches_job=saved_searches_job,
-            skip_firestore=False,
-            skip_vertex=False,
-            skip_sql=False,
-            skip_bigquery=False,
-            skip_gcs_assets=False,
-            skip_reports=False,
-            skip_saved_searches=False,
-            dry_run=False,
-            verify_only=True,
-            run_smoke=run_smoke,
-            run_dossier_smoke=run_dossier_smoke,
-            run_search_smoke=run_search_smoke,
-            search_project=search_project,
-            search_location=search_location,
-            search_data_store_id=search_data_store_id,
-            search_serving_config_id=search_serving_config_id,
-            search_query=search_query,
-            search_page_size=search_page_size,
-            report_dir=report_dir,
-            force=force,
-            log_level=log_level,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_job=smoke_job,
-            smoke_container=smoke_container,
-        )
-    )
+    _run_dev_preset("verify", **locals())
 
 
 @dev_app.command("smoke", help="Run dev smoke only (no bootstrap jobs).")
 def bootstrap_dev_smoke(
-    project: str = typer.Option(DEFAULT_PROJECT, "--project", help="Target GCP project (default: i4g-dev)."),
-    region: str = typer.Option(DEFAULT_REGION, "--region", help="Cloud Run region (default: us-central1)."),
-    smoke_api_url: str = typer.Option(
-        os.getenv("I4G_SMOKE_API_URL", "https://fastapi-gateway-y5jge5w2cq-uc.a.run.app"),
-        "--smoke-api-url",
-        help="API base URL for smoke.",
-    ),
-    smoke_token: str = typer.Option(
-        os.getenv("I4G_SMOKE_TOKEN", "dev-analyst-token"), "--smoke-token", help="API token for smoke."
-    ),
-    smoke_job: str = typer.Option(
-        os.getenv("I4G_SMOKE_JOB", "process-intakes"), "--smoke-job", help="Cloud Run job to execute for smoke."
-    ),
-    smoke_container: str = typer.Option(
-        os.getenv("I4G_SMOKE_CONTAINER", "container-0"), "--smoke-container", help="Container for smoke job."
-    ),
-    report_dir: Path = typer.Option(
-        DEFAULT_REPORT_DIR, "--report-dir", help="Directory to write JSON/Markdown reports."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow targeting non-dev projects (never prod)."),
-    log_level: str = typer.Option("INFO", "--log-level", help="Logging verbosity (DEBUG/INFO/WARNING/ERROR)."),
+    project: _Project = DEFAULT_PROJECT,
+    region: _Region = DEFAULT_REGION,
+    smoke_api_url: _SmokeApiUrl = DEFAULT_SMOKE_GATEWAY_URL,
+    smoke_token: _SmokeToken = DEFAULT_SMOKE_TOKEN,
+    smoke_job: _SmokeJob = DEFAULT_SMOKE_JOB,
+    smoke_container: _SmokeContainer = DEFAULT_SMOKE_CONTAINER,
+    report_dir: _ReportDir = DEFAULT_REPORT_DIR,
+    force: _Force = False,
+    log_level: _LogLevel = "INFO",
 ) -> None:
     """Run only Cloud Run smoke checks without bootstrapping jobs."""
 
-    _exit_from_return(
-        run_dev(
-            project=project,
-            region=region,
-            bundle_uri=None,
-            dataset=None,
-            wif_service_account=DEFAULT_WIF_SA,
-            firestore_job="",
-            vertex_job="",
-            sql_job="",
-            bigquery_job="",
-            gcs_assets_job="",
-            reports_job="",
-            saved_searches_job="",
-            skip_firestore=True,
-            skip_vertex=True,
-            skip_sql=True,
-            skip_bigquery=True,
-            skip_gcs_assets=True,
-            skip_reports=True,
-            skip_saved_searches=True,
-            dry_run=False,
-            verify_only=True,
-            run_smoke=True,
-            run_dossier_smoke=False,
-            run_search_smoke=False,
-            search_project=None,
-            search_location=None,
-            search_data_store_id=None,
-            search_serving_config_id=None,
-            search_query="wallet address verification",
-            search_page_size=5,
-            report_dir=report_dir,
-            force=force,
-            log_level=log_level,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_job=smoke_job,
-            smoke_container=smoke_container,
-        )
-    )
+    _run_dev_preset("smoke", **locals())
 
 
 __all__ = ["run_dev", "main", "parse_args", "dev_app"]
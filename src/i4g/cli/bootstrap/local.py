@@ -3,22 +3,19 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import os
 import shutil
 import sqlite3
-import subprocess
 import sys
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Optional
+from typing import Annotated, Optional
 
 import typer
 
+from i4g._paths import PROJECT_ROOT
 from i4g.cli.utils import hash_file, stage_bundle
 from i4g.cli.bootstrap.common import (
-    get_bundles,
     download_bundles as common_download_bundles,
     run_search_smoke,
     run_dossier_smoke,
@@ -28,7 +25,7 @@ from i4g.cli.bootstrap.common import (
 )
 from datetime import datetime, timezone
 
-ROOT = Path(__file__).resolve().parents[4]
+ROOT = PROJECT_ROOT
 SRC_DIR = ROOT / "src"
 DATA_DIR = ROOT / "data"
 BUNDLES_DIR = DATA_DIR / "bundles"
@@ -216,17 +213,19 @@ def synthesize_screens() -> Path:
 
 
 def run_ocr() -> None:
+    from i4g.cli.extract import ExtractArgs
     from i4g.cli.extract import tasks as extract_tasks
 
-    exit_code = extract_tasks.ocr(SimpleNamespace(input=CHAT_SCREENS_DIR, output=OCR_OUTPUT))
+    exit_code = extract_tasks.ocr(ExtractArgs(input=CHAT_SCREENS_DIR, output=OCR_OUTPUT))
     if exit_code:
         raise RuntimeError(f"OCR failed with exit code {exit_code}")
 
 
 def run_semantic_extraction() -> None:
+    from i4g.cli.extract import SemanticExtractArgs
     from i4g.cli.extract import tasks as extract_tasks
 
-    exit_code = extract_tasks.semantic(SimpleNamespace(input=OCR_OUTPUT, output=SEMANTIC_OUTPUT, model="llama3.1"))
+    exit_code = extract_tasks.semantic(SemanticExtractArgs(input=OCR_OUTPUT, output=SEMANTIC_OUTPUT, model="llama3.1"))
     if exit_code:
         raise RuntimeError(f"Semantic extraction failed with exit code {exit_code}")
 
@@ -535,259 +534,227 @@ def run_local(
 
 local_app = typer.Typer(help="Bootstrap local sandbox data and verification smokes.")
 
-
-def _exit_from_return(code: int | None) -> None:
-    """Honor integer return codes from invoked helpers."""
-
-    if isinstance(code, int) and code != 0:
-        raise typer.Exit(code)
+# Options shared by the reset/load/verify/smoke commands, declared once.
+_SkipOcr = Annotated[bool, typer.Option("--skip-ocr", help="Skip generating chat screenshots and OCR.")]
+_SkipVector = Annotated[bool, typer.Option("--skip-vector", help="Skip rebuilding vector/structured stores.")]
+_BundleUri = Annotated[
+    Optional[str], typer.Option("--bundle-uri", help="Optional bundle JSONL path/URI to place into data/bundles.")
+]
+_DryRun = Annotated[bool, typer.Option("--dry-run", help="Print planned actions without mutating disk.")]
+_ReportDir = Annotated[Path, typer.Option("--report-dir", help="Verification report directory.")]
+_SmokeSearch = Annotated[bool, typer.Option("--smoke-search", help="Run Vertex search smoke after verification.")]
+_SearchProject = Annotated[
+    Optional[str], typer.Option("--search-project", help="Vertex project for search smoke (defaults to settings/env).")
+]
+_SearchLocation = Annotated[
+    Optional[str],
+    typer.Option("--search-location", help="Vertex location for search smoke (default from settings/env)."),
+]
+_SearchDataStoreId = Annotated[
+    Optional[str], typer.Option("--search-data-store-id", help="Vertex data store id for search smoke.")
+]
+_SearchServingConfigId = Annotated[
+    str, typer.Option("--search-serving-config-id", help="Vertex serving config id for search smoke.")
+]
+_SearchQuery = Annotated[str, typer.Option("--search-query", help="Search smoke query.")]
+_SearchPageSize = Annotated[int, typer.Option("--search-page-size", help="Search smoke page size.")]
+_SmokeDossiers = Annotated[bool, typer.Option("--smoke-dossiers", help="Run dossier verification smoke.")]
+_SmokeApiUrl = Annotated[
+    Optional[str],
+    typer.Option("--smoke-api-url", help="API base URL for dossier smoke (defaults to env or localhost)."),
+]
+_SmokeToken = Annotated[Optional[str], typer.Option("--smoke-token", help="API token for dossier smoke.")]
+_SmokeDossierStatus = Annotated[
+    str, typer.Option("--smoke-dossier-status", help="Queue status filter for dossier smoke.")
+]
+_SmokeDossierLimit = Annotated[int, typer.Option("--smoke-dossier-limit", help="Maximum dossiers to inspect.")]
+_SmokeDossierPlanId = Annotated[
+    Optional[str], typer.Option("--smoke-dossier-plan-id", help="Specific dossier plan_id to verify during smoke.")
+]
+_Force = Annotated[bool, typer.Option("--force", help="Allow running when I4G_ENV is not local.")]
 
 
 @local_app.command("reset", help="Wipe and reload local sandbox artifacts.")
 def bootstrap_local_reset(
-    skip_ocr: bool = typer.Option(False, "--skip-ocr", help="Skip generating chat screenshots and OCR."),
-    skip_vector: bool = typer.Option(False, "--skip-vector", help="Skip rebuilding vector/structured stores."),
-    bundle_uri: Optional[str] = typer.Option(
-        None, "--bundle-uri", help="Optional bundle JSONL path/URI to place into data/bundles."
-    ),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Print planned actions without mutating disk."),
-    report_dir: Path = typer.Option(REPORTS_DIR, "--report-dir", help="Verification report directory."),
-    smoke_search: bool = typer.Option(False, "--smoke-search", help="Run Vertex search smoke after verification."),
-    search_project: Optional[str] = typer.Option(
-        None, "--search-project", help="Vertex project for search smoke (defaults to settings/env)."
-    ),
-    search_location: Optional[str] = typer.Option(
-        None, "--search-location", help="Vertex location for search smoke (default from settings/env)."
-    ),
-    search_data_store_id: Optional[str] = typer.Option(
-        None, "--search-data-store-id", help="Vertex data store id for search smoke."
-    ),
-    search_serving_config_id: str = typer.Option(
-        "default_search", "--search-serving-config-id", help="Vertex serving config id for search smoke."
-    ),
-    search_query: str = typer.Option("wallet address verification", "--search-query", help="Search smoke query."),
-    search_page_size: int = typer.Option(5, "--search-page-size", help="Search smoke page size."),
-    smoke_dossiers: bool = typer.Option(False, "--smoke-dossiers", help="Run dossier verification smoke."),
-    smoke_api_url: Optional[str] = typer.Option(
-        None, "--smoke-api-url", help="API base URL for dossier smoke (defaults to env or localhost)."
-    ),
-    smoke_token: Optional[str] = typer.Option(None, "--smoke-token", help="API token for dossier smoke."),
-    smoke_dossier_status: str = typer.Option(
-        "completed", "--smoke-dossier-status", help="Queue status filter for dossier smoke."
-    ),
-    smoke_dossier_limit: int = typer.Option(5, "--smoke-dossier-limit", help="Maximum dossiers to inspect."),
-    smoke_dossier_plan_id: Optional[str] = typer.Option(
-        None, "--smoke-dossier-plan-id", help="Specific dossier plan_id to verify during smoke."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow running when I4G_ENV is not local."),
+    skip_ocr: _SkipOcr = False,
+    skip_vector: _SkipVector = False,
+    bundle_uri: _BundleUri = None,
+    dry_run: _DryRun = False,
+    report_dir: _ReportDir = REPORTS_DIR,
+    smoke_search: _SmokeSearch = False,
+    search_project: _SearchProject = None,
+    search_location: _SearchLocation = None,
+    search_data_store_id: _SearchDataStoreId = None,
+    search_serving_config_id: _SearchServingConfigId = "default_search",
+    search_query: _SearchQuery = "wallet address verification",
+    search_page_size: _SearchPageSize = 5,
+    smoke_dossiers: _SmokeDossiers = False,
+    smoke_api_url: _SmokeApiUrl = None,
+    smoke_token: _SmokeToken = None,
+    smoke_dossier_status: _SmokeDossierStatus = "completed",
+    smoke_dossier_limit: _SmokeDossierLimit = 5,
+    smoke_dossier_plan_id: _SmokeDossierPlanId = None,
+    force: _Force = False,
 ) -> None:
     """Reset local sandbox then reload sample data."""
 
-    _exit_from_return(
-        run_local(
-            reset=True,
-            skip_ocr=skip_ocr,
-            skip_vector=skip_vector,
-            bundle_uri=bundle_uri,
-            dry_run=dry_run,
-            verify_only=False,
-            report_dir=report_dir,
-            smoke_search=smoke_search,
-            search_project=search_project,
-            search_location=search_location,
-            search_data_store_id=search_data_store_id,
-            search_serving_config_id=search_serving_config_id,
-            search_query=search_query,
-            search_page_size=search_page_size,
-            smoke_dossiers=smoke_dossiers,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_dossier_status=smoke_dossier_status,
-            smoke_dossier_limit=smoke_dossier_limit,
-            smoke_dossier_plan_id=smoke_dossier_plan_id,
-            force=force,
-        )
+    run_local(
+        reset=True,
+        skip_ocr=skip_ocr,
+        skip_vector=skip_vector,
+        bundle_uri=bundle_uri,
+        dry_run=dry_run,
+        verify_only=False,
+        report_dir=report_dir,
+        smoke_search=smoke_search,
+        search_project=search_project,
+        search_location=search_location,
+        search_data_store_id=search_data_store_id,
+        search_serving_config_id=search_serving_config_id,
+        search_query=search_query,
+        search_page_size=search_page_size,
+        smoke_dossiers=smoke_dossiers,
+        smoke_api_url=smoke_api_url,
+        smoke_token=smoke_token,
+        smoke_dossier_status=smoke_dossier_status,
+        smoke_dossier_limit=smoke_dossier_limit,
+        smoke_dossier_plan_id=smoke_dossier_plan_id,
+        force=force,
     )
 
 
 @local_app.command("load", help="Refresh local sandbox without wiping artifacts.")
 def bootstrap_local_load(
-    skip_ocr: bool = typer.Option(False, "--skip-ocr", help="Skip generating chat screenshots and OCR."),
-    skip_vector: bool = typer.Option(False, "--skip-vector", help="Skip rebuilding vector/structured stores."),
-    bundle_uri: Optional[str] = typer.Option(
-        None, "--bundle-uri", help="Optional bundle JSONL path/URI to place into data/bundles."
-    ),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Print planned actions without mutating disk."),
-    report_dir: Path = typer.Option(REPORTS_DIR, "--report-dir", help="Verification report directory."),
-    smoke_search: bool = typer.Option(False, "--smoke-search", help="Run Vertex search smoke after verification."),
-    search_project: Optional[str] = typer.Option(
-        None, "--search-project", help="Vertex project for search smoke (defaults to settings/env)."
-    ),
-    search_location: Optional[str] = typer.Option(
-        None, "--search-location", help="Vertex location for search smoke (default from settings/env)."
-    ),
-    search_data_store_id: Optional[str] = typer.Option(
-        None, "--search-data-store-id", help="Vertex data store id for search smoke."
-    ),
-    search_serving_config_id: str = typer.Option(
-        "default_search", "--search-serving-config-id", help="Vertex serving config id for search smoke."
-    ),
-    search_query: str = typer.Option("wallet address verification", "--search-query", help="Search smoke query."),
-    search_page_size: int = typer.Option(5, "--search-page-size", help="Search smoke page size."),
-    smoke_dossiers: bool = typer.Option(False, "--smoke-dossiers", help="Run dossier verification smoke."),
-    smoke_api_url: Optional[str] = typer.Option(
-        None, "--smoke-api-url", help="API base URL for dossier smoke (defaults to env or localhost)."
-    ),
-    smoke_token: Optional[str] = typer.Option(None, "--smoke-token", help="API token for dossier smoke."),
-    smoke_dossier_status: str = typer.Option(
-        "completed", "--smoke-dossier-status", help="Queue status filter for dossier smoke."
-    ),
-    smoke_dossier_limit: int = typer.Option(5, "--smoke-dossier-limit", help="Maximum dossiers to inspect."),
-    smoke_dossier_plan_id: Optional[str] = typer.Option(
-        None, "--smoke-dossier-plan-id", help="Specific dossier plan_id to verify during smoke."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow running when I4G_ENV is not local."),
+    skip_ocr: _SkipOcr = False,
+    skip_vector: _SkipVector = False,
+    bundle_uri: _BundleUri = None,
+    dry_run: _DryRun = False,
+    report_dir: _ReportDir = REPORTS_DIR,
+    smoke_search: _SmokeSearch = False,
+    search_project: _SearchProject = None,
+    search_location: _SearchLocation = None,
+    search_data_store_id: _SearchDataStoreId = None,
+    search_serving_config_id: _SearchServingConfigId = "default_search",
+    search_query: _SearchQuery = "wallet address verification",
+    search_page_size: _SearchPageSize = 5,
+    smoke_dossiers: _SmokeDossiers = False,
+    smoke_api_url: _SmokeApiUrl = None,
+    smoke_token: _SmokeToken = None,
+    smoke_dossier_status: _SmokeDossierStatus = "completed",
+    smoke_dossier_limit: _SmokeDossierLimit = 5,
+    smoke_dossier_plan_id: _SmokeDossierPlanId = None,
+    force: _Force = False,
 ) -> None:
     """Refresh local sandbox data without a reset."""
 
-    _exit_from_return(
-        run_local(
-            reset=False,
-            skip_ocr=skip_ocr,
-            skip_vector=skip_vector,
-            bundle_uri=bundle_uri,
-            dry_run=dry_run,
-            verify_only=False,
-            report_dir=report_dir,
-            smoke_search=smoke_search,
-            search_project=search_project,
-            search_location=search_location,
-            search_data_store_id=search_data_store_id,
-            search_serving_config_id=search_serving_config_id,
-            search_query=search_query,
-            search_page_size=search_page_size,
-            smoke_dossiers=smoke_dossiers,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_dossier_status=smoke_dossier_status,
-            smoke_dossier_limit=smoke_dossier_limit,
-            smoke_dossier_plan_id=smoke_dossier_plan_id,
-            force=force,
-        )
+    run_local(
+        reset=False,
+        skip_ocr=skip_ocr,
+        skip_vector=skip_vector,
+        bundle_uri=bundle_uri,
+        dry_run=dry_run,
+        verify_only=False,
+        report_dir=report_dir,
+        smoke_search=smoke_search,
+        search_project=search_project,
+        search_location=search_location,
+        search_data_store_id=search_data_store_id,
+        search_serving_config_id=search_serving_config_id,
+        search_query=search_query,
+        search_page_size=search_page_size,
+        smoke_dossiers=smoke_dossiers,
+        smoke_api_url=smoke_api_url,
+        smoke_token=smoke_token,
+        smoke_dossier_status=smoke_dossier_status,
+        smoke_dossier_limit=smoke_dossier_limit,
+        smoke_dossier_plan_id=smoke_dossier_plan_id,
+        force=force,
     )
 
 
 @local_app.command("verify", help="Run verification only for the local sandbox.")
 def bootstrap_local_verify(
-    bundle_uri: Optional[str] = typer.Option(
-        None, "--bundle-uri", help="Optional bundle JSONL path/URI to place into data/bundles."
-    ),
-    report_dir: Path = typer.Option(REPORTS_DIR, "--report-dir", help="Verification report directory."),
-    smoke_search: bool = typer.Option(False, "--smoke-search", help="Run Vertex search smoke after verification."),
-    search_project: Optional[str] = typer.Option(
-        None, "--search-project", help="Vertex project for search smoke (defaults to settings/env)."
-    ),
-    search_location: Optional[str] = typer.Option(
-        None, "--search-location", help="Vertex location for search smoke (default from settings/env)."
-    ),
-    search_data_store_id: Optional[str] = typer.Option(
-        None, "--search-data-store-id", help="Vertex data store id for search smoke."
-    ),
-    search_serving_config_id: str = typer.Option(
-        "default_search", "--search-serving-config-id", help="Vertex serving config id for search smoke."
-    ),
-    search_query: str = typer.Option("wallet address verification", "--search-query", help="Search smoke query."),
-    search_page_size: int = typer.Option(5, "--search-page-size", help="Search smoke page size."),
-    smoke_dossiers: bool = typer.Option(False, "--smoke-dossiers", help="Run dossier verification smoke."),
-    smoke_api_url: Optional[str] = typer.Option(
-        None, "--smoke-api-url", help="API base URL for dossier smoke (defaults to env or localhost)."
-    ),
-    smoke_token: Optional[str] = typer.Option(None, "--smoke-token", help="API token for dossier smoke."),
-    smoke_dossier_status: str = typer.Option(
-        "completed", "--smoke-dossier-status", help="Queue status filter for dossier smoke."
-    ),
-    smoke_dossier_limit: int = typer.Option(5, "--smoke-dossier-limit", help="Maximum dossiers to inspect."),
-    smoke_dossier_plan_id: Optional[str] = typer.Option(
-        None, "--smoke-dossier-plan-id", help="Specific dossier plan_id to verify during smoke."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow running when I4G_ENV is not local."),
+    bundle_uri: _BundleUri = None,
+    report_dir: _ReportDir = REPORTS_DIR,
+    smoke_search: _SmokeSearch = False,
+    search_project: _SearchProject = None,
+    search_location: _SearchLocation = None,
+    search_data_store_id: _SearchDataStoreId = None,
+    search_serving_config_id: _SearchServingConfigId = "default_search",
+    search_query: _SearchQuery = "wallet address verification",
+    search_page_size: _SearchPageSize = 5,
+    smoke_dossiers: _SmokeDossiers = False,
+    smoke_api_url: _SmokeApiUrl = None,
+    smoke_token: _SmokeToken = None,
+    smoke_dossier_status: _SmokeDossierStatus = "completed",
+    smoke_dossier_limit: _SmokeDossierLimit = 5,
+    smoke_dossier_plan_id: _SmokeDossierPlanId = None,
+    force: _Force = False,
 ) -> None:
     """Emit local verification reports without regenerating data."""
 
-    _exit_from_return(
-        run_local(
-            reset=False,
-            skip_ocr=False,
-            skip_vector=False,
-            bundle_uri=bundle_uri,
-            dry_run=False,
-            verify_only=True,
-            report_dir=report_dir,
-            smoke_search=smoke_search,
-            search_project=search_project,
-            search_location=search_location,
-            search_data_store_id=search_data_store_id,
-            search_serving_config_id=search_serving_config_id,
-            search_query=search_query,
-            search_page_size=search_page_size,
-            smoke_dossiers=smoke_dossiers,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_dossier_status=smoke_dossier_status,
-            smoke_dossier_limit=smoke_dossier_limit,
-            smoke_dossier_plan_id=smoke_dossier_plan_id,
-            force=force,
-        )
+    run_local(
+        reset=False,
+        skip_ocr=False,
+        skip_vector=False,
+        bundle_uri=bundle_uri,
+        dry_run=False,
+        verify_only=True,
+        report_dir=report_dir,
+        smoke_search=smoke_search,
+        search_project=search_project,
+        search_location=search_location,
+        search_data_store_id=search_data_store_id,
+        search_serving_config_id=search_serving_config_id,
+        search_query=search_query,
+        search_page_size=search_page_size,
+        smoke_dossiers=smoke_dossiers,
+        smoke_api_url=smoke_api_url,
+        smoke_token=smoke_token,
+        smoke_dossier_status=smoke_dossier_status,
+        smoke_dossier_limit=smoke_dossier_limit,
+        smoke_dossier_plan_id=smoke_dossier_plan_id,
+        force=force,
     )
 
 
 @local_app.command("smoke", help="Alias for local verification-only checks.")
 def bootstrap_local_smoke(
-    bundle_uri: Optional[str] = typer.Option(
-        None, "--bundle-uri", help="Optional bundle JSONL path/URI to place into data/bundles."
-    ),
-    report_dir: Path = typer.Option(REPORTS_DIR, "--report-dir", help="Verification report directory."),
-    smoke_search: bool = typer.Option(False, "--smoke-search", help="Run Vertex search smoke after verification."),
-    smoke_dossiers: bool = typer.Option(False, "--smoke-dossiers", help="Run dossier verification smoke."),
-    smoke_api_url: Optional[str] = typer.Option(
-        None, "--smoke-api-url", help="API base URL for dossier smoke (defaults to env or localhost)."
-    ),
-    smoke_token: Optional[str] = typer.Option(None, "--smoke-token", help="API token for dossier smoke."),
-    smoke_dossier_status: str = typer.Option(
-        "completed", "--smoke-dossier-status", help="Queue status filter for dossier smoke."
-    ),
-    smoke_dossier_limit: int = typer.Option(5, "--smoke-dossier-limit", help="Maximum dossiers to inspect."),
-    smoke_dossier_plan_id: Optional[str] = typer.Option(
-        None, "--smoke-dossier-plan-id", help="Specific dossier plan_id to verify during smoke."
-    ),
-    force: bool = typer.Option(False, "--force", help="Allow running when I4G_ENV is not local."),
+    bundle_uri: _BundleUri = None,
+    report_dir: _ReportDir = REPORTS_DIR,
+    smoke_search: _SmokeSearch = False,
+    smoke_dossiers: _SmokeDossiers = False,
+    smoke_api_url: _SmokeApiUrl = None,
+    smoke_token: _SmokeToken = None,
+    smoke_dossier_status: _SmokeDossierStatus = "completed",
+    smoke_dossier_limit: _SmokeDossierLimit = 5,
+    smoke_dossier_plan_id: _SmokeDossierPlanId = None,
+    force: _Force = False,
 ) -> None:
     """Run local verification-only checks (smoke alias)."""
 
-    _exit_from_return(
-        run_local(
-            reset=False,
-            skip_ocr=False,
-            skip_vector=False,
-            bundle_uri=bundle_uri,
-            dry_run=False,
-            verify_only=True,
-            report_dir=report_dir,
-            smoke_search=smoke_search,
-            search_project=None,
-            search_location=None,
-            search_data_store_id=None,
-            search_serving_config_id="default_search",
-            search_query="wallet address verification",
-            search_page_size=5,
-            smoke_dossiers=smoke_dossiers,
-            smoke_api_url=smoke_api_url,
-            smoke_token=smoke_token,
-            smoke_dossier_status=smoke_dossier_status,
-            smoke_dossier_limit=smoke_dossier_limit,
-            smoke_dossier_plan_id=smoke_dossier_plan_id,
-            force=force,
-        )
+    run_local(
+        reset=False,
+        skip_ocr=False,
+        skip_vector=False,
+        bundle_uri=bundle_uri,
+        dry_run=False,
+        verify_only=True,
+        report_dir=report_dir,
+        smoke_search=smoke_search,
+        search_project=None,
+        search_location=None,
+        search_data_store_id=None,
+        search_serving_config_id="default_search",
+        search_query="wallet address verification",
+        search_page_size=5,
+        smoke_dossiers=smoke_dossiers,
+        smoke_api_url=smoke_api_url,
+        smoke_token=smoke_token,
+        smoke_dossier_status=smoke_dossier_status,
+        smoke_dossier_limit=smoke_dossier_limit,
+        smoke_dossier_plan_id=smoke_dossier_plan_id,
+        force=force,
     )
 
 
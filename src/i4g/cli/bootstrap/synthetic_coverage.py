@@ -6,7 +6,7 @@ import random
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Iterable, Optional, Sequence
+from typing import Any, Callable, Optional, Sequence
 
 import yaml
 
@@ -14,6 +14,7 @@ from i4g.cli.utils import write_jsonl
 
 ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 DATASET_ID = "synthetic_coverage"
+DEFAULT_OUTPUT_DIR = Path("data/bundles/synthetic_coverage")
 
 
 @dataclass
@@ -598,7 +599,7 @@ def write_manifest(
 
 
 def generate_bundle(
-    output_dir: Path = Path("data/bundles/synthetic_coverage"),
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
     seed: int = 1337,
     include: Optional[list[str]] = None,
     smoke: bool = False,
@@ -0,0 +1,45 @@
+"""Console-script entry point for the ``i4g`` CLI.
+
+``i4g --version`` is answered here before Typer, Click, Rich, or any command module is imported; every other
+invocation is handed to :data:`i4g.cli.app.app`.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import cache
+
+VERSION_FLAGS = ("--version", "-V")
+
+
+@cache
+def package_version() -> str:
+    """Return the installed ``i4g`` distribution version, or ``"unknown"`` when metadata is unavailable.
+
+    Looking up distribution metadata scans ``sys.path``, so it runs only when a version is actually requested and
+    at most once per process.
+    """
+
+    try:
+        from importlib.metadata import version
+
+        return version("i4g")
+    except Exception:
+        return "unknown"
+
+
+def main() -> None:
+    """Run the CLI, short-circuiting a bare version request."""
+
+    argv = sys.argv[1:]
+    if len(argv) == 1 and argv[0] in VERSION_FLAGS:
+        sys.stdout.write(f"i4g {package_version()}\n")
+        return
+
+    from i4g.cli.app import app
+
+    app()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,51 +2,76 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
 
 import typer
 
-from i4g.cli.extract import tasks
+DEFAULT_OCR_OUTPUT = Path("data/ocr_output.jsonl")
+DEFAULT_ENTITIES_OUTPUT = Path("data/entities.jsonl")
+DEFAULT_SEMANTIC_OUTPUT = Path("data/entities_semantic.jsonl")
 
 extract_app = typer.Typer(help="OCR and extraction pipelines.")
 
 
+@dataclass(frozen=True, slots=True)
+class ExtractArgs:
+    """Inputs for ``tasks.ocr`` and ``tasks.extraction``."""
+
+    input: Path
+    output: Path
+
+
+@dataclass(frozen=True, slots=True)
+class SemanticExtractArgs:
+    """Inputs for ``tasks.semantic``."""
+
+    input: Path
+    output: Path
+    model: str
+
+
 @extract_app.command("ocr", help="Run OCR pipeline against chat screenshots.")
 def extract_ocr(
     input_path: Path = typer.Option(..., "--input", exists=True, readable=True, help="Folder of images."),
-    output_path: Path = typer.Option(Path("data/ocr_output.jsonl"), "--output", help="Output JSONL path."),
+    output_path: Path = typer.Option(DEFAULT_OCR_OUTPUT, "--output", help="Output JSONL path."),
 ) -> None:
-    code = tasks.ocr(SimpleNamespace(input=input_path, output=output_path))
+    from i4g.cli.extract import tasks
+
+    code = tasks.ocr(ExtractArgs(input=input_path, output=output_path))
     if code:
         raise typer.Exit(code)
 
 
 @extract_app.command("extraction", help="Run extraction pipeline.")
 def extract_extraction(
-    input_path: Path = typer.Option(Path("data/ocr_output.jsonl"), "--input", help="OCR output JSONL."),
-    output_path: Path = typer.Option(Path("data/entities.jsonl"), "--output", help="Structured entities output."),
+    input_path: Path = typer.Option(DEFAULT_OCR_OUTPUT, "--input", help="OCR output JSONL."),
+    output_path: Path = typer.Option(DEFAULT_ENTITIES_OUTPUT, "--output", help="Structured entities output."),
 ) -> None:
-    code = tasks.extraction(SimpleNamespace(input=input_path, output=output_path))
+    from i4g.cli.extract import tasks
+
+    code = tasks.extraction(ExtractArgs(input=input_path, output=output_path))
     if code:
         raise typer.Exit(code)
 
 
 @extract_app.command("semantic", help="Run semantic extraction pipeline.")
 def extract_semantic(
-    input_path: Path = typer.Option(Path("data/ocr_output.jsonl"), "--input", help="OCR output JSONL."),
-    output_path: Path = typer.Option(
-        Path("data/entities_semantic.jsonl"), "--output", help="Semantic entities output."
-    ),
+    input_path: Path = typer.Option(DEFAULT_OCR_OUTPUT, "--input", help="OCR output JSONL."),
+    output_path: Path = typer.Option(DEFAULT_SEMANTIC_OUTPUT, "--output", help="Semantic entities output."),
     model: str = typer.Option("llama3.1", "--model", help="Semantic extractor model."),
 ) -> None:
-    code = tasks.semantic(SimpleNamespace(input=input_path, output=output_path, model=model))
+    from i4g.cli.extract import tasks
+
+    code = tasks.semantic(SemanticExtractArgs(input=input_path, output=output_path, model=model))
     if code:
         raise typer.Exit(code)
 
 
 @extract_app.command("lea-pilot", help="Run LEA pilot pipeline.")
 def extract_lea_pilot() -> None:
-    code = tasks.lea_pilot(SimpleNamespace())
+    from i4g.cli.extract import tasks
+
+    code = tasks.lea_pilot(None)
     if code:
         raise typer.Exit(code)
@@ -1,35 +1,68 @@
 import typer
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-from types import SimpleNamespace
-from . import logic as ingest
+from typing import Annotated, Optional
+
+from i4g.cli.options import DataStoreId, DiscoveryLocation, DiscoveryProject, Verbose
 
 ingest_app = typer.Typer(help="Ingestion utilities and helpers.")
 
 
+@dataclass(frozen=True, slots=True)
+class IngestBundlesArgs:
+    """Inputs for ``logic.ingest_bundles``."""
+
+    input: Path
+    limit: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class IngestVertexArgs:
+    """Inputs for ``logic.ingest_vertex_search``."""
+
+    project: Optional[str]
+    location: str
+    data_store_id: str
+    jsonl: Path | str
+    branch_id: str = "default_branch"
+    dataset: Optional[str] = None
+    batch_size: int = 50
+    reconcile_mode: str = "INCREMENTAL"
+    dry_run: bool = False
+    verbose: bool = False
+
+
 @ingest_app.command("bundles", help="Ingest bundle JSONL files.")
 def ingest_bundles(
-    input_path: Path = typer.Option(..., "--input", exists=True, readable=True, help="Path to JSONL bundle file."),
-    limit: int = typer.Option(0, "--limit", help="Optional limit on number of records (0 = all)."),
+    input_path: Annotated[Path, typer.Option("--input", exists=True, readable=True, help="Path to JSONL bundle file.")],
+    limit: Annotated[int, typer.Option("--limit", help="Optional limit on number of records (0 = all).")] = 0,
 ) -> None:
-    args = SimpleNamespace(input=input_path, limit=limit)
+    from . import logic as ingest
+
+    args = IngestBundlesArgs(input=input_path, limit=limit)
     ingest.ingest_bundles(args)
 
 
 @ingest_app.command("vertex", help="Ingest data into Vertex search.")
 def ingest_vertex(
-    project: Optional[str] = typer.Option(None, "--project", help="GCP project hosting the Discovery data store."),
-    location: str = typer.Option("global", "--location", help="Discovery location."),
-    data_store_id: str = typer.Option(..., "--data-store-id", help="Discovery data store identifier."),
-    jsonl: Path = typer.Option(..., "--jsonl", exists=True, readable=True, help="JSONL file of cases to ingest."),
-    branch_id: str = typer.Option("default_branch", "--branch-id", help="Branch to import documents into."),
-    dataset: Optional[str] = typer.Option(None, "--dataset", help="Dataset identifier injected when missing."),
-    batch_size: int = typer.Option(50, "--batch-size", help="Documents per import batch."),
-    reconcile_mode: str = typer.Option("INCREMENTAL", "--reconcile-mode", help="Reconciliation mode."),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Preview first record without API calls."),
-    verbose: bool = typer.Option(False, "--verbose", help="Enable debug logging."),
+    project: DiscoveryProject = None,
+    location: DiscoveryLocation = "global",
+    data_store_id: DataStoreId = ...,
+    jsonl: Annotated[
+        Path, typer.Option("--jsonl", exists=True, readable=True, help="JSONL file of cases to ingest.")
+    ] = ...,
+    branch_id: Annotated[str, typer.Option("--branch-id", help="Branch to import documents into.")] = "default_branch",
+    dataset: Annotated[
+        Optional[str], typer.Option("--dataset", help="Dataset identifier injected when missing.")
+    ] = None,
+    batch_size: Annotated[int, typer.Option("--batch-size", help="Documents per import batch.")] = 50,
+    reconcile_mode: Annotated[str, typer.Option("--reconcile-mode", help="Reconciliation mode.")] = "INCREMENTAL",
+    dry_run: Annotated[bool, typer.Option("--dry-run", help="Preview first record without API calls.")] = False,
+    verbose: Verbose = False,
 ) -> None:
-    args = SimpleNamespace(
+    from . import logic as ingest
+
+    args = IngestVertexArgs(
         project=project,
         location=location,
         branch_id=branch_id,
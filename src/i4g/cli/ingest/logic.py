@@ -13,12 +13,10 @@ from google.protobuf import json_format
 
 from i4g.cli.admin import helpers as saved_searches
 from i4g.cli.utils import console, iter_jsonl
-from i4g.ingestion.preprocess import prepare_documents
 from i4g.services.ingest_payloads import prepare_ingest_payload
 from i4g.services.vertex_documents import build_vertex_document
 from i4g.settings import get_settings
 from i4g.store.ingest import IngestPipeline
-from i4g.store.vector import VectorStore
 
 
 def ingest_bundles(args: Any) -> None:
@@ -1,25 +1,19 @@
+import importlib
 import os
-from typing import Optional
+from typing import Annotated, Callable, Optional
 import typer
 
 jobs_app = typer.Typer(help="Invoke background jobs (ingest, report, intake, dossier, account).")
 
 
-def _exit_from_return(code: int | None) -> None:
-    """Honor integer return codes from invoked helpers."""
-
-    if isinstance(code, int) and code != 0:
-        raise typer.Exit(code)
-
-
 @jobs_app.command("ingest", help="Run ingestion job.")
 def jobs_ingest(
-    bundle_uri: Optional[str] = typer.Option(
-        None, "--bundle-uri", help="Override bundle URI (sets I4G_INGEST__JSONL_PATH)."
-    ),
-    dataset: Optional[str] = typer.Option(
-        None, "--dataset", help="Override dataset name (sets I4G_INGEST__DATASET_NAME)."
-    ),
+    bundle_uri: Annotated[
+        Optional[str], typer.Option("--bundle-uri", help="Override bundle URI (sets I4G_INGEST__JSONL_PATH).")
+    ] = None,
+    dataset: Annotated[
+        Optional[str], typer.Option("--dataset", help="Override dataset name (sets I4G_INGEST__DATASET_NAME).")
+    ] = None,
 ) -> None:
     if bundle_uri:
         os.environ["I4G_INGEST__JSONL_PATH"] = bundle_uri
@@ -28,42 +22,37 @@ def jobs_ingest(
 
     from i4g.worker.jobs import ingest
 
-    _exit_from_return(ingest.main())
+    raise typer.Exit(ingest.main())
 
 
 @jobs_app.command("report", help="Run report job.")
 def jobs_report(
-    bundle_uri: Optional[str] = typer.Option(None, "--bundle-uri", help="Ignored (compatibility arg)."),
-    dataset: Optional[str] = typer.Option(None, "--dataset", help="Ignored (compatibility arg)."),
+    bundle_uri: Annotated[Optional[str], typer.Option("--bundle-uri", help="Ignored (compatibility arg).")] = None,
+    dataset: Annotated[Optional[str], typer.Option("--dataset", help="Ignored (compatibility arg).")] = None,
 ) -> None:
     from i4g.worker.jobs import report
 
-    _exit_from_return(report.main())
-
-
-@jobs_app.command("intake", help="Run intake job.")
-def jobs_intake() -> None:
-    from i4g.worker.jobs import intake
-
-    _exit_from_return(intake.main())
-
-
-@jobs_app.command("account", help="Run account list job.")
-def jobs_account() -> None:
-    from i4g.worker.jobs import account_list
+    raise typer.Exit(report.main())
 
-    _exit_from_return(account_list.main())
 
+def _job_command(module_name: str) -> Callable[[], None]:
+    """Build a command that runs ``i4g.worker.jobs.<module_name>.main`` and exits with its code."""
 
-@jobs_app.command("ingest-retry", help="Run ingestion retry job.")
-def jobs_ingest_retry() -> None:
-    from i4g.worker.jobs import ingest_retry
+    def command() -> None:
+        module = importlib.import_module(f"i4g.worker.jobs.{module_name}")
+        raise typer.Exit(module.main())
 
-    _exit_from_return(ingest_retry.main())
+    command.__name__ = f"jobs_{module_name}"
+    return command
 
 
-@jobs_app.command("dossier", help="Run dossier queue job.")
-def jobs_dossier() -> None:
-    from i4g.worker.jobs import dossier_queue
+# Argument-free jobs: command name -> (i4g.worker.jobs module, help).
+_SIMPLE_JOBS = {
+    "intake": ("intake", "Run intake job."),
+    "account": ("account_list", "Run account list job."),
+    "ingest-retry": ("ingest_retry", "Run ingestion retry job."),
+    "dossier": ("dossier_queue", "Run dossier queue job."),
+}
 
-    _exit_from_return(dossier_queue.main())
+for _name, (_module_name, _help) in _SIMPLE_JOBS.items():
+    jobs_app.command(_name, help=_help)(_job_command(_module_name))
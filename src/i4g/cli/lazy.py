@@ -0,0 +1,44 @@
+"""Typer group that defers importing subcommand modules until they are dispatched."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any, ClassVar, Mapping
+
+import typer
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+    """Command group whose sub-Typers are imported the first time they are dispatched.
+
+    Subclasses set ``subcommands`` to a ``name -> (module, Typer attribute, short help)`` mapping. Help and
+    completion listings get lightweight placeholders carrying only the short help, while ``resolve_command`` (used
+    for both invocation and nested completion) swaps in the real group.
+    """
+
+    subcommands: ClassVar[Mapping[str, tuple[str, str, str]]] = {}
+
+    def load_subcommand(self, name: str) -> typer.Typer:
+        """Import and return the sub-Typer registered under ``name``."""
+
+        module_path, attribute, _ = self.subcommands[name]
+        return getattr(importlib.import_module(module_path), attribute)
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        names = list(super().list_commands(ctx))
+        return names + [name for name in self.subcommands if name not in names]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.subcommands:
+            return TyperGroup(name=cmd_name, help=self.subcommands[cmd_name][2])
+        return command
+
+    def resolve_command(self, ctx: typer.Context, args: list[str]) -> Any:
+        if args and args[0] in self.subcommands and args[0] not in self.commands:
+            self.add_command(typer.main.get_group(self.load_subcommand(args[0])), args[0])
+        return super().resolve_command(ctx, args)
+
+
+__all__ = ["LazyTyperGroup"]
@@ -0,0 +1,19 @@
+"""Typer option declarations shared by several command groups."""
+
+from __future__ import annotations
+
+from typing import Annotated, Optional
+
+import typer
+
+DiscoveryProject = Annotated[
+    Optional[str], typer.Option("--project", help="GCP project hosting the Discovery data store.")
+]
+DiscoveryLocation = Annotated[str, typer.Option("--location", help="Discovery location.")]
+DataStoreId = Annotated[str, typer.Option("--data-store-id", help="Discovery data store identifier.")]
+ServingConfigId = Annotated[
+    str, typer.Option("--serving-config-id", help="Serving config identifier (default: default_search).")
+]
+Verbose = Annotated[bool, typer.Option("--verbose", help="Enable debug logging.")]
+
+__all__ = ["DataStoreId", "DiscoveryLocation", "DiscoveryProject", "ServingConfigId", "Verbose"]
@@ -2,17 +2,41 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
 from typing import Optional
 
 import typer
 
-from i4g.cli.reports import tasks
-
 reports_app = typer.Typer(help="Report/dossier verification helpers.")
 
 
+@dataclass(frozen=True, slots=True)
+class VerifyHashesArgs:
+    """Inputs for ``tasks.verify_dossier_hashes``."""
+
+    path: Optional[Path]
+    fail_on_warn: bool
+
+
+@dataclass(frozen=True, slots=True)
+class VerifyIngestionRunArgs:
+    """Inputs for ``tasks.verify_ingestion_run``."""
+
+    run_id: Optional[str]
+    dataset: Optional[str]
+    status: str
+    expect_case_count: Optional[int]
+    min_case_count: Optional[int]
+    expect_sql_writes: Optional[int]
+    expect_firestore_writes: Optional[int]
+    expect_vertex_writes: Optional[int]
+    max_retry_count: Optional[int]
+    require_vector_enabled: bool
+    allow_partial: bool
+    verbose: bool
+
+
 @reports_app.command("verify-hashes", help="Verify dossier hashes on disk.")
 def reports_verify_hashes(
     path: Optional[Path] = typer.Option(
@@ -20,7 +44,9 @@ def reports_verify_hashes(
     ),
     fail_on_warn: bool = typer.Option(False, "--fail-on-warn", help="Exit non-zero when warnings are present."),
 ) -> None:
-    args = SimpleNamespace(path=path, fail_on_warn=fail_on_warn)
+    from i4g.cli.reports import tasks
+
+    args = VerifyHashesArgs(path=path, fail_on_warn=fail_on_warn)
     code = tasks.verify_dossier_hashes(args)
     if code:
         raise typer.Exit(code)
@@ -47,7 +73,9 @@ def reports_verify_ingestion(
     allow_partial: bool = typer.Option(False, "--allow-partial", help="Permit partial runs (overrides status)."),
     verbose: bool = typer.Option(False, "--verbose", help="Print the selected row."),
 ) -> None:
-    args = SimpleNamespace(
+    from i4g.cli.reports import tasks
+
+    args = VerifyIngestionRunArgs(
         run_id=run_id,
         dataset=dataset,
         status=status,
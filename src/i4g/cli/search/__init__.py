@@ -2,42 +2,89 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Optional
+from typing import Annotated, Optional
 
 import typer
 
-from i4g.cli.search import logic
-from i4g.settings import get_settings
+from i4g.cli.options import DataStoreId, DiscoveryLocation, DiscoveryProject, ServingConfigId, Verbose
+
+DEFAULT_SCHEMA_SNAPSHOT = Path("docs/examples/reviews_search_schema.json")
 
 search_app = typer.Typer(help="Search/retrieval queries and evaluations.")
 
 
+@dataclass(frozen=True, slots=True)
+class VertexQueryArgs:
+    """Inputs for ``logic.query_vertex``."""
+
+    query: str
+    project: Optional[str]
+    location: str
+    data_store_id: str
+    serving_config_id: str
+    page_size: int
+    filter_expression: Optional[str]
+    boost_json: Optional[str]
+    raw: bool
+    verbose: bool
+
+
+@dataclass(frozen=True, slots=True)
+class VertexEvalArgs:
+    """Inputs for ``logic.evaluate_vertex``."""
+
+    project: Optional[str]
+    location: str
+    data_store_id: str
+    serving_config_id: str
+    config: Optional[Path]
+    verbose: bool
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaSnapshotArgs:
+    """Inputs for ``logic.refresh_hybrid_schema_snapshot``."""
+
+    api_base: str
+    api_key: Optional[str]
+    output: Path
+    indent: int
+    timeout: float
+
+
+def _resolve_project(project: Optional[str]) -> Optional[str]:
+    """Return ``project`` or the configured Vertex project, loading settings only when needed."""
+
+    if project:
+        return project
+    from i4g.settings import get_settings
+
+    return get_settings().vector.vertex_ai_project
+
+
 @search_app.command("query-vertex", help="Query Vertex AI Search data store.")
 def search_query_vertex(
-    query: str = typer.Argument(..., help="Free-text query string to execute."),
-    project: Optional[str] = typer.Option(None, "--project", help="GCP project hosting the Discovery data store."),
-    location: str = typer.Option("global", "--location", help="Discovery location."),
-    data_store_id: str = typer.Option(..., "--data-store-id", help="Discovery data store identifier."),
-    serving_config_id: str = typer.Option(
-        "default_search",
-        "--serving-config-id",
-        help="Serving config identifier (default: default_search).",
-    ),
-    page_size: int = typer.Option(5, "--page-size", help="Maximum number of results to return."),
-    filter_expression: Optional[str] = typer.Option(None, "--filter", help="Discovery filter expression."),
-    boost_json: Optional[str] = typer.Option(None, "--boost-json", help="BoostSpec payload as JSON."),
-    raw: bool = typer.Option(False, "--raw", help="Print raw JSON response instead of a formatted summary."),
-    verbose: bool = typer.Option(False, "--verbose", help="Enable debug logging."),
+    query: Annotated[str, typer.Argument(help="Free-text query string to execute.")],
+    project: DiscoveryProject = None,
+    location: DiscoveryLocation = "global",
+    data_store_id: DataStoreId = ...,
+    serving_config_id: ServingConfigId = "default_search",
+    page_size: Annotated[int, typer.Option("--page-size", help="Maximum number of results to return.")] = 5,
+    filter_expression: Annotated[Optional[str], typer.Option("--filter", help="Discovery filter expression.")] = None,
+    boost_json: Annotated[Optional[str], typer.Option("--boost-json", help="BoostSpec payload as JSON.")] = None,
+    raw: Annotated[bool, typer.Option("--raw", help="Print raw JSON response instead of a formatted summary.")] = False,
+    verbose: Verbose = False,
 ) -> None:
-    settings = get_settings()
+    from i4g.cli.search import logic
+
     if verbose:
         typer.echo("[debug] Running Vertex query...", err=True)
     logic.query_vertex(
-        SimpleNamespace(
+        VertexQueryArgs(
             query=query,
-            project=project or settings.vector.vertex_ai_project,
+            project=_resolve_project(project),
             location=location,
             data_store_id=data_store_id,
             serving_config_id=serving_config_id,
@@ -52,21 +99,20 @@ def search_query_vertex(
 
 @search_app.command("eval-vertex", help="Evaluate Vertex retrieval against scenarios.")
 def search_eval_vertex(
-    project: Optional[str] = typer.Option(None, "--project", help="GCP project hosting the Discovery data store."),
-    location: str = typer.Option("global", "--location", help="Discovery location."),
-    data_store_id: str = typer.Option(..., "--data-store-id", help="Discovery data store identifier."),
-    serving_config_id: str = typer.Option(
-        "default_search",
-        "--serving-config-id",
-        help="Serving config identifier (default: default_search).",
-    ),
-    config: Optional[Path] = typer.Option(None, "--config", exists=True, readable=True, help="JSON scenario file."),
-    verbose: bool = typer.Option(False, "--verbose", help="Enable debug logging."),
+    project: DiscoveryProject = None,
+    location: DiscoveryLocation = "global",
+    data_store_id: DataStoreId = ...,
+    serving_config_id: ServingConfigId = "default_search",
+    config: Annotated[
+        Optional[Path], typer.Option("--config", exists=True, readable=True, help="JSON scenario file.")
+    ] = None,
+    verbose: Verbose = False,
 ) -> None:
-    settings = get_settings()
+    from i4g.cli.search import logic
+
     exit_code = logic.evaluate_vertex(
-        SimpleNamespace(
-            project=project or settings.vector.vertex_ai_project,
+        VertexEvalArgs(
+            project=_resolve_project(project),
             location=location,
             data_store_id=data_store_id,
             serving_config_id=serving_config_id,
@@ -80,26 +126,33 @@ def search_eval_vertex(
 
 @search_app.command("snapshot-schema", help="Refresh hybrid schema snapshot.")
 def search_snapshot_schema(
-    api_base: str = typer.Option("http://127.0.0.1:8000", "--api-base", help="FastAPI base URL."),
-    api_key: Optional[str] = typer.Option(None, "--api-key", help="API key with analyst scope."),
-    output: Path = typer.Option(Path("docs/examples/reviews_search_schema.json"), "--output", help="Destination file."),
-    indent: int = typer.Option(2, "--indent", help="JSON indentation level."),
-    timeout: float = typer.Option(30.0, "--timeout", help="HTTP timeout seconds."),
+    api_base: Annotated[str, typer.Option("--api-base", help="FastAPI base URL.")] = "http://127.0.0.1:8000",
+    api_key: Annotated[Optional[str], typer.Option("--api-key", help="API key with analyst scope.")] = None,
+    output: Annotated[Path, typer.Option("--output", help="Destination file.")] = DEFAULT_SCHEMA_SNAPSHOT,
+    indent: Annotated[int, typer.Option("--indent", help="JSON indentation level.")] = 2,
+    timeout: Annotated[float, typer.Option("--timeout", help="HTTP timeout seconds.")] = 30.0,
 ) -> None:
+    from i4g.cli.search import logic
+
     logic.refresh_hybrid_schema_snapshot(
-        SimpleNamespace(api_base=api_base, api_key=api_key, output=output, indent=indent, timeout=timeout)
+        SchemaSnapshotArgs(api_base=api_base, api_key=api_key, output=output, indent=indent, timeout=timeout)
     )
 
 
 @search_app.command("annotate-saved-searches", help="Annotate saved-search exports with tags/schema version.")
 def search_annotate_saved_searches(
-    input_path: Path = typer.Option(..., "--input", exists=True, readable=True, help="Path to JSON export file."),
-    output_path: Optional[Path] = typer.Option(None, "--output", help="Destination file (defaults to input)."),
-    tag: Optional[str] = typer.Option(None, "--tag", help="Tag to append; defaults to settings value."),
-    schema_version: Optional[str] = typer.Option(
-        None, "--schema-version", help="Schema version to set in params; defaults to settings value."
-    ),
-    dedupe: bool = typer.Option(True, "--dedupe/--no-dedupe", help="Remove duplicate tags (case-insensitive)."),
+    input_path: Annotated[Path, typer.Option("--input", exists=True, readable=True, help="Path to JSON export file.")],
+    output_path: Annotated[
+        Optional[Path], typer.Option("--output", help="Destination file (defaults to input).")
+    ] = None,
+    tag: Annotated[Optional[str], typer.Option("--tag", help="Tag to append; defaults to settings value.")] = None,
+    schema_version: Annotated[
+        Optional[str],
+        typer.Option("--schema-version", help="Schema version to set in params; defaults to settings value."),
+    ] = None,
+    dedupe: Annotated[
+        bool, typer.Option("--dedupe/--no-dedupe", help="Remove duplicate tags (case-insensitive).")
+    ] = True,
 ) -> None:
     """Wrap saved_searches.annotate_file into the CLI."""
 
@@ -1,25 +1,25 @@
 import typer
 from pathlib import Path
-from typing import Optional
-from i4g.settings import get_settings
+from typing import Annotated, Optional
+
+from i4g._paths import PROJECT_ROOT
 
 settings_app = typer.Typer(help="Inspect and export configuration manifests.")
 
-PROJECT_ROOT = Path(__file__).resolve().parents[4]
+DEFAULT_SETTINGS_FILE = PROJECT_ROOT / "config" / "settings.default.toml"
+LOCAL_SETTINGS_FILE = PROJECT_ROOT / "config" / "settings.local.toml"
+DEFAULT_MANIFEST_DIR = PROJECT_ROOT / "docs" / "config"
 
 
 @settings_app.command("export-manifest", help="Export settings manifest (JSON/YAML/Markdown).")
 def settings_export_manifest(
-    proto_docs_dir: Path = typer.Option(
-        PROJECT_ROOT / "docs" / "config",
-        "--proto-docs-dir",
-        help="Directory in the core repo to write manifest artifacts.",
-    ),
-    docs_repo: Optional[Path] = typer.Option(
-        None,
-        "--docs-repo",
-        help="Optional docs repo path to mirror outputs (writes to book/config).",
-    ),
+    proto_docs_dir: Annotated[
+        Path, typer.Option("--proto-docs-dir", help="Directory in the core repo to write manifest artifacts.")
+    ] = DEFAULT_MANIFEST_DIR,
+    docs_repo: Annotated[
+        Optional[Path],
+        typer.Option("--docs-repo", help="Optional docs repo path to mirror outputs (writes to book/config)."),
+    ] = None,
 ) -> None:
     """Generate settings manifests and optional docs copies."""
 
@@ -38,16 +38,19 @@ def settings_export_manifest(
 def settings_info() -> None:
     """Display config sources and current environment profile."""
 
+    from i4g.settings import get_settings
+
     settings = get_settings()
-    default_path = PROJECT_ROOT / "config" / "settings.default.toml"
-    local_path = PROJECT_ROOT / "config" / "settings.local.toml"
-    typer.echo("Configuration precedence:")
-    typer.echo("1) settings.default.toml")
-    typer.echo("2) settings.local.toml (optional)")
-    typer.echo("3) env vars I4G_* with __ for nesting")
-    typer.echo("4) CLI flags")
-    typer.echo("")
-    typer.echo(f"Resolved I4G_ENV: {settings.env}")
-    typer.echo(f"Default file: {default_path} {'(missing)' if not default_path.exists() else ''}")
-    typer.echo(f"Local file:   {local_path} {'(missing)' if not local_path.exists() else ''}")
-    typer.echo("Env var prefix: I4G_ (use double underscores for nested fields, e.g., I4G_VECTOR__BACKEND)")
+    lines = [
+        "Configuration precedence:",
+        "1) settings.default.toml",
+        "2) settings.local.toml (optional)",
+        "3) env vars I4G_* with __ for nesting",
+        "4) CLI flags",
+        "",
+        f"Resolved I4G_ENV: {settings.env}",
+        f"Default file: {DEFAULT_SETTINGS_FILE} {'(missing)' if not DEFAULT_SETTINGS_FILE.exists() else ''}",
+        f"Local file:   {LOCAL_SETTINGS_FILE} {'(missing)' if not LOCAL_SETTINGS_FILE.exists() else ''}",
+        "Env var prefix: I4G_ (use double underscores for nested fields, e.g., I4G_VECTOR__BACKEND)",
+    ]
+    typer.echo("\n".join(lines))
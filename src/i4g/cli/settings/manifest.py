@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import argparse
 import json
 import types
 from dataclasses import dataclass
@@ -14,7 +13,7 @@ import yaml
 from pydantic.fields import FieldInfo, PydanticUndefined
 from pydantic_settings import BaseSettings
 
-from i4g.settings.config import PROJECT_ROOT, Settings
+from i4g.settings.config import Settings
 
 SMOKE_COMMAND = (
     "```bash\n" "conda run -n i4g I4G_PROJECT_ROOT=$PWD I4G_ENV=dev I4G_LLM__PROVIDER=mock i4g jobs account\n" "```"
@@ -1,111 +1,108 @@
 import typer
 import os
-from types import SimpleNamespace
-from typing import Optional, Any
-from . import runner as smoke
-from .runner import cloud_run_smoke
+from dataclasses import dataclass
+from typing import Annotated, Optional
 
 smoke_app = typer.Typer(help="Run smoketests against local or remote services.")
 
 
+@dataclass(frozen=True, slots=True)
+class VertexSearchSmokeArgs:
+    """Inputs for ``runner.vertex_search_smoke``."""
+
+    project: Optional[str] = None
+    location: str = "global"
+    data_store_id: Optional[str] = None
+    jsonl: str = "data/retrieval_poc/cases.jsonl"
+    serving_config_id: str = "default_search"
+    query: str = "wallet address verification"
+    page_size: int = 5
+
+
+@dataclass(frozen=True, slots=True)
+class CloudRunSmokeArgs:
+    """Inputs for ``runner.cloud_run_smoke``."""
+
+    api_url: str
+    token: str
+    project: str
+    region: str
+    job: str
+    container: str
+    iap_token: Optional[str] = None
+    impersonate_service_account: Optional[str] = None
+
+
+# Positional overrides accepted by the vertex-search and cloud-run smokes, in argument order.
+_VERTEX_SEARCH_FIELDS = ("project", "location", "data_store_id", "jsonl", "serving_config_id", "query", "page_size")
+_CLOUD_RUN_FIELDS = ("api_url", "token", "project", "region", "job", "container")
+
+# (field, env var, default) fallbacks for cloud-run smoke fields not given positionally; preserved from the
+# original script.
+_CLOUD_RUN_FALLBACKS = (
+    ("api_url", "I4G_SMOKE_API_URL", "https://fastapi-gateway-y5jge5w2cq-uc.a.run.app"),
+    ("token", "I4G_SMOKE_TOKEN", "dev-analyst-token"),
+    ("project", "I4G_SMOKE_PROJECT", "i4g-dev"),
+    ("region", "I4G_SMOKE_REGION", "us-central1"),
+    ("job", "I4G_SMOKE_JOB", "process-intakes"),
+    ("container", "I4G_SMOKE_CONTAINER", "container-0"),
+)
+
+
 @smoke_app.command("dossiers", help="Verify dossier artifacts and signature manifests via API.")
 def smoke_dossiers(
-    api_url: str = typer.Option("http://localhost:8000", "--api-url", help="FastAPI base URL."),
-    token: Optional[str] = typer.Option(None, "--token", help="API key for authenticated endpoints."),
-    status: str = typer.Option("completed", "--status", help="Queue status filter."),
-    limit: int = typer.Option(10, "--limit", help="Max dossiers to inspect."),
-    plan_id: Optional[str] = typer.Option(None, "--plan-id", help="Specific dossier plan_id to verify."),
+    api_url: Annotated[str, typer.Option("--api-url", help="FastAPI base URL.")] = "http://localhost:8000",
+    token: Annotated[Optional[str], typer.Option("--token", help="API key for authenticated endpoints.")] = None,
+    status: Annotated[str, typer.Option("--status", help="Queue status filter.")] = "completed",
+    limit: Annotated[int, typer.Option("--limit", help="Max dossiers to inspect.")] = 10,
+    plan_id: Annotated[Optional[str], typer.Option("--plan-id", help="Specific dossier plan_id to verify.")] = None,
 ) -> None:
     """Run dossier smoke verification and hash checks."""
 
-    from scripts import smoke_dossiers as smoke_script
+    from . import dossiers as smoke_script
 
-    args = SimpleNamespace(api_url=api_url, token=token, status=status, limit=limit, plan_id=plan_id)
+    args = smoke_script.DossierSmokeArgs(api_url=api_url, token=token, status=status, limit=limit, plan_id=plan_id)
     try:
         result = smoke_script.run_smoke(args)
     except smoke_script.SmokeError as exc:  # type: ignore[attr-defined]
         typer.echo(f"SMOKE FAILED: {exc}", err=True)
         raise typer.Exit(code=1)
-    typer.echo(
-        "SMOKE OK: plan=%s verified, manifest=%s, signature=%s"
-        % (result.plan_id, result.manifest_path or "<none>", result.signature_path or "<none>")
-    )
+    manifest = result.manifest_path or "<none>"
+    signature = result.signature_path or "<none>"
+    typer.echo(f"SMOKE OK: plan={result.plan_id} verified, manifest={manifest}, signature={signature}")
 
 
 @smoke_app.command("vertex-search", help="Run vertex retrieval smoke script.")
-def smoke_vertex_search(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
+def smoke_vertex_search(extra_args: Annotated[Optional[list[str]], typer.Argument()] = None) -> None:
     """Run Vertex smoke: dry-run ingest then query."""
 
-    args = SimpleNamespace(
-        project=None,
-        location="global",
-        data_store_id=None,
-        jsonl="data/retrieval_poc/cases.jsonl",
-        serving_config_id="default_search",
-        query="wallet address verification",
-        page_size=5,
-    )
-    if extra_args:
-        # Preserve backward compat: allow positional overrides similar to old script flags.
-        # Expected order: project location data_store_id jsonl serving_config_id query page_size
-        for idx, value in enumerate(extra_args):
-            if idx == 0:
-                args.project = value
-            elif idx == 1:
-                args.location = value
-            elif idx == 2:
-                args.data_store_id = value
-            elif idx == 3:
-                args.jsonl = value
-            elif idx == 4:
-                args.serving_config_id = value
-            elif idx == 5:
-                args.query = value
-            elif idx == 6:
-                args.page_size = int(value)
+    # Preserve backward compat: allow positional overrides similar to old script flags.
+    overrides: dict[str, object] = dict(zip(_VERTEX_SEARCH_FIELDS, extra_args or ()))
+    if "page_size" in overrides:
+        overrides["page_size"] = int(overrides["page_size"])
+    args = VertexSearchSmokeArgs(**overrides)
 
     if not args.project or not args.data_store_id:
         typer.echo("--project and --data-store-id are required (or pass as positional overrides).", err=True)
         raise typer.Exit(code=1)
 
+    from . import runner as smoke
+
     smoke.vertex_search_smoke(args)
 
 
 @smoke_app.command("cloud-run", help="Run Cloud Run smoke script.")
-def smoke_cloud_run(extra_args: Optional[list[str]] = typer.Argument(None)) -> None:
+def smoke_cloud_run(extra_args: Annotated[Optional[list[str]], typer.Argument()] = None) -> None:
     """Run the dev Cloud Run intake smoke end-to-end."""
 
-    args = SimpleNamespace(
-        api_url=None,
-        token=None,
-        project=None,
-        region=None,
-        job=None,
-        container=None,
-    )
-    if extra_args:
-        for idx, value in enumerate(extra_args):
-            if idx == 0:
-                args.api_url = value
-            elif idx == 1:
-                args.token = value
-            elif idx == 2:
-                args.project = value
-            elif idx == 3:
-                args.region = value
-            elif idx == 4:
-                args.job = value
-            elif idx == 5:
-                args.container = value
-
-    # Defaults preserved from the original script env fallbacks.
-    args.api_url = (
-        args.api_url or os.getenv("I4G_SMOKE_API_URL") or "https://fastapi-gateway-y5jge5w2cq-uc.a.run.app"
-    ).rstrip("/")
-    args.token = args.token or os.getenv("I4G_SMOKE_TOKEN") or "dev-analyst-token"
-    args.project = args.project or os.getenv("I4G_SMOKE_PROJECT") or "i4g-dev"
-    args.region = args.region or os.getenv("I4G_SMOKE_REGION") or "us-central1"
-    args.job = args.job or os.getenv("I4G_SMOKE_JOB") or "process-intakes"
-    args.container = args.container or os.getenv("I4G_SMOKE_CONTAINER") or "container-0"
+    overrides = dict(zip(_CLOUD_RUN_FIELDS, extra_args or ()))
+    env = os.environ
+    resolved = {
+        field: overrides.get(field) or env.get(env_var) or default for field, env_var, default in _CLOUD_RUN_FALLBACKS
+    }
+    resolved["api_url"] = resolved["api_url"].rstrip("/")
+    args = CloudRunSmokeArgs(**resolved)
+
+    from . import runner as smoke
 
     smoke.cloud_run_smoke(args)
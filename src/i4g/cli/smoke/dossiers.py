@@ -6,7 +6,6 @@ from __future__ import annotations
 
 import argparse
 import json
-import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Mapping, Sequence
@@ -17,6 +16,18 @@ DEFAULT_STATUS = "completed"
 DEFAULT_LIMIT = 10
 
 
+@dataclass(frozen=True, slots=True)
+class DossierSmokeArgs:
+    """Inputs for ``run_smoke``; mirrors the argparse flags of ``parse_args``."""
+
+    api_url: str = DEFAULT_API_URL
+    token: str | None = None
+    status: str = DEFAULT_STATUS
+    limit: int = DEFAULT_LIMIT
+    plan_id: str | None = None
+    iap_token: str | None = None
+
+
 class SmokeError(RuntimeError):
     """Raised when a smoke step fails."""
 
@@ -192,7 +203,7 @@ def download_via_api(
         _http_request("GET", full_url, headers=_headers(token, iap_token))
 
 
-def run_smoke(args: argparse.Namespace) -> VerificationResult:
+def run_smoke(args: argparse.Namespace | DossierSmokeArgs) -> VerificationResult:
     iap_token = getattr(args, "iap_token", None)
     dossiers = fetch_dossiers(args.api_url, args.token, args.status, args.limit, iap_token)
     selected = select_plan(dossiers, args.plan_id)
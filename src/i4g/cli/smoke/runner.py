@@ -10,6 +10,7 @@ from typing import Any, Dict, Tuple
 
 from google.cloud import discoveryengine_v1beta as discoveryengine
 
+from i4g.cli.ingest import IngestVertexArgs
 from i4g.cli.ingest.logic import ingest_vertex_search
 from i4g.cli.utils import console
 
@@ -18,22 +19,13 @@ def vertex_search_smoke(args: Any) -> None:
     """Run a dry-run ingest then execute a Vertex search to verify connectivity."""
 
     dry_run_exit = ingest_vertex_search(
-        type(
-            "VertexArgs",
-            (),
-            {
-                "project": args.project,
-                "location": args.location,
-                "branch_id": "default_branch",
-                "data_store_id": args.data_store_id,
-                "jsonl": args.jsonl,
-                "dataset": None,
-                "batch_size": 50,
-                "reconcile_mode": "INCREMENTAL",
-                "dry_run": True,
-                "verbose": False,
-            },
-        )()
+        IngestVertexArgs(
+            project=args.project,
+            location=args.location,
+            data_store_id=args.data_store_id,
+            jsonl=args.jsonl,
+            dry_run=True,
+        )
     )
     if dry_run_exit != 0:
         raise SystemExit("Dry-run ingestion failed; see logs above.")
@@ -172,16 +172,22 @@ class BundleBuilder:
     ) -> List[DossierCandidate]:
         """Apply loss, recency, and cross-border filters."""
 
-        result: List[DossierCandidate] = []
-        for candidate in candidates:
-            if candidate.loss_amount_usd < criteria.min_loss_usd:
-                continue
-            if not candidate.is_recent(recency_days=criteria.recency_days, reference_time=reference_time):
-                continue
-            if criteria.require_cross_border and not candidate.cross_border:
-                continue
-            result.append(candidate)
-        return result
+        return [candidate for candidate in candidates if self.qualifies(candidate, criteria, reference_time)]
+
+    @staticmethod
+    def qualifies(candidate: DossierCandidate, criteria: BundleCriteria, reference_time: datetime) -> bool:
+        """Return True when a single candidate passes the loss, recency, and cross-border filters.
+
+        Exposed so callers can cheaply check whether any candidate could be bundled before building plans.
+        """
+
+        if candidate.loss_amount_usd < criteria.min_loss_usd:
+            return False
+        if not candidate.is_recent(recency_days=criteria.recency_days, reference_time=reference_time):
+            return False
+        if criteria.require_cross_border and not candidate.cross_border:
+            return False
+        return True
 
     def _group_candidates(
         self,
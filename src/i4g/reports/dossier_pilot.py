@@ -175,7 +175,7 @@ def schedule_pilot_plans(
     if criteria is None:
         settings = get_settings()
         criteria = BundleCriteria(
-            min_loss_usd=Decimal(str(settings.report.min_loss_usd)),
+            min_loss_usd=settings.report.min_loss_usd,
             recency_days=settings.report.recency_days,
             max_cases_per_dossier=settings.report.max_cases_per_dossier,
             jurisdiction_mode="single",
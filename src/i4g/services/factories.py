@@ -68,8 +68,8 @@ def build_entity_store() -> EntityStore:
     return EntityStore(session_factory=session_factory)
 
 
-def build_review_store(db_path: str | Path | None = None) -> ReviewStore:
-    """Return a :class:`ReviewStore` honoring the structured backend settings."""
+def build_review_store(db_path: str | Path | None = None) -> ReviewStore | SqlAlchemyReviewStore:
+    """Return a SQLite or SQLAlchemy review store honoring the structured backend settings."""
 
     settings = get_settings()
     backend = settings.storage.structured_backend
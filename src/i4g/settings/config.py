@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import os
 import tomllib
+from decimal import Decimal
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Literal
@@ -737,8 +738,8 @@ class ReportSettings(BaseSettings):
         default=None,
         validation_alias=AliasChoices("REPORT_DRIVE_PARENT_ID", "REPORT__DRIVE_PARENT_ID"),
     )
-    min_loss_usd: float = Field(
-        default=50000.0,
+    min_loss_usd: Decimal = Field(
+        default=Decimal("50000"),
         validation_alias=AliasChoices("REPORT_MIN_LOSS_USD", "REPORT__MIN_LOSS_USD"),
     )
     recency_days: int = Field(
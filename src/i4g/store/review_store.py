@@ -29,6 +29,9 @@ from i4g.store.sql import session_factory as default_session_factory
 
 SETTINGS = get_settings()
 
+# Keep IN (...) lists under SQLite's host-parameter limit (999 on older builds).
+_SQLITE_BATCH_SIZE = 500
+
 
 class ReviewStore:
     """Lightweight SQLite-based review queue and audit logger."""
@@ -510,27 +513,38 @@ class ReviewStore:
             tags=record.get("tags") or [],
         )
 
-    def list_saved_searches(self, owner: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    def list_saved_searches(
+        self,
+        owner: Optional[str] = None,
+        limit: int = 50,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """List saved searches, optionally keeping only rows that share a tag (case-insensitive) with ``tags``."""
+
+        clauses: List[str] = []
+        values: List[Any] = []
+        if owner:
+            clauses.append("(owner = ? OR owner IS NULL)")
+            values.append(owner)
+        tag_filter = sorted({t.strip().lower() for t in (tags or []) if t.strip()})
+        if tag_filter:
+            placeholders = ", ".join("?" for _ in tag_filter)
+            clauses.append(
+                "EXISTS (SELECT 1 FROM json_each(CASE WHEN json_valid(saved_searches.tags) THEN saved_searches.tags "
+                f"ELSE '[]' END) WHERE LOWER(json_each.value) IN ({placeholders}))"
+            )
+            values.extend(tag_filter)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
         with self._connect() as conn:
-            if owner:
-                rows = conn.execute(
-                    """
-                    SELECT * FROM saved_searches
-                    WHERE owner = ? OR owner IS NULL
-                    ORDER BY favorite DESC, created_at DESC
-                    LIMIT ?
-                    """,
-                    (owner, limit),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """
-                    SELECT * FROM saved_searches
-                    ORDER BY favorite DESC, created_at DESC
-                    LIMIT ?
-                    """,
-                    (limit,),
-                ).fetchall()
+            rows = conn.execute(
+                f"""
+                SELECT * FROM saved_searches
+                {where}
+                ORDER BY favorite DESC, created_at DESC
+                LIMIT ?
+                """,
+                (*values, limit),
+            ).fetchall()
 
         results: List[Dict[str, Any]] = []
         for r in rows:
@@ -558,6 +572,19 @@ class ReviewStore:
             cur = conn.execute("DELETE FROM saved_searches WHERE search_id = ?", (search_id,))
             return cur.rowcount > 0
 
+    def bulk_delete_saved_searches(self, search_ids: Iterable[str]) -> int:
+        """Delete every saved search in ``search_ids`` and return the number of rows removed."""
+
+        ids = list(dict.fromkeys(search_ids))
+        deleted = 0
+        with self._connect() as conn:
+            for start in range(0, len(ids), _SQLITE_BATCH_SIZE):
+                batch = ids[start : start + _SQLITE_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                cur = conn.execute(f"DELETE FROM saved_searches WHERE search_id IN ({placeholders})", batch)
+                deleted += cur.rowcount
+        return deleted
+
     def update_saved_search(
         self,
         search_id: str,
@@ -616,6 +643,26 @@ class ReviewStore:
             row = conn.execute("SELECT * FROM saved_searches WHERE search_id = ?", (search_id,)).fetchone()
         if not row:
             return None
+        return self._saved_search_from_row(row)
+
+    def get_saved_searches_by_ids(self, search_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Return saved searches matching ``search_ids`` (input order, missing IDs omitted)."""
+
+        ids = list(dict.fromkeys(search_ids))
+        rows_by_id: Dict[str, sqlite3.Row] = {}
+        with self._connect() as conn:
+            for start in range(0, len(ids), _SQLITE_BATCH_SIZE):
+                batch = ids[start : start + _SQLITE_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = conn.execute(f"SELECT * FROM saved_searches WHERE search_id IN ({placeholders})", batch)
+                for row in rows:
+                    rows_by_id[row["search_id"]] = row
+        return [self._saved_search_from_row(rows_by_id[sid]) for sid in ids if sid in rows_by_id]
+
+    @staticmethod
+    def _saved_search_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Decode JSON columns and coerce flags for a ``saved_searches`` row."""
+
         data = dict(row)
         params = data.get("params")
         try:
@@ -653,6 +700,75 @@ class ReviewStore:
             tags=tags,
         )
 
+    def bulk_import_saved_searches(self, payloads: Iterable[Dict[str, Any]], owner: Optional[str] = None) -> int:
+        """Upsert many imported saved searches in one transaction.
+
+        Raises ``ValueError`` (and rolls the whole batch back) when any payload is invalid or collides with an
+        existing name in the same owner scope, so callers can retry row by row for error reporting.
+        """
+
+        now = datetime.now(timezone.utc).isoformat()
+        rows: List[tuple] = []
+        for payload in payloads:
+            name = payload.get("name")
+            if not name:
+                raise ValueError("invalid_saved_search")
+            params = dict(payload.get("params") or {})
+            params.pop("search_id", None)
+            search_id = payload.get("search_id")
+            if search_id:
+                params["search_id"] = search_id
+            else:
+                search_id = f"saved:{uuid.uuid4()}"
+            rows.append(
+                (
+                    search_id,
+                    name,
+                    owner,
+                    json.dumps(params),
+                    now,
+                    1 if payload.get("favorite") else 0,
+                    json.dumps(payload.get("tags") or []),
+                )
+            )
+        if not rows:
+            return 0
+
+        search_ids = [row[0] for row in rows]
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO saved_searches (search_id, name, owner, params, created_at, favorite, tags)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(search_id) DO UPDATE SET
+                    name = excluded.name,
+                    owner = excluded.owner,
+                    params = excluded.params,
+                    favorite = excluded.favorite,
+                    tags = excluded.tags
+                """,
+                rows,
+            )
+            for start in range(0, len(search_ids), _SQLITE_BATCH_SIZE):
+                batch = search_ids[start : start + _SQLITE_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                dup = conn.execute(
+                    f"""
+                    SELECT other.owner FROM saved_searches AS imported
+                    JOIN saved_searches AS other
+                      ON (other.owner = imported.owner OR (other.owner IS NULL AND imported.owner IS NULL))
+                     AND LOWER(other.name) = LOWER(imported.name)
+                     AND other.search_id != imported.search_id
+                    WHERE imported.search_id IN ({placeholders})
+                    LIMIT 1
+                    """,
+                    batch,
+                ).fetchone()
+                if dup:
+                    # Raising inside the connection context rolls back the whole batch.
+                    raise ValueError(f"duplicate_saved_search:{dup[0] or ''}")
+        return len(rows)
+
     def list_tag_presets(self, owner: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         with self._connect() as conn:
             rows = conn.execute(
@@ -923,7 +1039,12 @@ class SqlAlchemyReviewStore:
             session.commit()
         return sid
 
-    def list_saved_searches(self, owner: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+    def list_saved_searches(
+        self,
+        owner: Optional[str] = None,
+        limit: int = 50,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
         with self._session_factory() as session:
             query = sa.select(sql_schema.saved_searches)
             if owner:
@@ -933,6 +1054,18 @@ class SqlAlchemyReviewStore:
                         sql_schema.saved_searches.c.owner.is_(None),
                     )
                 )
+            tag_filter = sorted({t.strip().lower() for t in (tags or []) if t.strip()})
+            if tag_filter:
+                elements = (
+                    sa.func.jsonb_array_elements_text(sql_schema.saved_searches.c.tags)
+                    .table_valued("value")
+                    .alias("tag_elements")
+                )
+                query = query.where(
+                    sa.exists(
+                        sa.select(1).select_from(elements).where(sa.func.lower(elements.c.value).in_(tag_filter))
+                    )
+                )
             query = query.order_by(
                 sql_schema.saved_searches.c.favorite.desc(),
                 sql_schema.saved_searches.c.created_at.desc(),
@@ -956,6 +1089,17 @@ class SqlAlchemyReviewStore:
             ).first()
             return dict(row._mapping) if row else None
 
+    def get_saved_searches_by_ids(self, search_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        ids = list(dict.fromkeys(search_ids))
+        if not ids:
+            return []
+        with self._session_factory() as session:
+            rows = session.execute(
+                sa.select(sql_schema.saved_searches).where(sql_schema.saved_searches.c.search_id.in_(ids))
+            ).all()
+        by_id = {row._mapping["search_id"]: dict(row._mapping) for row in rows}
+        return [by_id[sid] for sid in ids if sid in by_id]
+
     def delete_search(self, search_id: str) -> bool:
         with self._session_factory() as session:
             result = session.execute(
@@ -964,6 +1108,60 @@ class SqlAlchemyReviewStore:
             session.commit()
             return result.rowcount > 0
 
+    def bulk_import_saved_searches(self, payloads: Iterable[Dict[str, Any]], owner: Optional[str] = None) -> int:
+        now = datetime.now(timezone.utc)
+        # Postgres rejects an ON CONFLICT upsert that touches the same row twice, so keep only the last payload per
+        # search_id; that matches what replaying the rows one by one would leave behind.
+        rows: Dict[str, Dict[str, Any]] = {}
+        total = 0
+        for payload in payloads:
+            name = payload.get("name")
+            if not name:
+                raise ValueError("invalid_saved_search")
+            params = dict(payload.get("params") or {})
+            params.pop("search_id", None)
+            search_id = payload.get("search_id") or str(uuid.uuid4())
+            rows.pop(search_id, None)
+            rows[search_id] = {
+                "search_id": search_id,
+                "name": name,
+                "owner": owner,
+                "params": params,
+                "created_at": now,
+                "favorite": bool(payload.get("favorite")),
+                "tags": payload.get("tags") or [],
+            }
+            total += 1
+        if not rows:
+            return 0
+
+        with self._session_factory() as session:
+            stmt = sa.dialects.postgresql.insert(sql_schema.saved_searches).values(list(rows.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["search_id"],
+                set_={
+                    "name": stmt.excluded.name,
+                    "owner": stmt.excluded.owner,
+                    "params": stmt.excluded.params,
+                    "tags": stmt.excluded.tags,
+                    "favorite": stmt.excluded.favorite,
+                },
+            )
+            session.execute(stmt)
+            session.commit()
+        return total
+
+    def bulk_delete_saved_searches(self, search_ids: Iterable[str]) -> int:
+        ids = list(dict.fromkeys(search_ids))
+        if not ids:
+            return 0
+        with self._session_factory() as session:
+            result = session.execute(
+                sa.delete(sql_schema.saved_searches).where(sql_schema.saved_searches.c.search_id.in_(ids))
+            )
+            session.commit()
+            return result.rowcount
+
     def toggle_favorite(self, search_id: str, favorite: bool) -> bool:
         with self._session_factory() as session:
             result = session.execute(
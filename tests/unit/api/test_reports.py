@@ -41,6 +41,15 @@ def queue_store(tmp_path) -> DossierQueueStore:
     return DossierQueueStore(db_path=tmp_path / "dossier_queue.db")
 
 
+@pytest.fixture(autouse=True)
+def _reset_queue_store_cache():
+    from i4g.api import reports as reports_api
+
+    reports_api._queue_store.cache_clear()
+    yield
+    reports_api._queue_store.cache_clear()
+
+
 def test_list_dossiers_returns_manifest_and_signature(tmp_path, queue_store, monkeypatch) -> None:
     from i4g.api import reports as reports_api
 
@@ -247,3 +256,58 @@ def test_drive_acl_missing_folder_id_returns_404(tmp_path, queue_store, monkeypa
     response = client.get(f"/reports/dossiers/{plan.plan_id}/drive_acl")
 
     assert response.status_code == 404
+
+
+def test_download_markdown_resolves_relative_path(tmp_path, queue_store, monkeypatch) -> None:
+    from i4g.api import reports as reports_api
+
+    plan = _sample_plan(plan_id="plan-md")
+    artifact_dir = tmp_path / "artifacts"
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    (artifact_dir / f"{plan.plan_id}.md").write_text("# dossier")
+    manifest_path = artifact_dir / f"{plan.plan_id}.json"
+    manifest_path.write_text(json.dumps({"plan_id": plan.plan_id, "template_render": {"path": f"{plan.plan_id}.md"}}))
+
+    monkeypatch.setattr(reports_api, "build_dossier_queue_store", lambda: queue_store)
+    monkeypatch.setattr(reports_api, "ARTIFACTS_DIR", artifact_dir)
+
+    client = TestClient(create_app())
+    response = client.get(f"/reports/dossiers/{plan.plan_id}/download/markdown")
+    assert response.status_code == 200
+    assert response.content == b"# dossier"
+
+    missing = client.get(f"/reports/dossiers/{plan.plan_id}/download/signature")
+    assert missing.status_code == 404
+
+
+def test_download_signature_falls_back_to_sibling_when_manifest_is_invalid(tmp_path, queue_store, monkeypatch) -> None:
+    from i4g.api import reports as reports_api
+
+    artifact_dir = tmp_path / "artifacts"
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    (artifact_dir / "plan-bad.json").write_text("{not json")
+    (artifact_dir / "plan-bad.signatures.json").write_text(json.dumps({"algorithm": "sha256", "artifacts": []}))
+
+    monkeypatch.setattr(reports_api, "build_dossier_queue_store", lambda: queue_store)
+    monkeypatch.setattr(reports_api, "ARTIFACTS_DIR", artifact_dir)
+
+    client = TestClient(create_app())
+    response = client.get("/reports/dossiers/plan-bad/download/signature")
+    assert response.status_code == 200
+    assert response.json()["algorithm"] == "sha256"
+
+
+def test_download_signature_rejects_invalid_signature_manifest(tmp_path, queue_store, monkeypatch) -> None:
+    from i4g.api import reports as reports_api
+
+    artifact_dir = tmp_path / "artifacts"
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    (artifact_dir / "plan-sig.json").write_text(json.dumps({"plan_id": "plan-sig"}))
+    (artifact_dir / "plan-sig.signatures.json").write_text("{truncated")
+
+    monkeypatch.setattr(reports_api, "build_dossier_queue_store", lambda: queue_store)
+    monkeypatch.setattr(reports_api, "ARTIFACTS_DIR", artifact_dir)
+
+    client = TestClient(create_app())
+    response = client.get("/reports/dossiers/plan-sig/download/signature")
+    assert response.status_code == 404
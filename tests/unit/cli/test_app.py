@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+from typer.testing import CliRunner
+
+from i4g.cli import app as cli_app
+from i4g.cli.lazy import LazyTyperGroup
+
+
+def test_help_lists_groups_without_importing_them(monkeypatch) -> None:
+    loaded: list[str] = []
+    monkeypatch.setattr(cli_app, "_import_subcommand", lambda name: loaded.append(name))
+
+    result = CliRunner().invoke(cli_app.app, ["--help"])
+
+    assert result.exit_code == 0
+    for name in cli_app._SUBCOMMANDS:
+        assert name in result.output
+    assert loaded == []
+
+
+def test_dispatch_imports_only_the_invoked_group(monkeypatch) -> None:
+    real_import = cli_app._import_subcommand
+    loaded: list[str] = []
+
+    def _record(name: str):
+        loaded.append(name)
+        return real_import(name)
+
+    monkeypatch.setattr(cli_app, "_import_subcommand", _record)
+
+    result = CliRunner().invoke(cli_app.app, ["jobs", "--help"])
+
+    assert result.exit_code == 0
+    assert "ingest-retry" in result.output
+    assert loaded == ["jobs"]
+
+
+def test_nested_lazy_group_lists_subgroups_without_loading(monkeypatch) -> None:
+    loaded: list[str] = []
+    monkeypatch.setattr(LazyTyperGroup, "load_subcommand", lambda self, name: loaded.append(name))
+
+    result = CliRunner().invoke(cli_app.app, ["bootstrap", "--help"])
+
+    assert result.exit_code == 0
+    assert "local" in result.output and "dev" in result.output and "seed-sample" in result.output
+    assert loaded == []
+
+
+def test_entry_answers_version_without_running_typer(monkeypatch, capsys) -> None:
+    from i4g.cli import entry
+
+    def _fail() -> None:
+        raise AssertionError("Typer app should not run for --version")
+
+    monkeypatch.setattr(entry.sys, "argv", ["i4g", "--version"])
+    monkeypatch.setattr(cli_app, "app", _fail)
+
+    entry.main()
+
+    assert capsys.readouterr().out == f"i4g {entry.package_version()}\n"
+
+
+def test_group_help_defers_command_helpers() -> None:
+    for group, helper in (
+        ("ingest", "i4g.cli.ingest.logic"),
+        ("search", "i4g.cli.search.logic"),
+        ("extract", "i4g.cli.extract.tasks"),
+        ("reports", "i4g.cli.reports.tasks"),
+    ):
+        result = CliRunner().invoke(cli_app.app, [group, "--help"])
+
+        assert result.exit_code == 0
+        assert helper not in sys.modules
+
+
+def test_table_driven_job_command_exits_with_job_code(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "i4g.worker.jobs.intake", SimpleNamespace(main=lambda: 3))
+
+    result = CliRunner().invoke(cli_app.app, ["jobs", "intake"])
+
+    assert result.exit_code == 3
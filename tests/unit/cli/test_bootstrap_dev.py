@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from i4g.cli.bootstrap import dev
+
+
+def test_run_streaming_keeps_output_tails(monkeypatch):
+    monkeypatch.setattr(dev, "OUTPUT_TAIL_LINES", 2)
+    script = "import sys\nfor i in range(5):\n    print(i)\nprint('warn', file=sys.stderr)"
+
+    proc = dev._run_streaming([sys.executable, "-c", script])
+
+    assert proc.returncode == 0
+    assert proc.stdout == "3\n4"
+    assert proc.stderr == "warn"
+
+
+def test_run_streaming_raises_with_tails_on_failure():
+    script = "import sys\nprint('partial')\nprint('boom', file=sys.stderr)\nsys.exit(3)"
+    cmd = [sys.executable, "-c", script]
+
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        dev._run_streaming(cmd)
+
+    assert excinfo.value.returncode == 3
+    assert excinfo.value.cmd == cmd
+    assert excinfo.value.stdout == "partial"
+    assert excinfo.value.stderr == "boom"
+
+
+def test_execute_jobs_runs_bundle_chains_in_order_and_stages_in_sequence(monkeypatch):
+    events: list[tuple[str, str]] = []
+    lock = threading.Lock()
+
+    def fake_execute_job(spec, args):
+        with lock:
+            events.append(("start", spec.label))
+        # Make the first job of each chain the slowest so an unchained scheduler would overlap the chain.
+        time.sleep(0.05 if spec.label.startswith("firestore") else 0.01)
+        with lock:
+            events.append(("end", spec.label))
+        return dev.JobResult(spec.label, spec.job_name, "", "success", "", "", None)
+
+    monkeypatch.setattr(dev, "execute_job", fake_execute_job)
+    specs = [
+        dev.JobSpec(label=f"{kind}-{bundle}", job_name=kind, args=[], chain=bundle)
+        for bundle in ("a", "b")
+        for kind in ("firestore", "vertex", "sql")
+    ]
+    specs += [
+        dev.JobSpec(label="reports", job_name="reports", args=[], stage=1),
+        dev.JobSpec(label="saved_searches", job_name="saved_searches", args=[], stage=1),
+    ]
+
+    results = dev.execute_jobs(specs, SimpleNamespace(dry_run=False, max_parallel_jobs=4))
+
+    assert [result.label for result in results] == [spec.label for spec in specs]
+    position = {event: index for index, event in enumerate(events)}
+    for bundle in ("a", "b"):
+        assert position[("end", f"firestore-{bundle}")] < position[("start", f"vertex-{bundle}")]
+        assert position[("end", f"vertex-{bundle}")] < position[("start", f"sql-{bundle}")]
+    last_stage0_end = max(position[("end", spec.label)] for spec in specs if spec.stage == 0)
+    assert all(position[("start", label)] > last_stage0_end for label in ("reports", "saved_searches"))
+    # Separate bundles overlap: both firestore jobs start before either finishes.
+    assert position[("start", "firestore-b")] < position[("end", "firestore-a")]
+
+
+def _write_bundle(tmp_path, content: bytes = b'{"case_id": "1"}\n'):
+    bundle = tmp_path / "bundle.jsonl"
+    bundle.write_bytes(content)
+    return bundle
+
+
+def test_cached_sha256_reuses_digest_for_unchanged_file(tmp_path, monkeypatch):
+    bundle = _write_bundle(tmp_path)
+    digest = dev._cached_sha256(bundle)
+
+    assert dev._hash_cache_path(bundle).read_text().startswith(dev.HASH_CACHE_MAGIC)
+    assert not (tmp_path / "bundle.jsonl.sha256").exists()
+
+    def fail_hash(path):
+        raise AssertionError("cache hit should not rehash")
+
+    monkeypatch.setattr(dev, "hash_file", fail_hash)
+    assert dev._cached_sha256(bundle) == digest
+
+
+def test_cached_sha256_rehashes_when_mtime_changes(tmp_path):
+    bundle = _write_bundle(tmp_path)
+    first = dev._cached_sha256(bundle)
+
+    bundle.write_bytes(b'{"case_id": "2"}\n')
+    stat = bundle.stat()
+    os.utime(bundle, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    second = dev._cached_sha256(bundle)
+    assert second != first
+    assert second == dev.hash_file(bundle)
+    assert dev._hash_cache_path(bundle).read_text().strip().endswith(second)
+
+
+def test_cached_sha256_survives_unwritable_directory(tmp_path, monkeypatch):
+    bundle = _write_bundle(tmp_path)
+
+    def deny(*args, **kwargs):
+        raise PermissionError("read-only directory")
+
+    monkeypatch.setattr(dev.tempfile, "mkstemp", deny)
+
+    assert dev._cached_sha256(bundle) == dev.hash_file(bundle)
+    assert not dev._hash_cache_path(bundle).exists()
+
+
+def test_cached_sha256_never_overwrites_foreign_file(tmp_path):
+    bundle = _write_bundle(tmp_path)
+    foreign = dev._hash_cache_path(bundle)
+    foreign.write_text("0000 not-ours\n")
+
+    assert dev._cached_sha256(bundle) == dev.hash_file(bundle)
+    assert foreign.read_text() == "0000 not-ours\n"
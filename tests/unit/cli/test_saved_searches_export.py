@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 import json
-from types import SimpleNamespace
+
+import pytest
 
 from i4g.cli.admin import saved_searches
 
 
+@pytest.fixture(autouse=True)
+def _reset_store_cache():
+    saved_searches.clear_store_cache()
+    yield
+    saved_searches.clear_store_cache()
+
+
 class _StubReviewStore:
     def __init__(self, records: list[dict[str, object]]):
         self._records = records
 
-    def list_saved_searches(self, owner=None, limit=100):  # noqa: D401 - signature matches usage
+    def list_saved_searches(self, owner=None, limit=100, tags=None):  # noqa: D401 - signature matches usage
         return self._records
 
 
@@ -27,18 +35,109 @@ def test_export_saved_searches_injects_schema_version(tmp_path, monkeypatch):
     monkeypatch.setattr(saved_searches, "build_review_store", lambda: store)
 
     output_path = tmp_path / "saved.json"
-    args = SimpleNamespace(
-        limit=10,
-        all=False,
-        owner=None,
-        output=str(output_path),
-        split=False,
-        include_tags=None,
-        schema_version="hybrid-v1",
-    )
-
-    saved_searches.export_saved_searches(args)
+    saved_searches.export_saved_searches(limit=10, output=output_path, schema_version="hybrid-v1")
 
     payload = json.loads(output_path.read_text())
     assert payload[0]["params"]["schema_version"] == "hybrid-v1"
     assert payload[0]["tags"] == []
+
+
+def test_export_saved_searches_arrow_round_trip(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    records = [
+        {
+            "search_id": "saved:1",
+            "name": "High Risk",
+            "owner": "analyst",
+            "params": {"query": "romance"},
+            "favorite": True,
+            "tags": ["urgent"],
+        }
+    ]
+    monkeypatch.setattr(saved_searches, "build_review_store", lambda: _StubReviewStore(records))
+
+    output_path = tmp_path / "saved.arrow"
+    saved_searches.export_saved_searches(limit=10, include_all=True, output=output_path, export_format="arrow")
+
+    items = saved_searches._read_arrow(output_path)
+    assert items == [
+        {
+            "search_id": "saved:1",
+            "name": "High Risk",
+            "owner": "analyst",
+            "params": {"query": "romance"},
+            "favorite": True,
+            "tags": ["urgent"],
+        }
+    ]
+
+
+class _ImportingStore:
+    def __init__(self, bulk_error: Exception | None = None):
+        self.bulk_error = bulk_error
+        self.batches: list[list[str]] = []
+        self.rows: list[str] = []
+
+    def bulk_import_saved_searches(self, payloads, owner=None):
+        if self.bulk_error is not None:
+            raise self.bulk_error
+        self.batches.append([payload["name"] for payload in payloads])
+        return len(payloads)
+
+    def import_saved_search(self, payload, owner=None):
+        self.rows.append(payload["name"])
+        return payload.get("search_id") or payload["name"]
+
+
+def test_import_saved_searches_streams_json_array_in_batches(tmp_path, monkeypatch, capsys):
+    store = _ImportingStore()
+    monkeypatch.setattr(saved_searches, "build_review_store", lambda: store)
+    monkeypatch.setattr(saved_searches, "_IMPORT_BATCH_SIZE", 2)
+    input_path = tmp_path / "saved.json"
+    input_path.write_text(json.dumps([{"name": f"Search {i}", "params": {"score": 0.5}} for i in range(3)]))
+
+    saved_searches.import_saved_searches(input_path=input_path)
+
+    assert store.batches == [["Search 0", "Search 1"], ["Search 2"]]
+    assert "Imported 3 saved search(es); 0 skipped." in capsys.readouterr().out
+
+
+def test_import_saved_searches_reports_partial_stream_import(tmp_path, monkeypatch, capsys):
+    store = _ImportingStore()
+    monkeypatch.setattr(saved_searches, "build_review_store", lambda: store)
+    monkeypatch.setattr(saved_searches, "_IMPORT_BATCH_SIZE", 1)
+    input_path = tmp_path / "saved.json"
+    input_path.write_text('[{"name": "Kept", "params": {}}, {"name": "Lost", "params": ')
+
+    with pytest.raises(SystemExit) as excinfo:
+        saved_searches.import_saved_searches(input_path=input_path)
+
+    assert excinfo.value.code == 1
+    assert store.batches == [["Kept"]]
+    out = capsys.readouterr().out
+    assert "Partial import: 1 saved search(es) were committed" in out
+
+
+def test_import_saved_searches_replays_rows_when_bulk_write_fails(tmp_path, monkeypatch, capsys):
+    from sqlalchemy.exc import SQLAlchemyError
+
+    store = _ImportingStore(bulk_error=SQLAlchemyError("batch rejected"))
+    monkeypatch.setattr(saved_searches, "build_review_store", lambda: store)
+    input_path = tmp_path / "saved.json"
+    input_path.write_text(json.dumps([{"name": "One", "params": {}}, {"name": "Two", "params": {}}]))
+
+    saved_searches.import_saved_searches(input_path=input_path)
+
+    assert store.rows == ["One", "Two"]
+    assert "Imported 2 saved search(es); 0 skipped." in capsys.readouterr().out
+
+
+def test_arrow_format_requires_pyarrow(monkeypatch, capsys):
+    monkeypatch.setattr(saved_searches, "pa", None)
+
+    with pytest.raises(SystemExit) as excinfo:
+        saved_searches.export_saved_searches(include_all=True, export_format="arrow")
+
+    assert excinfo.value.code == 1
+    assert "pyarrow is required for --format arrow" in capsys.readouterr().out
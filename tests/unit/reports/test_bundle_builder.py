@@ -49,6 +49,33 @@ def test_generate_plans_filters_by_loss_and_recency() -> None:
     assert plans[0].plan_id.startswith("dossier-us-ca-")
 
 
+def test_qualifies_applies_cross_border_requirement() -> None:
+    now = datetime(2025, 12, 3, tzinfo=timezone.utc)
+    criteria = BundleCriteria(
+        min_loss_usd=Decimal("50000"),
+        recency_days=30,
+        max_cases_per_dossier=5,
+        jurisdiction_mode="multi",
+        require_cross_border=True,
+    )
+    domestic = DossierCandidate(
+        case_id="case-domestic",
+        loss_amount_usd=Decimal("90000"),
+        accepted_at=now - timedelta(days=1),
+        jurisdiction="US-CA",
+    )
+    cross_border = DossierCandidate(
+        case_id="case-cross",
+        loss_amount_usd=Decimal("90000"),
+        accepted_at=now - timedelta(days=1),
+        jurisdiction="US-CA",
+        cross_border=True,
+    )
+
+    assert not BundleBuilder.qualifies(domestic, criteria, now)
+    assert BundleBuilder.qualifies(cross_border, criteria, now)
+
+
 def test_build_and_enqueue_persists_queue(tmp_path) -> None:
     db_path = tmp_path / "queue.db"
     queue_store = DossierQueueStore(db_path=db_path)
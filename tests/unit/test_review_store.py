@@ -9,6 +9,8 @@ action logging behaviors.
 import sqlite3
 from datetime import datetime, timezone
 
+import pytest
+
 from i4g.store.review_store import ReviewStore
 from i4g.store.schema import ScamRecord
 from i4g.store.structured import StructuredStore
@@ -210,3 +212,102 @@ def test_list_dossier_candidates_returns_metrics(tmp_path):
     assert entry["loss_band"] == "100k-250k"
     assert entry["geo_bucket"] == "US"
     assert entry["cross_border"] == 1
+
+
+def test_bulk_delete_saved_searches(tmp_path):
+    """Bulk delete removes only the requested saved searches in one call."""
+    db_path = tmp_path / "bulk_delete.db"
+    store = ReviewStore(str(db_path))
+
+    sid_a = store.upsert_saved_search(name="A", params={"text": "a"}, owner="analyst_1")
+    sid_b = store.upsert_saved_search(name="B", params={"text": "b"}, owner="analyst_1")
+    sid_c = store.upsert_saved_search(name="C", params={"text": "c"}, owner="analyst_1")
+
+    deleted = store.bulk_delete_saved_searches([sid_a, sid_b, sid_a, "saved:missing"])
+    assert deleted == 2
+
+    remaining = {record["search_id"] for record in store.list_saved_searches(limit=10)}
+    assert remaining == {sid_c}
+    assert store.bulk_delete_saved_searches([]) == 0
+
+
+def test_get_saved_searches_by_ids_preserves_order(tmp_path):
+    """Batch lookup returns decoded records in request order and skips unknown IDs."""
+    db_path = tmp_path / "batch_lookup.db"
+    store = ReviewStore(str(db_path))
+
+    sid_a = store.upsert_saved_search(name="A", params={"text": "a"}, owner="analyst_1", tags=["x"])
+    sid_b = store.upsert_saved_search(name="B", params={"text": "b"}, owner=None, favorite=True)
+
+    records = store.get_saved_searches_by_ids([sid_b, "saved:missing", sid_a])
+
+    assert [record["search_id"] for record in records] == [sid_b, sid_a]
+    assert records[0]["favorite"] is True
+    assert records[1]["params"] == {"text": "a"}
+    assert records[1]["tags"] == ["x"]
+
+
+def test_list_saved_searches_filters_tags_in_query(tmp_path):
+    """Tag filters match case-insensitively and are applied before the limit."""
+    db_path = tmp_path / "tag_filter.db"
+    store = ReviewStore(str(db_path))
+
+    sid_urgent = store.upsert_saved_search(name="Urgent", params={}, owner="analyst_1", tags=["Urgent"])
+    store.upsert_saved_search(name="Other", params={}, owner="analyst_1", tags=["misc"])
+    store.upsert_saved_search(name="Untagged", params={}, owner=None)
+
+    records = store.list_saved_searches(owner="analyst_1", limit=1, tags=["urgent", " "])
+
+    assert [record["search_id"] for record in records] == [sid_urgent]
+    assert records[0]["tags"] == ["Urgent"]
+
+
+def test_bulk_import_saved_searches_upserts_and_rolls_back_duplicates(tmp_path):
+    """Bulk import writes every row in one batch and rejects name collisions atomically."""
+    db_path = tmp_path / "bulk_import.db"
+    store = ReviewStore(str(db_path))
+
+    imported = store.bulk_import_saved_searches(
+        [
+            {"name": "Wallets", "params": {"text": "wallet"}, "search_id": "saved:1", "tags": ["crypto"]},
+            {"name": "Romance", "params": {"text": "romance"}, "favorite": True},
+        ],
+        owner="analyst_1",
+    )
+    assert imported == 2
+    record = store.get_saved_search("saved:1")
+    assert record["owner"] == "analyst_1"
+    assert record["tags"] == ["crypto"]
+
+    with pytest.raises(ValueError, match="duplicate_saved_search"):
+        store.bulk_import_saved_searches(
+            [{"name": "Other", "params": {}}, {"name": "wallets", "params": {}}], "analyst_1"
+        )
+    names = {r["name"] for r in store.list_saved_searches(owner="analyst_1", limit=10)}
+    assert names == {"Wallets", "Romance"}
+
+
+def test_sqlalchemy_bulk_import_keeps_last_duplicate_search_id():
+    """Postgres bulk upsert sends one row per search_id, keeping the last payload."""
+    from contextlib import nullcontext
+    from unittest.mock import MagicMock
+
+    from i4g.store.review_store import SqlAlchemyReviewStore
+
+    session = MagicMock()
+    store = SqlAlchemyReviewStore(session_factory=lambda: nullcontext(session))
+
+    imported = store.bulk_import_saved_searches(
+        [
+            {"name": "First", "params": {}, "search_id": "saved:1"},
+            {"name": "Other", "params": {}, "search_id": "saved:2"},
+            {"name": "Renamed", "params": {}, "search_id": "saved:1"},
+        ],
+        owner="analyst_1",
+    )
+
+    assert imported == 3
+    stmt = session.execute.call_args.args[0]
+    names = {row["search_id"]: row["name"] for row in stmt._multi_values[0]}
+    assert names == {"saved:2": "Other", "saved:1": "Renamed"}
+    assert len(stmt._multi_values[0]) == 2